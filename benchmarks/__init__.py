@@ -0,0 +1 @@
+"""Performance benchmarks of the extended-enum package (not part of the distribution)."""
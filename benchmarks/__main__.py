@@ -0,0 +1,213 @@
+"""
+Benchmark suite that compares ExtendedEnum with the standard Enum on hot paths.
+
+Run from the repository root:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --output new.json --compare results.json
+
+Every case is measured for enumerations of each size.
+The results are printed as a table and can be written as JSON to compare releases.
+"""
+import argparse
+import enum
+import json
+import pickle
+import platform
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from benchmarks.common import REPEAT, SIZES, make_extended_enum, make_standard_enum, measure
+from extended_enum import ExtendedEnum, EnumField
+from extended_enum.tools import format_to_markdown
+
+MISS_STMT = 'try:\n    enum_cls(value)\nexcept ValueError:\n    pass'
+NamespaceFactory = Callable[[int], Dict[str, Any]]
+
+
+class Case(NamedTuple):
+    """A benchmark case: equivalent statements for ExtendedEnum and the standard Enum."""
+
+    name: str
+    extended_stmt: str
+    standard_stmt: str
+    extended_namespace: NamespaceFactory
+    standard_namespace: NamespaceFactory
+
+
+def _creation_namespace(size: int) -> Dict[str, Any]:
+    items = [(f'M{index}', f'v{index}') for index in range(size)]
+    return {'ExtendedEnum': ExtendedEnum, 'EnumField': EnumField, 'items': items}
+
+
+def _standard_creation_namespace(size: int) -> Dict[str, Any]:
+    return {'Enum': enum.Enum, 'items': [(f'M{index}', f'v{index}') for index in range(size)]}
+
+
+def _extended_namespace(size: int) -> Dict[str, Any]:
+    enum_cls = make_extended_enum(size)
+    return {
+        'enum_cls': enum_cls,
+        'member': enum_cls(f'v{size - 1}'),
+        'value': f'v{size - 1}',
+        'missing_value': 'missing',
+        'pickle': pickle,
+        'format_to_markdown': format_to_markdown,
+        'validate': enum_cls.validator(),
+    }
+
+
+def _standard_namespace(size: int) -> Dict[str, Any]:
+    enum_cls = make_standard_enum(size)
+    return {
+        'enum_cls': enum_cls,
+        'member': enum_cls(f'v{size - 1}'),
+        'value': f'v{size - 1}',
+        'missing_value': 'missing',
+        'pickle': pickle,
+    }
+
+
+CASES = (
+    Case(
+        name='class_creation',
+        extended_stmt="ExtendedEnum('Bench', [(name, EnumField(value)) for name, value in items])",
+        standard_stmt="Enum('Bench', items)",
+        extended_namespace=_creation_namespace,
+        standard_namespace=_standard_creation_namespace,
+    ),
+    Case(
+        name='lookup_hit',
+        extended_stmt='enum_cls(value)',
+        standard_stmt='enum_cls(value)',
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+    Case(
+        name='validator',
+        extended_stmt='validate(value)',
+        standard_stmt='enum_cls(value)',
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+    Case(
+        name='lookup_miss',
+        extended_stmt=MISS_STMT.replace('value', 'missing_value'),
+        standard_stmt=MISS_STMT.replace('value', 'missing_value'),
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+    Case(
+        name='value',
+        extended_stmt='member.value',
+        standard_stmt='member.value',
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+    Case(
+        name='extended_value',
+        extended_stmt='member.extended_value',
+        standard_stmt='member.value',
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+    Case(
+        name='get_values',
+        extended_stmt='enum_cls.get_values()',
+        standard_stmt='tuple(member.value for member in enum_cls)',
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+    Case(
+        name='get_simple_value_member',
+        extended_stmt='enum_cls.get_simple_value_member()',
+        standard_stmt='{member.value: member for member in enum_cls}',
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+    Case(
+        name='pickle_roundtrip',
+        extended_stmt='pickle.loads(pickle.dumps(member))',
+        standard_stmt='pickle.loads(pickle.dumps(member))',
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+    Case(
+        name='format_to_markdown',
+        extended_stmt='format_to_markdown(enum_cls)',
+        standard_stmt="'\\n'.join(f'* `{member.value}`' for member in enum_cls)",
+        extended_namespace=_extended_namespace,
+        standard_namespace=_standard_namespace,
+    ),
+)
+
+
+def run(cases: Sequence[Case], sizes: Sequence[int], repeat: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Run the benchmark cases.
+
+    Args:
+        cases: Cases to run.
+        sizes: Numbers of members of the measured enumerations.
+        repeat: How many times to repeat each measurement, the best result is taken.
+
+    Returns:
+        Results by case name and size: the time of one operation in nanoseconds for both implementations.
+    """
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for case in cases:
+        results[case.name] = {}
+        for size in sizes:
+            extended_ns = measure(case.extended_stmt, case.extended_namespace(size), repeat=repeat)
+            standard_ns = measure(case.standard_stmt, case.standard_namespace(size), repeat=repeat)
+            results[case.name][str(size)] = {'extended_enum_ns': extended_ns, 'enum_ns': standard_ns}
+            print(
+                f'{case.name:<24} {size:>6} {extended_ns:>14.0f} ns {standard_ns:>14.0f} ns '
+                f'{extended_ns / standard_ns:>7.2f}x',
+                flush=True,
+            )
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print the change of the ExtendedEnum timings relative to the baseline results."""
+    print(f'\n{"case":<24} {"size":>6} {"baseline":>14} {"current":>14} {"change":>8}')
+    for name, by_size in results.items():
+        for size, timings in by_size.items():
+            previous = baseline.get(name, {}).get(size)
+            if previous is None:
+                continue
+            old_ns, new_ns = previous['extended_enum_ns'], timings['extended_enum_ns']
+            print(f'{name:<24} {size:>6} {old_ns:>11.0f} ns {new_ns:>11.0f} ns {(new_ns / old_ns - 1):>+8.1%}')
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='numbers of members')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help='repetitions of each measurement')
+    parser.add_argument('--cases', nargs='+', choices=[case.name for case in CASES], help='cases to run')
+    parser.add_argument('--output', help='write the results to a JSON file')
+    parser.add_argument('--compare', help='compare the results with a JSON file of a previous run')
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if not args.cases or case.name in args.cases]
+    print(f'{"case":<24} {"size":>6} {"extended_enum":>17} {"enum":>17} {"ratio":>8}')
+    results = run(cases, args.sizes, args.repeat)
+
+    if args.output:
+        report = {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'results': results,
+        }
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(results, json.load(baseline)['results'])
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
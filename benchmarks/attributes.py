@@ -0,0 +1,55 @@
+"""
+Micro-benchmark of reading the value and the extended value of an enumeration member.
+
+Compares the attributes stored in ExtendedEnum members with the previous `DynamicClassAttribute` properties
+and with `value` of the standard Enum.
+
+Run from the repository root:
+
+    python -m benchmarks.attributes
+"""
+from types import DynamicClassAttribute
+from typing import Any, Dict
+
+from benchmarks.common import make_extended_enum, make_standard_enum, measure
+from extended_enum import ExtendedEnum, EnumField, ValueWithDescription
+
+
+class PropertyEnum(ExtendedEnum):
+    """An enumeration with the attributes implemented as `DynamicClassAttribute`, as before."""
+
+    CONST1 = EnumField(ValueWithDescription(value='const1', description='some description'))
+
+    @DynamicClassAttribute
+    def value(self) -> Any:
+        """Get the value of the enumeration member."""
+        return self._value_.value
+
+    @DynamicClassAttribute
+    def extended_value(self) -> Any:
+        """Get the expanded value of an enumeration member."""
+        return self._value_
+
+
+def run() -> Dict[str, float]:
+    """Measure reading the attributes of a member."""
+    extended_member = make_extended_enum(2).M1
+    property_member = PropertyEnum.CONST1
+    standard_member = make_standard_enum(2).M1
+    return {
+        'ExtendedEnum.value': measure('member.value', {'member': extended_member}),
+        'ExtendedEnum.extended_value': measure('member.extended_value', {'member': extended_member}),
+        'DynamicClassAttribute value': measure('member.value', {'member': property_member}),
+        'DynamicClassAttribute extended_value': measure('member.extended_value', {'member': property_member}),
+        'Enum.value': measure('member.value', {'member': standard_member}),
+    }
+
+
+def main() -> None:
+    """Print the cost of reading each attribute."""
+    for name, time_ns in run().items():
+        print(f'{name:<40} {time_ns:>6.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
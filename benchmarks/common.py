@@ -0,0 +1,60 @@
+"""Helpers shared by the benchmarks."""
+import enum
+import timeit
+from typing import Any, Dict, Optional, Type
+
+from extended_enum import ExtendedEnum, EnumField, ValueWithDescription
+
+SIZES = (10, 100, 1000, 10000)
+REPEAT = 5
+
+
+def make_extended_enum(size: int, name: Optional[str] = None) -> Type[ExtendedEnum]:
+    """
+    Create an ExtendedEnum with `size` string members, every other member has a description.
+
+    The class is stored in the globals of this module, so its members can be pickled.
+    """
+    name = name or f'ExtendedEnum{size}'
+    members = [
+        (f'M{index}', EnumField(_make_value(index)))
+        for index in range(size)
+    ]
+    enum_cls = ExtendedEnum(name, members, module=__name__)
+    globals()[name] = enum_cls
+    return enum_cls
+
+
+def _make_value(index: int) -> Any:
+    if index % 2:
+        return ValueWithDescription(value=f'v{index}', description=f'description {index}')
+    return f'v{index}'
+
+
+def make_standard_enum(size: int, name: Optional[str] = None) -> Type[enum.Enum]:
+    """
+    Create a standard Enum with `size` string members.
+
+    The class is stored in the globals of this module, so its members can be pickled.
+    """
+    name = name or f'StandardEnum{size}'
+    enum_cls = enum.Enum(name, [(f'M{index}', f'v{index}') for index in range(size)], module=__name__)
+    globals()[name] = enum_cls
+    return enum_cls
+
+
+def measure(stmt: str, namespace: Dict[str, Any], repeat: int = REPEAT) -> float:
+    """
+    Measure a statement.
+
+    Args:
+        stmt: The statement to measure.
+        namespace: Global names of the statement.
+        repeat: How many times to repeat the measurement, the best result is taken.
+
+    Returns:
+        The time of one execution of the statement in nanoseconds.
+    """
+    timer = timeit.Timer(stmt, globals=namespace)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
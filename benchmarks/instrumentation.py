@@ -0,0 +1,44 @@
+"""
+Cost of lookup instrumentation: `cls(value)` and `cls.get(value)` of a class that is not instrumented,
+instrumented with counters and instrumented with timing.
+
+Run from the repository root:
+
+    python -m benchmarks.instrumentation
+"""
+from typing import Any, Callable, Dict
+
+from benchmarks.common import make_extended_enum, measure
+from extended_enum.instrumentation import instrument, uninstrument
+
+SIZE = 1000
+
+STATEMENTS = {
+    'hit': 'enum_cls(value)',
+    'get hit': 'enum_cls.get(value)',
+    'get miss': 'enum_cls.get(missing_value)',
+    'miss': 'try:\n    enum_cls(missing_value)\nexcept ValueError:\n    pass',
+}
+
+
+def main() -> None:
+    """Print the time of lookups for each mode of instrumentation."""
+    enum_cls = make_extended_enum(SIZE)
+    namespace = {'enum_cls': enum_cls, 'value': f'v{SIZE - 1}', 'missing_value': 'missing'}
+    modes: Dict[str, Callable[[], Any]] = {
+        'disabled': lambda: uninstrument(enum_cls),
+        'counters': lambda: instrument(enum_cls),
+        'timing': lambda: instrument(enum_cls, timing=True),
+    }
+    print(f'{"lookup":<10}' + ''.join(f' {mode:>12}' for mode in modes))
+    for name, stmt in STATEMENTS.items():
+        timings = []
+        for enable in modes.values():
+            enable()
+            timings.append(measure(stmt, namespace))
+        uninstrument(enum_cls)
+        print(f'{name:<10}' + ''.join(f' {timing:>9.0f} ns' for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Import time of a module that defines a large enumeration eagerly, lazily and frozen by `extended_enum.freeze`.
+
+Each measurement runs a new interpreter, the modules are compiled beforehand.
+
+Run from the repository root:
+
+    python -m benchmarks.lazy
+"""
+import importlib
+import os
+import subprocess  # noqa: S404
+import sys
+import tempfile
+from typing import Dict, List
+
+from benchmarks.common import REPEAT
+from extended_enum.freeze import freeze
+
+SIZES = (1000, 20000)
+
+EAGER_TEMPLATE = '''
+from extended_enum import ExtendedEnum, EnumField, ValueWithDescription
+
+
+class Generated(ExtendedEnum):
+{members}
+'''
+
+LAZY_TEMPLATE = '''
+from extended_enum import ValueWithDescription
+from extended_enum.lazy import lazy_enum
+
+Generated = lazy_enum('Generated', {rows!r}, value_cls=ValueWithDescription)
+'''
+
+KINDS = ('eager', 'lazy', 'frozen', 'frozen_lazy')
+
+SCENARIOS = {
+    'import': '',
+    'import + one member': 'module.Generated("v1")',
+    'import + all members': 'list(module.Generated)',
+}
+
+MEASURE_TEMPLATE = '''
+import time
+start = time.perf_counter()
+import {module} as module
+{statement}
+print(time.perf_counter() - start)
+'''
+
+
+def write_modules(directory: str, size: int) -> None:
+    """Write the modules with an eager, a lazy and two frozen enumerations of `size` members."""
+    members = '\n'.join(
+        f"    M{index} = EnumField(ValueWithDescription(value='v{index}', description='description {index}'))"
+        for index in range(size)
+    )
+    rows = tuple((f'M{index}', f'v{index}', f'description {index}') for index in range(size))
+    with open(os.path.join(directory, f'eager_{size}.py'), 'w') as eager_file:
+        eager_file.write(EAGER_TEMPLATE.format(members=members))
+    with open(os.path.join(directory, f'lazy_{size}.py'), 'w') as lazy_file:
+        lazy_file.write(LAZY_TEMPLATE.format(rows=rows))
+
+    sys.path.insert(0, directory)
+    try:
+        enum_cls = importlib.import_module(f'eager_{size}').Generated
+    finally:
+        sys.path.remove(directory)
+    with open(os.path.join(directory, f'frozen_{size}.py'), 'w', encoding='utf-8') as frozen_file:
+        frozen_file.write(freeze(enum_cls))
+    with open(os.path.join(directory, f'frozen_lazy_{size}.py'), 'w', encoding='utf-8') as frozen_lazy_file:
+        frozen_lazy_file.write(freeze(enum_cls, lazy=True))
+
+
+def measure_import(directory: str, module: str, statement: str, repeat: int = REPEAT) -> float:
+    """Measure the import of the module and the statement in a new interpreter, in milliseconds (best of runs)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, os.getcwd()]))
+    code = MEASURE_TEMPLATE.format(module=module, statement=statement)
+    timings: List[float] = []
+    for _ in range(repeat):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, '-c', code], env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        timings.append(float(output) * 1000)
+    return min(timings)
+
+
+def run(directory: str) -> Dict[str, Dict[int, Dict[str, float]]]:
+    """Measure all scenarios for each kind of enumeration."""
+    results: Dict[str, Dict[int, Dict[str, float]]] = {}
+    for size in SIZES:
+        write_modules(directory, size)
+        for kind in KINDS:
+            # Compile the modules, so that the measurements do not include compilation.
+            measure_import(directory, f'{kind}_{size}', '', repeat=1)
+        for scenario, statement in SCENARIOS.items():
+            results.setdefault(scenario, {})[size] = {
+                kind: measure_import(directory, f'{kind}_{size}', statement) for kind in KINDS
+            }
+    return results
+
+
+def main() -> None:
+    """Print the import time of each kind of enumeration."""
+    with tempfile.TemporaryDirectory() as directory:
+        results = run(directory)
+    print(f'{"scenario":<22} {"members":>8}' + ''.join(f' {kind:>12}' for kind in KINDS))
+    for scenario, by_size in results.items():
+        for size, timings in by_size.items():
+            print(f'{scenario:<22} {size:>8}' + ''.join(f' {timings[kind]:>9.1f} ms' for kind in KINDS))
+
+
+if __name__ == '__main__':
+    main()
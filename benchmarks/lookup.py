@@ -0,0 +1,38 @@
+"""
+Micro-benchmark of getting an enumeration member by a simple value.
+
+Run from the repository root:
+
+    python -m benchmarks.lookup
+"""
+from typing import Tuple
+
+from benchmarks.common import SIZES, make_extended_enum, make_standard_enum, measure
+
+
+def run(size: int) -> Tuple[float, float, float, float]:
+    """Measure the lookup of the first and the last member of an enumeration of the given size."""
+    extended_cls = make_extended_enum(size)
+    standard_cls = make_standard_enum(size)
+    first, last = 'v0', f'v{size - 1}'
+    return (
+        measure('enum_cls(value)', {'enum_cls': extended_cls, 'value': first}),
+        measure('enum_cls(value)', {'enum_cls': extended_cls, 'value': last}),
+        measure('enum_cls(value)', {'enum_cls': standard_cls, 'value': first}),
+        measure('enum_cls(value)', {'enum_cls': standard_cls, 'value': last}),
+    )
+
+
+def main() -> None:
+    """Print the lookup cost per call for enumerations of growing size."""
+    print(f'{"members":>8} {"extended first":>15} {"extended last":>14} {"enum first":>11} {"enum last":>10}')
+    for size in SIZES:
+        extended_first, extended_last, standard_first, standard_last = run(size)
+        print(
+            f'{size:>8} {extended_first:>12.0f} ns {extended_last:>11.0f} ns '
+            f'{standard_first:>8.0f} ns {standard_last:>7.0f} ns'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Memory report: bytes per member of enumerations whose values have `__dict__` and `__slots__`.
+
+Run from the repository root:
+
+    python -m benchmarks.memory
+"""
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, Type
+
+from benchmarks.common import SIZES
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription
+
+
+@dataclass(frozen=True)
+class DictValueWithDescription(BaseExtendedEnumValue):
+    """`ValueWithDescription` without `__slots__`, as it was before."""
+
+    description: Optional[str] = field(default=None, compare=False)
+
+
+VALUE_CLASSES = {'__dict__': DictValueWithDescription, '__slots__': ValueWithDescription}
+
+
+def measure(value_cls: Type[BaseExtendedEnumValue], size: int) -> Tuple[float, float]:
+    """
+    Measure the memory taken by values and by an enumeration with `size` members.
+
+    The strings that the values contain are created before the measurement and are not counted.
+
+    Returns:
+        Bytes per value and bytes per member, including its value.
+    """
+    strings = [(f'v{index}', f'description {index}') for index in range(size)]
+    names = [f'M{index}' for index in range(size)]
+    gc.collect()
+    tracemalloc.start()
+    values = [value_cls(value=value, description=description) for value, description in strings]
+    values_size, _ = tracemalloc.get_traced_memory()
+    enum_cls = ExtendedEnum('MemoryEnum', list(zip(names, values)))
+    enum_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del enum_cls, values  # noqa: WPS420
+    return values_size / size, enum_size / size
+
+
+def main() -> None:
+    """Print the memory taken per value and per member for each kind of value."""
+    print(f'{"members":>8} {"kind":>10} {"per value":>12} {"per member":>13}')
+    for size in SIZES:
+        for kind, value_cls in VALUE_CLASSES.items():
+            per_value, per_member = measure(value_cls, size)
+            print(f'{size:>8} {kind:>10} {per_value:>10.0f} B {per_member:>11.0f} B')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Pickle size and round-trip time of members pickled by name compared with pickling by value.
+
+Pickling by value is how the standard Enum pickles members: the whole extended value is written
+and the member is looked up by it on loading. Two payloads are measured:
+a list of 1M members (as a large task of a process pool) and single members pickled separately
+(as many small tasks, where the pickle memo does not help).
+
+Run from the repository root:
+
+    python -m benchmarks.pickling
+"""
+import pickle
+import random
+import time
+from typing import Any, Callable, List, Tuple, Type
+
+from benchmarks.common import REPEAT
+from extended_enum import ExtendedEnum, EnumField, ValueWithDescription
+
+SIZE = 1000
+MEMBERS = 1000000
+SINGLE = 10000
+
+
+class ValueReduceEnum(ExtendedEnum):
+    """The members are pickled by value as by the standard Enum."""
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, ...]:
+        return self.__class__, (self._value_,)
+
+
+def make_enum(base: Type[ExtendedEnum], name: str) -> Any:
+    """Create an enumeration of `SIZE` members with descriptions, it is stored in the globals for pickling."""
+    members = [
+        (f'M{index}', EnumField(ValueWithDescription(value=f'v{index}', description=f'description of member {index}')))
+        for index in range(SIZE)
+    ]
+    enum_cls = base(name, members, module=__name__)  # type: ignore[call-overload]
+    globals()[name] = enum_cls
+    return enum_cls
+
+
+def best_time(func: Callable[[], Any], repeat: int = REPEAT) -> float:
+    """Get the best time of the function calls in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def measure(members: List[Any]) -> Tuple[int, float, int, float]:
+    """Measure the size and round-trip time of the list and of single members pickled separately."""
+    data = pickle.dumps(members, protocol=pickle.HIGHEST_PROTOCOL)
+    list_ms = best_time(lambda: pickle.loads(pickle.dumps(members, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    single = members[:SINGLE]
+    single_size = sum(len(pickle.dumps(member, protocol=pickle.HIGHEST_PROTOCOL)) for member in single)
+    single_ms = best_time(lambda: [
+        pickle.loads(pickle.dumps(member, protocol=pickle.HIGHEST_PROTOCOL)) for member in single
+    ])
+    return len(data), list_ms, single_size, single_ms
+
+
+def main() -> None:
+    """Print the sizes and timings for both ways of pickling."""
+    print(f'{"pickled by":<10} {"list size":>12} {"list round trip":>16} {"single size":>12} {"single round trip":>18}')
+    for label, base in (('name', ExtendedEnum), ('value', ValueReduceEnum)):
+        enum_cls = make_enum(base, f'Pickled{label.title()}')
+        ordinals = random.Random(0).choices(range(SIZE), k=MEMBERS)
+        members = [enum_cls.from_ordinal(ordinal) for ordinal in ordinals]
+        list_size, list_ms, single_size, single_ms = measure(members)
+        print(
+            f'{label:<10} {list_size:>10,} B {list_ms:>13.1f} ms '
+            f'{single_size / SINGLE:>10.1f} B {single_ms / SINGLE * 1000:>15.2f} us',
+        )
+
+
+if __name__ == '__main__':
+    main()
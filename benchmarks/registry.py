@@ -0,0 +1,53 @@
+"""
+Resolving tagged references to members of several enumerations by the registry
+compared with a naive resolver that maps names to classes and calls `cls(value)`.
+
+Run from the repository root:
+
+    python -m benchmarks.registry
+"""
+import random
+from typing import Any, Dict
+
+from benchmarks.common import make_extended_enum, measure
+from extended_enum.registry import registry
+
+ENUMS = 10
+SIZE = 1000
+BATCH = 1000
+
+
+def naive_resolve(classes: Dict[str, Any], reference: str) -> Any:
+    """Split the tagged string, find the class by name and the member by value."""
+    name, _, text = reference.partition(':')
+    return classes[name](text)
+
+
+def main() -> None:
+    """Print the time of resolving a single reference and a mixed batch."""
+    enums = [make_extended_enum(SIZE, f'RegistryBench{index}') for index in range(ENUMS)]
+    rng = random.Random(0)
+    references = [f'{enum_cls.__qualname__}:v{rng.randrange(SIZE)}' for enum_cls in rng.choices(enums, k=BATCH)]
+    namespace = {
+        'registry': registry,
+        'naive_resolve': naive_resolve,
+        'classes': {enum_cls.__qualname__: enum_cls for enum_cls in enums},
+        'reference': references[0],
+        'references': references,
+    }
+    registry.resolve_many(references)
+
+    statements = {
+        'single': ('registry.resolve(reference)', 'naive_resolve(classes, reference)'),
+        f'batch of {BATCH}': (
+            'registry.resolve_many(references)',
+            '[naive_resolve(classes, reference) for reference in references]',
+        ),
+    }
+    print(f'{"resolve":<14} {"registry":>14} {"naive":>14}')
+    for name, (registry_stmt, naive_stmt) in statements.items():
+        print(f'{name:<14} {measure(registry_stmt, namespace):>11.0f} ns {measure(naive_stmt, namespace):>11.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
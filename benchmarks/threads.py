@@ -0,0 +1,96 @@
+"""
+Throughput of `cls(value)` called from several threads at the same time.
+
+Each thread looks up all members of the enumeration in its own order. The `lazy cold` case creates
+a new lazy enumeration for each run, so the threads also race to create the members.
+With the GIL throughput does not grow with the number of threads, on free-threaded builds it should.
+
+Run from the repository root:
+
+    python -m benchmarks.threads
+"""
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import REPEAT, make_extended_enum
+from extended_enum import ValueWithDescription
+from extended_enum.lazy import lazy_enum
+
+THREADS = (1, 2, 4, 8)
+SIZE = 10000
+ROUNDS = 10
+
+
+def make_lazy_enum(size: int) -> Any:
+    """Create a lazy enumeration of `size` members."""
+    return lazy_enum(
+        'LazyThreads',
+        [(f'M{index}', f'v{index}', f'description {index}') for index in range(size)],
+        value_cls=ValueWithDescription,
+    )
+
+
+def measure_threads(enum_factory: Callable[[], Any], threads: int, rounds: int, repeat: int = REPEAT) -> float:
+    """
+    Measure the throughput of lookups from several threads.
+
+    Args:
+        enum_factory: Creates the enumeration before each run.
+        threads: The number of threads.
+        rounds: How many times each thread looks up all members.
+        repeat: How many times to repeat the measurement, the best result is taken.
+
+    Returns:
+        Lookups per second of all threads.
+    """
+    best = 0.0
+    for _ in range(repeat):
+        enum_cls = enum_factory()
+        values = [f'v{index}' for index in range(SIZE)]
+        orders = [random.Random(thread_index).sample(values, len(values)) for thread_index in range(threads)]
+        barrier = threading.Barrier(threads + 1)
+
+        def lookup(order: List[str]) -> None:
+            barrier.wait()
+            for _ in range(rounds):
+                for value in order:
+                    enum_cls(value)
+
+        workers = [threading.Thread(target=lookup, args=(order,)) for order in orders]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        best = max(best, threads * rounds * SIZE / (time.perf_counter() - start))
+    return best
+
+
+def main() -> None:
+    """Print the throughput and its scaling with the number of threads."""
+    eager_cls = make_extended_enum(SIZE)
+    cases: Dict[str, Callable[[int], float]] = {
+        'eager': lambda threads: measure_threads(lambda: eager_cls, threads, ROUNDS),
+        'lazy warm': lambda threads: measure_threads(_make_warm_lazy_enum, threads, ROUNDS),
+        'lazy cold': lambda threads: measure_threads(lambda: make_lazy_enum(SIZE), threads, 1),
+    }
+    print(f'{"case":<10} {"threads":>7} {"lookups/s":>12} {"scaling":>8}')
+    for name, case in cases.items():
+        single = None
+        for threads in THREADS:
+            throughput = case(threads)
+            single = single or throughput
+            print(f'{name:<10} {threads:>7} {throughput:>12,.0f} {throughput / single:>7.2f}x', flush=True)
+
+
+def _make_warm_lazy_enum() -> Any:
+    enum_cls = make_lazy_enum(SIZE)
+    list(enum_cls)
+    return enum_cls
+
+
+if __name__ == '__main__':
+    main()
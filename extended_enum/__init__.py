@@ -1,14 +1,171 @@
 import enum
-from dataclasses import dataclass, field
-from types import DynamicClassAttribute
-from typing import Union, Optional, TypeVar, Any, cast, Tuple, Dict, ClassVar
+import json
+import os
+import sys
+import threading
+from array import array
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from itertools import chain, count
+from json.encoder import encode_basestring_ascii
+from types import DynamicClassAttribute, MappingProxyType
+from typing import (  # noqa: WPS235
+    Union, Optional, TypeVar, Any, cast, Tuple, Dict, ClassVar, Mapping, Iterable, List, Literal, Callable, Type,
+    FrozenSet, Set,
+)
 from uuid import UUID
 
+from extended_enum.registry import registry as _registry
+
 SimpleValueType = Union[UUID, int, str]
 ExtendedEnumValueType = TypeVar('ExtendedEnumValueType', bound='BaseExtendedEnumValue')
 ExtendedEnumType = TypeVar('ExtendedEnumType', bound='ExtendedEnum')
 
+ErrorsPolicyType = Literal['raise', 'collect', 'default']
+_RecordsSourceType = Union[str, 'os.PathLike[str]', Iterable[Mapping[str, Any]]]
+# Members by the values of a field of their extended values, see `index_by`.
+_FieldIndexType = Dict[Any, 'ExtendedEnum']
+# Validators by the arguments of `ExtendedEnum.validator`.
+_ValidatorType = Callable[[Any], Any]
+_ValidatorsType = Dict[Tuple[bool, bool, bool], _ValidatorType]
+# Gets the member name and the extended value from the position and the record.
+_RecordConverterType = Callable[[int, Mapping[str, Any]], Any]
+
+_MISSING = object()
+# Guards the computation of the caches of enumeration classes, see `ExtendedEnum._set_cache`.
+_CACHE_LOCK = threading.RLock()
+# Positions in a table of up to this size are stored in arrays of 2-byte items.
+_MAX_SHORT_TABLE_SIZE = 0x10000
+
+
+class InvalidValuesError(ValueError):
+    """
+    Some of the values decoded in bulk do not belong to the enumeration.
+
+    Attributes:
+        positions: Positions of invalid values in the decoded iterable.
+        members: Decoded members, invalid values are replaced by the default value.
+    """
+
+    def __init__(self, message: str, positions: List[int], members: List[Any]) -> None:
+        """
+        Initialize an exception object.
+
+        Args:
+            message: Error message.
+            positions: Positions of invalid values in the decoded iterable.
+            members: Decoded members, invalid values are replaced by the default value.
+        """
+        super().__init__(message)
+        self.positions = positions
+        self.members = members
+
+
+def with_slots(cls: Type[ExtendedEnumValueType]) -> Type[ExtendedEnumValueType]:
+    """
+    Recreate a dataclass with `__slots__` for its fields, so its instances do not have `__dict__`.
+
+    This is `dataclass(slots=True)` for all supported versions of Python (it is not available before 3.10).
+    Instances take less memory, which matters for enumerations with many members.
+    All base classes must have `__slots__` too, otherwise instances still get `__dict__`.
+    Instances can be weakly referenced (`__weakref__` is added to the slots, unless a base class has it),
+    and methods that call `super()` without arguments work, as with `dataclass(slots=True)` on Python 3.14.
+
+    Examples:
+        ```python
+        from dataclasses import dataclass, field
+        from extended_enum import ValueWithDescription, with_slots
+
+        @with_slots
+        @dataclass(frozen=True)
+        class Currency(ValueWithDescription):
+            minor_units: int = field(default=2, compare=False)
+        ```
+
+    Args:
+        cls: A dataclass.
+
+    Returns:
+        A new class with the same fields and methods, but with `__slots__`.
+
+    Raises:
+        TypeError: The class is not a dataclass or already defines `__slots__`.
+    """
+    if '__dataclass_fields__' not in cls.__dict__:
+        raise TypeError(f'{cls.__qualname__} is not a dataclass')
+    if '__slots__' in cls.__dict__:
+        raise TypeError(f'{cls.__qualname__} already defines __slots__')
+
+    field_names = [dataclass_field.name for dataclass_field in fields(cls)]
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = _get_new_slots(cls, field_names)
+    for name in chain(field_names, ('__dict__', '__weakref__')):
+        # Default values are kept by the dataclass fields and the generated `__init__`.
+        namespace.pop(name, None)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    _rebind_class_cells(cls, slotted_cls)
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        # The methods generated by `dataclass` refer to the original class.
+        _set_frozen_methods(slotted_cls, frozenset(field_names))
+    return cast(Type[ExtendedEnumValueType], slotted_cls)
+
+
+def _get_new_slots(cls: type, field_names: List[str]) -> Tuple[str, ...]:
+    inherited_slots: Set[str] = set()
+    weakref_support = False
+    for base in cls.__mro__[1:]:
+        slots = base.__dict__.get('__slots__', ())
+        inherited_slots.update((slots,) if isinstance(slots, str) else slots)
+        weakref_support = weakref_support or '__weakref__' in base.__dict__
+    new_slots = tuple(name for name in field_names if name not in inherited_slots)
+    # Instances of the root class can be weakly referenced, as instances of dataclasses without slots.
+    return new_slots if weakref_support else (*new_slots, '__weakref__')
+
 
+def _rebind_class_cells(cls: type, slotted_cls: type) -> None:
+    """Point the `__class__` cells of the methods, which `super()` without arguments uses, to the new class."""
+    for attribute in slotted_cls.__dict__.values():
+        for function in _get_functions(attribute):
+            cell = _get_class_cell(function)
+            if cell is not None and cell.cell_contents is cls:
+                cell.cell_contents = slotted_cls
+
+
+def _get_class_cell(function: Any) -> Any:
+    code = getattr(function, '__code__', None)
+    if code is None or '__class__' not in code.co_freevars:
+        return None
+    return function.__closure__[code.co_freevars.index('__class__')]
+
+
+def _get_functions(attribute: Any) -> Tuple[Any, ...]:
+    if isinstance(attribute, (classmethod, staticmethod)):
+        return (attribute.__func__,)
+    if isinstance(attribute, property):
+        return (attribute.fget, attribute.fset, attribute.fdel)
+    return (attribute,)
+
+
+def _set_frozen_methods(cls: type, field_names: FrozenSet[str]) -> None:  # noqa: WPS231
+    """Set `__setattr__` and `__delattr__` that forbid changing fields, as `dataclass(frozen=True)` does."""
+
+    def __setattr__(self: Any, name: str, attribute_value: Any) -> None:  # noqa: N807, WPS430
+        if self.__class__ is cls or name in field_names:
+            raise FrozenInstanceError(f'cannot assign to field {name!r}')
+        super(cls, self).__setattr__(name, attribute_value)  # noqa: WPS608
+
+    def __delattr__(self: Any, name: str) -> None:  # noqa: N807, WPS430
+        if self.__class__ is cls or name in field_names:
+            raise FrozenInstanceError(f'cannot delete field {name!r}')
+        super(cls, self).__delattr__(name)  # noqa: WPS608
+
+    for method in (__setattr__, __delattr__):
+        method.__qualname__ = f'{cls.__qualname__}.{method.__name__}'
+        setattr(cls, method.__name__, method)
+
+
+@with_slots
 @dataclass(frozen=True)
 class BaseExtendedEnumValue:
     """
@@ -27,11 +184,33 @@ class BaseExtendedEnumValue:
             display_name: str = field(compare=False)
             description: Optional[str] = field(default=None, compare=False)
         ```
+
+        2. Add `with_slots` to store the values without `__dict__`, as the values of this package do.
+
+        ```python
+        @with_slots
+        @dataclass(frozen=True)
+        class SomeExtendedEnumValue(BaseExtendedEnumValue):
+            display_name: str = field(compare=False)
+        ```
     """
 
     value: SimpleValueType
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state of the value for pickling, it contains the fields and `__dict__` if there is one."""
+        state = dict(getattr(self, '__dict__', {}))
+        for value_field in fields(self):
+            state[value_field.name] = getattr(self, value_field.name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the value from the pickled state, bypassing the frozen `__setattr__`."""
+        for name, attribute_value in state.items():
+            object.__setattr__(self, name, attribute_value)  # noqa: WPS609
+
 
+@with_slots
 @dataclass(frozen=True)
 class ValueWithDescription(BaseExtendedEnumValue):
     """An expanded form of an enumeration value that contains a description of the value."""
@@ -39,6 +218,39 @@ class ValueWithDescription(BaseExtendedEnumValue):
     description: Optional[str] = field(default=None, compare=False)
 
 
+class _MemberAttribute:
+    """
+    An attribute of enumeration members whose value is stored in the member when the member is created.
+
+    Unlike `DynamicClassAttribute` this is a non-data descriptor,
+    so reading the attribute of a member is a lookup in the member's `__dict__` without a function call.
+    Access through the class raises AttributeError in the same way as `DynamicClassAttribute`,
+    so a member with the same name is not shadowed.
+    """
+
+    def __init__(self, fget: Callable[[Any], Any]) -> None:
+        """
+        Initialize the attribute.
+
+        Args:
+            fget: Computes the value of the attribute for a member that does not store it.
+        """
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+        self.name = fget.__name__
+
+    def __get__(self, instance: Any, ownerclass: Any = None) -> Any:
+        """Get the value of the attribute of the member."""
+        if instance is None:
+            raise AttributeError(self.name)
+        return self.fget(instance)
+
+    def store(self, instance: Any, attribute_value: Any) -> None:
+        """Store the value of the attribute in the member."""
+        # Bypass `__setattr__`: a redirect of the standard Enum may be a data descriptor with the same name.
+        instance.__dict__[self.name] = attribute_value
+
+
 class ExtendedEnum(enum.Enum):
     """
     A class that extends the capabilities of the standard Enum.
@@ -114,8 +326,22 @@ class ExtendedEnum(enum.Enum):
     value: SimpleValueType
     _value_: ExtendedEnumValueType  # noqa: WPS120
 
-    _ignore_ = ['_simple_value2member']  # noqa: WPS120
-    _simple_value2member: ClassVar[Dict[SimpleValueType, 'ExtendedEnumType']] = {}
+    _simple_value2member: ClassVar[Dict[SimpleValueType, 'ExtendedEnumType']]
+    _simple_value2member_proxy: ClassVar[Mapping[SimpleValueType, 'ExtendedEnumType']]
+    _ordinal2member: ClassVar[List['ExtendedEnumType']]
+    _ordinal: int
+    _json_value: Union[int, str]
+    _json_fragment: str
+    _json_fragment_bytes: bytes
+    _values: ClassVar[Tuple[SimpleValueType, ...]]
+    _extended_values: ClassVar[Tuple[ExtendedEnumValueType, ...]]
+    _lazy_definitions: ClassVar[Any]
+    _markdown: ClassVar[str]
+    _field_indexes: ClassVar[Dict[str, _FieldIndexType]]
+    _normalized2member: ClassVar[Dict[Any, 'ExtendedEnumType']]
+    _lookup_instrumentation: ClassVar[Any]
+    _validators: ClassVar[_ValidatorsType]
+    _text2member: ClassVar[Dict[str, 'ExtendedEnumType']]
 
     def __init__(self, value: ExtendedEnumValueType) -> None:
         """
@@ -127,16 +353,59 @@ class ExtendedEnum(enum.Enum):
         """
         self._check_type(value)
         super().__init__()
+        _value_attribute.store(self, value.value)
+        _extended_value_attribute.store(self, value)
+        self._index_member(value)
+        simple_value = value.value
+        self._json_value = str(simple_value) if isinstance(simple_value, UUID) else simple_value
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Point redirects of members that shadow member attributes to the attributes of ExtendedEnum.
+
+        Since Python 3.11 a member named like an attribute (e.g. `value`) is stored in the class as a redirect,
+        which takes the getter of the attribute of the standard Enum and not of ExtendedEnum.
+        The class is also added to the registry of enumerations, see `extended_enum.registry`.
+        """
+        super().__init_subclass__(**kwargs)
+        _registry.add(cls)
+        for attribute in (_value_attribute, _extended_value_attribute):
+            redirect = cls.__dict__.get(attribute.name)
+            standard_attribute = enum.Enum.__dict__.get(attribute.name)
+            if isinstance(redirect, DynamicClassAttribute) and redirect.fget is getattr(standard_attribute, 'fget', 0):
+                redirect.fget = attribute.fget
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, ...]:  # noqa: WPS603
+        """
+        Pickle the member as a reference to the class attribute with its name.
+
+        The standard Enum pickles the value, which is the whole extended value here,
+        and looks it up again on loading. The name is short and is resolved by `getattr`,
+        which also creates a member of a lazy enumeration. Aliases are pickled as their original members.
+        """
+        return getattr, (self.__class__, self._name_)
 
     @classmethod
     def get_values(cls) -> Tuple[SimpleValueType, ...]:
         """Get a list of values of an enumeration."""
-        return tuple(item.value for item in cls.get_members().values())
+        values = cls.__dict__.get('_values')
+        if values is None:
+            values = cls._set_cache(
+                '_values',
+                lambda: tuple(item.value for item in cls.get_members().values()),
+            )
+        return values
 
     @classmethod
     def get_extended_values(cls) -> Tuple[ExtendedEnumValueType, ...]:
         """Get a list of values (in expanded form) of an enumeration."""
-        return tuple(item.extended_value for item in cls.get_members().values())
+        extended_values = cls.__dict__.get('_extended_values')
+        if extended_values is None:
+            extended_values = cls._set_cache(
+                '_extended_values',
+                lambda: tuple(item.extended_value for item in cls.get_members().values()),
+            )
+        return extended_values
 
     @classmethod
     def get_members(cls) -> Dict[str, ExtendedEnumType]:
@@ -144,23 +413,442 @@ class ExtendedEnum(enum.Enum):
         return cast(dict, cls.__members__)
 
     @classmethod
-    def get_simple_value_member(cls) -> Dict[SimpleValueType, ExtendedEnumType]:
-        """Get a mapping of enumeration members to simple values."""
-        if not hasattr(cls, '_simple_value2member'):  # noqa: WPS421
-            simple_value2member = {member.value: member for member in cls.get_members().values()}
-            cls._simple_value2member = simple_value2member
-        return cls._simple_value2member
+    def get_simple_value_member(cls) -> Mapping[SimpleValueType, ExtendedEnumType]:
+        """Get a read-only mapping of enumeration members to simple values."""
+        return cls._simple_value2member_proxy
 
-    @DynamicClassAttribute
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> ExtendedEnumType:
+        """
+        Get a member by its ordinal.
+
+        Args:
+            ordinal: The position of the member in the definition order, aliases are not counted.
+
+        Returns:
+            A member of the enumeration.
+
+        Raises:
+            ValueError: There is no member with such an ordinal.
+        """
+        if ordinal >= 0:
+            try:
+                return cls._ordinal2member[ordinal]
+            except IndexError:
+                pass  # noqa: WPS420
+        raise ValueError(f'{ordinal!r} is not a valid ordinal of {cls.__qualname__}')
+
+    @classmethod
+    def to_ordinals(cls, members: Iterable[ExtendedEnumType]) -> array:
+        """
+        Convert members to a compact array of their ordinals.
+
+        The array stores 2 bytes per member (4 bytes if the enumeration has more than 65536 members),
+        `array.tobytes()` gives its binary form in the native byte order.
+
+        Args:
+            members: Members of the enumeration.
+
+        Returns:
+            An array of ordinals in the order of members.
+
+        Raises:
+            ValueError: Some object is not a member of the enumeration.
+        """
+        if not isinstance(members, (list, tuple)):
+            members = list(members)
+        if set(map(type, members)) - {cls}:
+            invalid_member = next(member for member in members if member.__class__ is not cls)
+            raise ValueError(f'{invalid_member!r} is not a member of {cls.__qualname__}')
+        # The attribute is read directly, the `ordinal` property costs a function call per member.
+        return array(cls._get_ordinal_typecode(), [member._ordinal for member in members])  # noqa: WPS437
+
+    @classmethod
+    def from_ordinals(cls, ordinals: Union[array, bytes, Iterable[int]]) -> List[ExtendedEnumType]:
+        """
+        Convert ordinals to members.
+
+        Args:
+            ordinals: An array or bytes created by `to_ordinals`, or any iterable of ordinals.
+
+        Returns:
+            A list of members in the order of ordinals.
+
+        Raises:
+            ValueError: Some ordinal does not belong to the enumeration.
+        """  # noqa: DAR402
+        return cls._take_members(cls._ordinal2member, ordinals, 'ordinal')
+
+    @classmethod
+    def to_categorical(
+        cls,
+        members: Iterable[ExtendedEnumType],
+    ) -> Tuple[Tuple[SimpleValueType, ...], array]:
+        """
+        Convert members to a dictionary-encoded column for columnar tools.
+
+        Args:
+            members: Members of the enumeration.
+
+        Returns:
+            A pair of categories and codes.
+            The categories are the values of the members in the definition order (aliases are not included),
+            the codes are the ordinals of the members, i.e. positions in the categories.
+
+        Raises:
+            ValueError: Some object is not a member of the enumeration.
+        """  # noqa: DAR402
+        return cls._get_categories(), cls.to_ordinals(members)
+
+    @classmethod
+    def from_categorical(
+        cls,
+        codes: Union[array, bytes, Iterable[int]],
+        categories: Iterable[Any],
+    ) -> List[ExtendedEnumType]:
+        """
+        Convert a dictionary-encoded column to members.
+
+        The categories are resolved to members once per call, the codes are then mapped by position.
+
+        Args:
+            codes: Positions in the categories, an array, bytes or any iterable of integers.
+            categories: Simple or extended values of the enumeration.
+
+        Returns:
+            A list of members in the order of codes.
+
+        Raises:
+            ValueError: Some category does not belong to the enumeration, or some code is not a valid position.
+        """  # noqa: DAR402
+        categories = tuple(categories)
+        if categories == cls._get_categories():
+            table = cls._ordinal2member
+        else:
+            table = [cls(category) for category in categories]
+        return cls._take_members(table, codes, 'code')
+
+    @classmethod
+    def get(cls, value: Any, default: Any = None) -> Any:
+        """
+        Get a member by value in the same way as `cls(value)`, but return `default` instead of raising.
+
+        Args:
+            value: Simple or extended value, or a member of the enumeration.
+            default: The value that is returned if the value does not belong to the enumeration.
+
+        Returns:
+            A member of the enumeration or `default`.
+        """
+        if isinstance(value, cls):
+            return value
+        try:
+            member = cls._value2member_map_.get(value, _MISSING)
+        except TypeError:
+            return cls._find_member(value, default)
+        if member is _MISSING:
+            return cls._resolve_missing(value, default)
+        return member
+
+    @classmethod
+    def get_by(cls, field_name: str, key: Any, default: Any = None) -> Any:
+        """
+        Get a member by the value of a field of its extended value using the index created by `index_by`.
+
+        Args:
+            field_name: An indexed field of the extended values.
+            key: The value of the field.
+            default: The value that is returned if no member has the value of the field.
+
+        Returns:
+            A member of the enumeration or `default`.
+
+        Raises:
+            ValueError: The field is not indexed.
+        """
+        field_index = cls.__dict__.get('_field_indexes', {}).get(field_name)
+        if field_index is None:
+            raise ValueError(f'{field_name!r} is not an indexed field of {cls.__qualname__}, use index_by')
+        try:
+            return field_index.get(key, default)
+        except TypeError:
+            # Unhashable values cannot be values of indexed fields.
+            return default
+
+    @classmethod
+    def validator(
+        cls,
+        strict: bool = True,
+        allow_extended: bool = False,
+        coerce_str_uuid: bool = False,
+    ) -> Callable[[Any], ExtendedEnumType]:
+        """
+        Get a function that validates a value and returns the member, for request-parsing frameworks.
+
+        The function looks the value up in a dictionary built for the configuration,
+        so a valid value costs a single lookup. Members of the enumeration are always valid.
+        Functions are cached for each class and configuration.
+
+        Examples:
+            ```python
+            validate_currency = Currency.validator(coerce_str_uuid=True)
+            assert validate_currency(978) is Currency.EUR
+            ```
+
+        Args:
+            strict: Accept only the simple values. Otherwise also accept strings in any case and textual,
+                    integer and bytes forms of UUID values, as `index_normalized` does.
+            allow_extended: Also accept extended values, as `cls(value)` does.
+            coerce_str_uuid: Also accept the canonical strings of UUID values.
+
+        Returns:
+            A function that returns the member or raises ValueError.
+
+        Raises:
+            ValueError: Several members have the same normalized form of values (only if `strict` is false).
+        """  # noqa: DAR402
+        validators = cls.__dict__.get('_validators')
+        if validators is None:
+            validators = cls._set_cache('_validators', dict)
+        configuration = (strict, allow_extended, coerce_str_uuid)
+        validate = validators.get(configuration)
+        if validate is None:
+            # If several threads build the same function, all of them get the one that is stored first.
+            validate = validators.setdefault(configuration, cls._make_validator(*configuration))
+        return validate  # type: ignore[no-any-return]
+
+    @classmethod
+    def parse_many(
+        cls,
+        values: Iterable[Any],
+        errors: ErrorsPolicyType = 'raise',
+        default: Any = None,
+    ) -> List[ExtendedEnumType]:
+        """
+        Get the members of the enumeration for an iterable of simple or extended values in one pass.
+
+        Args:
+            values: Simple or extended values, as accepted by `cls(value)`.
+            errors: What to do with a value that does not belong to the enumeration.
+                    `raise` - raise ValueError on the first invalid value.
+                    `collect` - decode all values, then raise InvalidValuesError with the positions of invalid values.
+                    `default` - replace invalid values with `default`.
+            default: The value that replaces invalid values.
+
+        Returns:
+            A list of members in the order of values.
+
+        Raises:
+            ValueError: Unknown error policy or an invalid value when `errors='raise'`.
+            InvalidValuesError: Invalid values were found when `errors='collect'`.
+        """
+        if errors not in {'raise', 'collect', 'default'}:
+            raise ValueError(f'{errors!r} is not a valid error policy')
+
+        positions: List[int] = []
+        members = cls._parse_values(values, errors == 'raise', default, positions)
+        if positions and errors == 'collect':
+            raise InvalidValuesError(
+                f'{len(positions)} values are not valid {cls.__qualname__}, positions: {positions}',
+                positions=positions,
+                members=members,
+            )
+        return members
+
+    @classmethod
+    def _parse_values(
+        cls,
+        values: Iterable[Any],
+        raise_invalid: bool,
+        default: Any,
+        positions: List[int],
+    ) -> List[Any]:
+        """Get the members for values, an invalid value raises ValueError or is replaced and its position is added."""
+        value2member = cls._value2member_map_
+        members = []
+        for position, value in enumerate(values):
+            try:
+                member = value2member[value]
+            except (KeyError, TypeError):
+                member = cls._get_or_raise(value, raise_invalid)
+                if member is _MISSING:
+                    positions.append(position)
+                    member = default
+            members.append(member)
+        return members
+
+    @classmethod
+    def _get_or_raise(cls, value: Any, raise_invalid: bool) -> Any:
+        member = cls.get(value, _MISSING)
+        if member is _MISSING and raise_invalid:
+            raise ValueError(f'{value!r} is not a valid {cls.__qualname__}') from None
+        return member
+
+    @classmethod
+    def dump_many(cls, members: Iterable[ExtendedEnumType]) -> List[SimpleValueType]:
+        """
+        Get the simple values of an iterable of enumeration members.
+
+        Args:
+            members: Members of the enumeration.
+
+        Returns:
+            A list of simple values in the order of members.
+        """
+        return [member.value for member in members]
+
+    @classmethod
+    def from_records(  # noqa: WPS211
+        cls,
+        name: str,
+        records: _RecordsSourceType,
+        value_cls: Type[BaseExtendedEnumValue] = ValueWithDescription,
+        name_field: str = 'name',
+        value_field: str = 'value',
+        converter: Optional[Callable[[Any], Any]] = None,
+        records_format: Optional[str] = None,
+        module: Optional[str] = None,
+        qualname: Optional[str] = None,
+    ) -> Type[ExtendedEnumType]:
+        """
+        Create an enumeration from records of a JSON, JSON Lines or CSV file, or from an iterable of mappings.
+
+        Records are read one by one (see `extended_enum.records.read_records`) and passed straight to
+        the creation of the class, which fills the index of simple values as the members are created.
+        Fields of the record named as fields of `value_cls` are passed to it, other fields are ignored.
+
+        Examples:
+            ```python
+            # currencies.csv:
+            # name,value,description
+            # EUR,978,Euro
+            # USD,840,US Dollar
+            Currency = ExtendedEnum.from_records('Currency', 'currencies.csv', converter=int)
+            assert Currency(978).extended_value.description == 'Euro'
+            ```
+
+        Args:
+            name: The name of the enumeration class.
+            records: The path to a file, or an iterable of records.
+            value_cls: The class of extended values.
+            name_field: The field of the record with the member name.
+            value_field: The field of the record with the simple value.
+            converter: A function applied to each simple value, e.g. `int` or `UUID` for CSV files.
+            records_format: `json`, `jsonl` or `csv`, by default it is determined by the suffix of the file.
+            module: The module of the enumeration class (for pickling), by default the module of the caller.
+            qualname: The qualified name of the enumeration class (for pickling).
+
+        Returns:
+            An enumeration class.
+
+        Raises:
+            ValueError: The format of the file is unknown or a record does not have the name or the value.
+        """  # noqa: DAR402
+        from extended_enum.records import read_records  # noqa: WPS433
+
+        if module is None:
+            module = sys._getframe(1).f_globals.get('__name__')  # noqa: WPS437
+        if isinstance(records, (str, os.PathLike)):
+            records = read_records(records, records_format)  # type: ignore[arg-type]
+        record_to_member = _make_record_converter(value_cls, name_field, value_field, converter)
+        members = map(record_to_member, count(), records)
+        return cls(name, members, module=module, qualname=qualname)  # type: ignore[call-overload]
+
+    @_MemberAttribute
     def value(self) -> SimpleValueType:
         """Get the value of the enumeration member."""
         return self._value_.value
 
-    @DynamicClassAttribute
+    @_MemberAttribute
     def extended_value(self) -> ExtendedEnumValueType:
         """Get the expanded value of an enumeration member."""
         return self._value_
 
+    @DynamicClassAttribute
+    def ordinal(self) -> int:
+        """Get the position of the enumeration member in the definition order, aliases are not counted."""
+        return self._ordinal
+
+    @DynamicClassAttribute
+    def json_value(self) -> Union[int, str]:
+        """Get the value of the enumeration member as a JSON type (UUID is converted to a string)."""
+        return self._json_value
+
+    @DynamicClassAttribute
+    def json_fragment(self) -> str:
+        """Get the value of the enumeration member serialized to JSON, it is computed on first access."""
+        json_fragment = self.__dict__.get('_json_fragment')
+        if json_fragment is None:
+            json_fragment = _to_json_fragment(self._json_value)
+            self._json_fragment = json_fragment
+        return json_fragment
+
+    @DynamicClassAttribute
+    def json_fragment_bytes(self) -> bytes:
+        """Get the value of the enumeration member serialized to JSON as UTF-8 bytes, it is computed on first access."""
+        json_fragment_bytes = self.__dict__.get('_json_fragment_bytes')
+        if json_fragment_bytes is None:
+            json_fragment_bytes = self.json_fragment.encode()
+            self._json_fragment_bytes = json_fragment_bytes
+        return json_fragment_bytes
+
+    @classmethod
+    def _get_ordinal_typecode(cls) -> str:
+        return _get_typecode(len(cls._ordinal2member))
+
+    @classmethod
+    def _get_categories(cls) -> Tuple[SimpleValueType, ...]:
+        categories = cls.__dict__.get('_categories')
+        if categories is None:
+            categories = cls._set_cache(
+                '_categories',
+                lambda: tuple(member.value for member in cls._ordinal2member),
+            )
+        return categories
+
+    @classmethod
+    def _set_cache(cls, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Compute a cache of the enumeration class once, even if several threads ask for it at the same time.
+
+        Caches are read without the lock: a class attribute is either not set yet or set to the complete value.
+        """
+        with _CACHE_LOCK:
+            cached = cls.__dict__.get(name)
+            if cached is None:
+                cached = factory()
+                setattr(cls, name, cached)
+        return cached
+
+    @classmethod
+    def _take_members(
+        cls,
+        table: List[ExtendedEnumType],
+        codes: Union[array, bytes, Iterable[int]],
+        kind: str,
+    ) -> List[ExtendedEnumType]:
+        typecode = _get_typecode(len(table))
+        if not isinstance(codes, array) or codes.typecode != typecode:
+            try:
+                codes = array(typecode, codes)
+            except OverflowError:
+                raise ValueError(f'Negative or too large {kind}s for {cls.__qualname__}') from None
+        try:
+            return [table[code] for code in codes]
+        except IndexError:
+            invalid_code = max(codes)
+        raise ValueError(f'{invalid_code!r} is not a valid {kind} of {cls.__qualname__}')
+
+    @classmethod
+    def _make_validator(cls, strict: bool, allow_extended: bool, coerce_str_uuid: bool) -> Callable[[Any], Any]:
+        get_member = _build_validation_table(cls, allow_extended, coerce_str_uuid).get
+        # Integer values are looked up only for integers, numbers equal to them are not valid.
+        get_int_member = cls._simple_value2member_proxy.get
+        if strict:
+            return _make_strict_validator(cls.__qualname__, get_member, get_int_member)
+        normalized2member = cls.__dict__.get('_normalized2member') or _index_normalized_forms(cls)
+        return _make_normalized_validator(cls.__qualname__, get_member, get_int_member, normalized2member.get)
+
     @classmethod
     def _check_type(cls, value: Any) -> None:
         if isinstance(value, BaseExtendedEnumValue):
@@ -169,12 +857,311 @@ class ExtendedEnum(enum.Enum):
 
     @classmethod
     def _missing_(cls, value: Any) -> ExtendedEnumType:  # noqa: WPS120
-        if isinstance(value, (UUID, int, str)):
-            try:
-                return cls.get_simple_value_member()[value]
-            except KeyError:
-                pass  # noqa: WPS420
-        raise ValueError(f'{value!r} is not a valid {cls.__qualname__}')
+        # String and UUID values are resolved by the standard lookup through `_value2member_map_`, so only integer
+        # values, values that do not belong to the enumeration and other forms of values get here.
+        member = cls._resolve_missing(value, None)
+        if member is None:
+            raise ValueError(f'{value!r} is not a valid {cls.__qualname__}')
+        return member
+
+    @classmethod
+    def _resolve_missing(cls, value: Any, default: Any) -> Any:
+        """Get a member by a value that the exact lookup has not found, instrumented lookups are also counted."""
+        if isinstance(value, int):
+            # Instrumented lookups of integer values are counted by the dictionary that replaces `_value2member_map_`.
+            member = cls._simple_value2member.get(value)
+            if member is not None:
+                return member
+        instrumentation = cls.__dict__.get('_lookup_instrumentation')
+        if instrumentation is not None:
+            return instrumentation.resolve_missing(value, default)
+        return cls._get_normalized_member(value, default)
+
+    @classmethod
+    def _get_normalized_member(cls, value: Any, default: Any) -> Any:
+        normalized2member = cls.__dict__.get('_normalized2member')
+        if normalized2member is None:
+            return default
+        if isinstance(value, str):
+            value = value.casefold()
+        try:
+            return normalized2member.get(value, default)
+        except TypeError:
+            return default
+
+    @classmethod
+    def _find_member(cls, value: Any, default: Any) -> Any:
+        """Find a member by an unhashable value, comparing it with the extended values as the standard lookup does."""
+        for member in cls._member_map_.values():
+            if member.extended_value == value:
+                return member
+        return default
+
+    @classmethod
+    def _init_indexes(cls) -> None:
+        """Create empty indexes of the enumeration class, they are filled while the members are created."""
+        cls._simple_value2member = {}
+        cls._simple_value2member_proxy = MappingProxyType(cls._simple_value2member)
+        cls._ordinal2member = []
+
+    def _index_member(self, value: ExtendedEnumValueType) -> None:
+        """
+        Index the member while the enumeration class is being created.
+
+        A string or UUID simple value is also stored in `_value2member_map_` of the standard `Enum`,
+        so `cls(simple_value)` is resolved by a single dictionary lookup
+        without a linear search of the members and without calling `_missing_`.
+        Integer values are not stored there: numbers equal to them (e.g. `1.0` or `Decimal(1)`) would be found,
+        so they are resolved by `_missing_`, which accepts only integers.
+        As before, if several members have the same simple value, the last one defined wins.
+        """
+        class_dict = self.__class__.__dict__
+        lazy_definitions = class_dict.get('_lazy_definitions')
+        if lazy_definitions is not None:
+            # Members of lazy enumerations (see `extended_enum.lazy`) are indexed at the positions of their rows.
+            lazy_definitions.index_member(self, value)
+            return
+        if '_simple_value2member' not in class_dict:
+            self._init_indexes()
+        # A member with an equal extended value is an alias, so the index refers to the original member.
+        # The indexes are attributes of the class, they are changed through the member.
+        try:
+            member = self._value2member_map_.get(value, self)
+        except TypeError:
+            member = self._find_member(value, self)
+        if member is self:
+            self._ordinal = len(self._ordinal2member)
+            self._ordinal2member.append(self)
+        self._simple_value2member[value.value] = member
+        if not isinstance(value.value, int):
+            self._value2member_map_[value.value] = member
+
+
+ExtendedEnum._init_indexes()  # noqa: WPS437
+_value_attribute = cast(_MemberAttribute, ExtendedEnum.__dict__['value'])
+_extended_value_attribute = cast(_MemberAttribute, ExtendedEnum.__dict__['extended_value'])
+
+
+def index_by(*field_names: str) -> Callable[[Type[ExtendedEnumType]], Type[ExtendedEnumType]]:
+    """
+    Index the members of an enumeration by fields of their extended values for `ExtendedEnum.get_by`.
+
+    Like `enum.unique`, the decorator checks the enumeration when it is defined:
+    several members with equal values of an indexed field are an error. Aliases are not indexed,
+    neither are members whose extended values do not have the field. All members of a lazy enumeration are created.
+
+    Examples:
+        ```python
+        from extended_enum import ExtendedEnum, EnumField, index_by
+
+        @index_by('display_name')
+        class DetailedEnum(ExtendedEnum):
+            CONST1 = EnumField(SomeExtendedEnumValue(value='const1', display_name='ONE'))
+            CONST2 = EnumField(SomeExtendedEnumValue(value='const2', display_name='TWO'))
+
+        assert DetailedEnum.get_by('display_name', 'TWO') is DetailedEnum.CONST2
+        ```
+
+    Args:
+        field_names: Fields of the extended values.
+
+    Returns:
+        A class decorator.
+
+    Raises:
+        ValueError: The decorated enumeration has equal values of a field, or no member has the field.
+    """  # noqa: DAR402
+    def decorator(enum_cls: Type[ExtendedEnumType]) -> Type[ExtendedEnumType]:
+        field_indexes = dict(enum_cls.__dict__.get('_field_indexes', {}))
+        for field_name in field_names:
+            field_indexes[field_name] = _index_field(enum_cls, field_name)
+        enum_cls._field_indexes = field_indexes  # noqa: WPS437
+        return enum_cls
+
+    return decorator
+
+
+def index_normalized(enum_cls: Type[ExtendedEnumType]) -> Type[ExtendedEnumType]:
+    """
+    Also resolve other forms of simple values: strings in any case and textual, integer and bytes forms of UUID.
+
+    By default, members are found only by the exact simple values. The decorator adds an index of normalized forms,
+    which `cls(value)`, `cls.get(value)` and `cls.parse_many(values)` use when the exact lookup fails:
+    a string value is found by any string with the same `str.casefold()`, a UUID value is found by its string
+    with or without hyphens, in braces or as a URN (in any case), by `UUID.int` and by `UUID.bytes`.
+    The input is only casefolded, no UUID objects are created. Like `enum.unique`, the decorator checks
+    the enumeration when it is defined: several members with the same normalized form are an error.
+
+    Examples:
+        ```python
+        from uuid import UUID
+        from extended_enum import ExtendedEnum, EnumField, index_normalized
+
+        @index_normalized
+        class MixedEnum(ExtendedEnum):
+            CONST1 = EnumField('const1')
+            CONST2 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+
+        assert MixedEnum('CONST1') is MixedEnum.CONST1
+        assert MixedEnum('79FF34313E984BEC9A4C63EDE2580F83') is MixedEnum.CONST2
+        ```
+
+    Args:
+        enum_cls: Enumeration class.
+
+    Returns:
+        The same enumeration class.
+
+    Raises:
+        ValueError: Several members have the same normalized form of values.
+    """  # noqa: DAR402
+    enum_cls._normalized2member = _index_normalized_forms(enum_cls)  # noqa: WPS437
+    return enum_cls
+
+
+def _build_validation_table(
+    enum_cls: Type[ExtendedEnumType],
+    allow_extended: bool,
+    coerce_str_uuid: bool,
+) -> Dict[Any, ExtendedEnumType]:
+    table: Dict[Any, ExtendedEnumType] = {}
+    if coerce_str_uuid:
+        uuid_members = [member for member in enum_cls if isinstance(member.value, UUID)]
+        table.update((str(uuid_member.value), uuid_member) for uuid_member in uuid_members)
+    # Exact values take precedence over coerced forms, e.g. a string value over the string of a UUID value.
+    value2member = enum_cls._value2member_map_  # noqa: WPS437
+    table.update(
+        (lookup_value, value_member)
+        for lookup_value, value_member in value2member.items()
+        if allow_extended or not isinstance(lookup_value, BaseExtendedEnumValue)
+    )
+    table.update((enum_member, enum_member) for enum_member in enum_cls)
+    return table
+
+
+def _make_strict_validator(
+    qualname: str,
+    get_member: Callable[[Any], Any],
+    get_int_member: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    def validate(lookup_value: Any) -> Any:  # noqa: WPS430
+        try:
+            member = get_member(lookup_value)
+        except TypeError:
+            member = None
+        if member is None and isinstance(lookup_value, int):
+            member = get_int_member(lookup_value)
+        if member is None:
+            raise ValueError(f'{lookup_value!r} is not a valid {qualname}')
+        return member
+    return validate
+
+
+def _make_normalized_validator(  # noqa: WPS231
+    qualname: str,
+    get_member: Callable[[Any], Any],
+    get_int_member: Callable[[Any], Any],
+    get_normalized_member: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    def validate_normalized(lookup_value: Any) -> Any:  # noqa: WPS430
+        try:
+            member = get_member(lookup_value)
+        except TypeError:
+            raise ValueError(f'{lookup_value!r} is not a valid {qualname}') from None
+        if member is None and isinstance(lookup_value, int):
+            member = get_int_member(lookup_value)
+        if member is None:
+            member = get_normalized_member(_get_normalized_key(lookup_value))
+        if member is None:
+            raise ValueError(f'{lookup_value!r} is not a valid {qualname}')
+        return member
+    return validate_normalized
+
+
+def _get_normalized_key(lookup_value: Any) -> Any:
+    return lookup_value.casefold() if isinstance(lookup_value, str) else lookup_value
+
+
+def _index_normalized_forms(enum_cls: Type[ExtendedEnumType]) -> Dict[Any, ExtendedEnumType]:
+    normalized2member: Dict[Any, ExtendedEnumType] = {}
+    duplicates = []
+    for member in enum_cls:
+        for key in _get_normalized_forms(member.value):
+            original = normalized2member.setdefault(key, member)
+            if original is not member:
+                duplicates.append(f'{member.name} -> {original.name}')
+                break
+    _check_duplicates(enum_cls, 'normalized', duplicates)
+    return normalized2member
+
+
+def _get_normalized_forms(simple_value: SimpleValueType) -> List[Any]:
+    if isinstance(simple_value, str):
+        return [simple_value.casefold()]
+    if isinstance(simple_value, UUID):
+        text = str(simple_value)
+        return [
+            text,
+            simple_value.hex,
+            f'{{{text}}}',
+            simple_value.urn,
+            simple_value.int,
+            simple_value.bytes,
+        ]
+    return []
+
+
+def _index_field(enum_cls: Type[ExtendedEnumType], field_name: str) -> Dict[Any, ExtendedEnumType]:
+    field_index: Dict[Any, ExtendedEnumType] = {}
+    duplicates = []
+    for member in enum_cls:
+        key = getattr(member.extended_value, field_name, _MISSING)
+        if key is _MISSING:
+            continue
+        original = field_index.setdefault(key, member)
+        if original is not member:
+            duplicates.append(f'{member.name} -> {original.name}')
+    _check_duplicates(enum_cls, field_name, duplicates)
+    if not field_index and len(enum_cls):
+        raise ValueError(f'Extended values of {enum_cls.__qualname__} do not have the {field_name!r} field')
+    return field_index
+
+
+def _check_duplicates(enum_cls: Type[ExtendedEnumType], kind: str, duplicates: List[str]) -> None:
+    if duplicates:
+        members = ', '.join(duplicates)
+        raise ValueError(f'duplicate {kind} values found in {enum_cls!r}: {members}')
+
+
+def _make_record_converter(
+    value_cls: Type[BaseExtendedEnumValue],
+    name_field: str,
+    value_field: str,
+    converter: Optional[Callable[[Any], Any]],
+) -> _RecordConverterType:
+    """Make a function that gets the member name and the extended value defined by a record and its position."""
+    field_names = [dataclass_field.name for dataclass_field in fields(value_cls) if dataclass_field.name != 'value']
+
+    def record_to_member(position: int, record: Mapping[str, Any]) -> Tuple[str, Any]:  # noqa: WPS430
+        for required_field in (name_field, value_field):
+            if required_field not in record:
+                raise ValueError(f'Record {position} does not have the {required_field!r} field')
+        simple_value = record[value_field] if converter is None else converter(record[value_field])
+        extra_fields = {field_name: record[field_name] for field_name in field_names if field_name in record}
+        return record[name_field], value_cls(simple_value, **extra_fields)
+    return record_to_member
+
+
+def _to_json_fragment(json_value: Union[int, str]) -> str:
+    """Serialize a simple value to JSON in the same way as `json.dumps`."""
+    if isinstance(json_value, str):
+        return encode_basestring_ascii(json_value)
+    return json.dumps(json_value)
+
+
+def _get_typecode(size: int) -> str:
+    """Get the typecode of an array that stores positions in a table of the given size."""
+    return 'H' if size <= _MAX_SHORT_TABLE_SIZE else 'I'
 
 
 def EnumField(value: Union[SimpleValueType, ExtendedEnumValueType]) -> BaseExtendedEnumValue:  # noqa: N802
@@ -0,0 +1,289 @@
+"""
+Generation of a Python module with an enumeration whose members are written as literals.
+
+Importing the generated module does not run `EnumField` and does not build the caches of the enumeration:
+the values tuples and the markdown description are stored in the module.
+With `--lazy` the members are created on first access (see `extended_enum.lazy`).
+
+Usage:
+
+    python -m extended_enum.freeze package.module:Country -o package/countries.py
+    python -m extended_enum.freeze currencies.csv --name Currency --converter builtins:int -o currencies.py
+    python -m extended_enum.freeze package.module:Country --lazy -o package/countries.py
+"""
+import argparse
+import ast
+import importlib
+import keyword
+import sys
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+from uuid import UUID
+
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription
+from extended_enum.lazy import lazy_enum
+from extended_enum.tools import format_to_markdown
+
+HEADER = '"""Generated by `python -m extended_enum.freeze` from {source}, do not edit."""\n'
+
+_INDENT = '    '
+
+
+def freeze(enum_cls: Type[ExtendedEnum], source: Optional[str] = None, lazy: bool = False) -> str:
+    """
+    Generate the source code of a module that defines the enumeration with literal members.
+
+    The classes of the extended values and the base classes of the enumeration are imported by the module,
+    so they must be importable. Fields of the extended values must be literals (`repr` can be evaluated),
+    or UUID. Member names that are not identifiers (e.g. `'004'` or `'class'`) are written
+    as arguments of the functional API instead of the class body.
+
+    Most of the import time of a large enumeration is spent by `EnumMeta` creating the members.
+    With `lazy=True` the module defines the enumeration with `extended_enum.lazy.lazy_enum`,
+    so the members are created on first access.
+
+    Args:
+        enum_cls: Enumeration class.
+        source: The description of the source of the enumeration for the header of the module.
+        lazy: Define a lazy enumeration, it cannot have aliases.
+
+    Returns:
+        The source code of the module.
+
+    Raises:
+        TypeError: A class cannot be imported or a field is not a literal.
+        ValueError: A lazy enumeration is requested for an enumeration with aliases,
+                    or an enumeration with several base classes has a member name that is not an identifier.
+    """  # noqa: DAR402
+    imports = _Imports()
+    definition = _format_lazy_definition(enum_cls, imports) if lazy else _format_class_definition(enum_cls, imports)
+    caches = _format_caches(enum_cls, imports, lazy)
+    if not source:
+        source = f'{enum_cls.__module__}:{enum_cls.__qualname__}'
+    header = HEADER.format(source=source)
+    return ''.join((header, imports.format(), definition, caches))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Generate a module from the command line."""
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+    if ':' in args.source:
+        enum_cls = _import_object(args.source)
+    elif args.name:
+        enum_cls = ExtendedEnum.from_records(
+            args.name,
+            args.source,
+            value_cls=_import_object(args.value_cls) if args.value_cls else ValueWithDescription,
+            name_field=args.name_field,
+            value_field=args.value_field,
+            converter=_import_object(args.converter) if args.converter else None,
+        )
+    else:
+        parser.error('--name is required to freeze an enumeration from a file')
+
+    module_source = freeze(enum_cls, source=args.source, lazy=args.lazy)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            output.write(module_source)
+    else:
+        sys.stdout.write(module_source)
+
+
+class _Imports(object):
+    """Names imported by the generated module."""
+
+    def __init__(self) -> None:
+        self.modules: Dict[str, Set[str]] = {}
+
+    def add(self, obj: Any) -> str:
+        """Import the class and get the expression that refers to it in the generated module."""
+        module, qualname = obj.__module__, obj.__qualname__
+        if module == '__main__' or '<locals>' in qualname:
+            raise TypeError(f'{module}.{qualname} cannot be imported by the generated module')
+        top_level_name = qualname.split('.')[0]
+        self.modules.setdefault(module, set()).add(top_level_name)
+        return qualname
+
+    def format(self) -> str:  # noqa: WPS125
+        """Get the import statements."""
+        groups: Tuple[List[str], List[str]] = ([], [])
+        for module, names in sorted(self.modules.items()):
+            imported_names = ', '.join(sorted(names))
+            is_extended_enum = module.split('.')[0] == 'extended_enum'
+            groups[is_extended_enum].append(f'from {module} import {imported_names}\n')
+        return '\n'.join(''.join(group) for group in groups if group)
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    description = __doc__.strip().splitlines()[0]
+    parser = argparse.ArgumentParser(prog='python -m extended_enum.freeze', description=description)
+    parser.add_argument('source', help='an enumeration class as module:Class, or a JSON, JSON Lines or CSV file')
+    parser.add_argument('-o', '--output', help='the file to write the module to, by default standard output')
+    parser.add_argument('--lazy', action='store_true', help='create the members on first access')
+    parser.add_argument('--name', help='the name of the enumeration created from a file')
+    parser.add_argument('--value-cls', help='the class of extended values as module:Class (files only)')
+    parser.add_argument('--converter', help='a function applied to simple values as module:function (files only)')
+    parser.add_argument('--name-field', default='name', help='the field with member names (files only)')
+    parser.add_argument('--value-field', default='value', help='the field with simple values (files only)')
+    return parser
+
+
+def _format_caches(enum_cls: Type[ExtendedEnum], imports: _Imports, lazy: bool) -> str:
+    class_name = enum_cls.__name__
+    members = enum_cls.__members__.values()
+    values = _format_lines(_format_literal(member.value, imports) for member in members)
+    caches = [f'{class_name}._values = (\n{values})\n']
+    if not lazy:
+        caches.append(f'{class_name}._extended_values = {_format_extended_values_cache(enum_cls)}\n')
+    caches.append(f'{class_name}._markdown = (\n{_format_markdown(enum_cls)})\n')
+    return ''.join(caches)
+
+
+def _format_markdown(enum_cls: Type[ExtendedEnum]) -> str:
+    lines = format_to_markdown(enum_cls).splitlines(keepends=True)
+    literals = [repr(line) for line in lines] or ["''"]
+    return _format_lines(literals, separator='')
+
+
+def _format_class_definition(enum_cls: Type[ExtendedEnum], imports: _Imports) -> str:
+    invalid_names = _get_invalid_names(enum_cls)
+    bases = ', '.join(imports.add(base) for base in enum_cls.__bases__)
+    extended_values = _format_lines(_format_extended_value(member.extended_value, imports) for member in enum_cls)
+    header = f'\n_EXTENDED_VALUES = (\n{extended_values})\n\n\n'
+    if invalid_names:
+        # Such names cannot be written in the class body, the functional API accepts them.
+        return header + _format_functional_definition(enum_cls, bases)
+    return header + _format_class_statement(enum_cls, bases)
+
+
+def _get_invalid_names(enum_cls: Type[ExtendedEnum]) -> List[str]:
+    invalid_names = [name for name in enum_cls.__members__ if not _is_identifier(name)]
+    if invalid_names and len(enum_cls.__bases__) > 1:
+        qualname, name = enum_cls.__qualname__, invalid_names[0]
+        raise ValueError(f'{qualname} has several base classes and the member {name!r} whose name is not an identifier')
+    return invalid_names
+
+
+def _format_functional_definition(enum_cls: Type[ExtendedEnum], bases: str) -> str:
+    items = _format_lines(
+        (
+            f'({member_name!r}, _EXTENDED_VALUES[{member.ordinal}])'
+            for member_name, member in enum_cls.__members__.items()
+        ),
+        indent=_INDENT * 2,
+    )
+    return ''.join((
+        f'{enum_cls.__name__} = {bases}(\n',
+        _format_line(repr(enum_cls.__name__)),
+        f'{_INDENT}[\n{items}{_INDENT}],\n',
+        _format_line('module=__name__'),
+        ')\n\n',
+    ))
+
+
+def _format_class_statement(enum_cls: Type[ExtendedEnum], bases: str) -> str:
+    statements = [
+        f'{member_name} = _EXTENDED_VALUES[{member.ordinal}]'
+        for member_name, member in enum_cls.__members__.items()
+    ]
+    body = _format_lines(statements or ['pass'], separator='')
+    return f'class {enum_cls.__name__}({bases}):\n{body}\n\n'
+
+
+def _format_extended_values_cache(enum_cls: Type[ExtendedEnum]) -> str:
+    members = enum_cls.__members__.values()
+    if len(members) == len(enum_cls):
+        return '_EXTENDED_VALUES'
+    ordinals = ', '.join(str(member.ordinal) for member in members)
+    return f'tuple(_EXTENDED_VALUES[ordinal] for ordinal in ({ordinals},))'
+
+
+def _format_lazy_definition(enum_cls: Type[ExtendedEnum], imports: _Imports) -> str:
+    if len(enum_cls.__members__) != len(enum_cls):
+        raise ValueError(f'{enum_cls.__qualname__} has aliases, it cannot be frozen as a lazy enumeration')
+    rows, value_cls_argument = _format_lazy_rows(enum_cls, imports)
+    base_argument = _format_base_argument(enum_cls, imports)
+    return ''.join((
+        f'\n_DEFINITIONS = (\n{rows})\n\n',
+        f'{enum_cls.__name__} = {imports.add(lazy_enum)}(',
+        f'{enum_cls.__name__!r}, _DEFINITIONS{value_cls_argument}{base_argument})\n\n',
+    ))
+
+
+def _format_lazy_rows(enum_cls: Type[ExtendedEnum], imports: _Imports) -> Tuple[str, str]:
+    """Get the rows of definitions and the `value_cls` argument of `lazy_enum`."""
+    value_classes = {type(member.extended_value) for member in enum_cls}
+    if len(value_classes) != 1:
+        rows = (
+            _format_row(member.name, [_format_extended_value(member.extended_value, imports)])
+            for member in enum_cls
+        )
+        return ''.join(rows), ''
+    # Rows contain the arguments of the value class, so importing the module does not create the values.
+    value_cls = value_classes.pop()
+    init_fields = [value_field.name for value_field in fields(value_cls) if value_field.init]
+    argument_rows = (
+        _format_row(member.name, _format_arguments(member.extended_value, init_fields, imports))
+        for member in enum_cls
+    )
+    return ''.join(argument_rows), f', value_cls={imports.add(value_cls)}'
+
+
+def _format_base_argument(enum_cls: Type[ExtendedEnum], imports: _Imports) -> str:
+    if enum_cls.__bases__ == (ExtendedEnum,):
+        return ''
+    return f', base={imports.add(enum_cls.__bases__[0])}'
+
+
+def _format_arguments(extended_value: BaseExtendedEnumValue, init_fields: List[str], imports: _Imports) -> List[str]:
+    return [_format_literal(getattr(extended_value, name), imports) for name in init_fields]
+
+
+def _format_row(member_name: str, arguments: List[str]) -> str:
+    row = ', '.join([repr(member_name), *arguments])
+    return _format_line(f'({row})')
+
+
+def _format_lines(codes: Iterable[str], indent: str = _INDENT, separator: str = ',') -> str:
+    return ''.join(_format_line(code, indent, separator) for code in codes)
+
+
+def _format_line(code: str, indent: str = _INDENT, separator: str = ',') -> str:
+    return f'{indent}{code}{separator}\n'
+
+
+def _is_identifier(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _format_extended_value(extended_value: BaseExtendedEnumValue, imports: _Imports) -> str:
+    arguments = ', '.join(
+        f'{value_field.name}={_format_literal(getattr(extended_value, value_field.name), imports)}'
+        for value_field in fields(extended_value)
+        if value_field.init
+    )
+    return f'{imports.add(type(extended_value))}({arguments})'
+
+
+def _format_literal(field_value: Any, imports: _Imports) -> str:
+    if isinstance(field_value, UUID):
+        return f'{imports.add(UUID)}({str(field_value)!r})'
+    literal = repr(field_value)
+    try:
+        ast.literal_eval(literal)
+    except (ValueError, SyntaxError):
+        raise TypeError(f'{literal} cannot be written to the generated module as a literal') from None
+    return literal
+
+
+def _import_object(path: str) -> Any:
+    module_name, _, qualname = path.partition(':')
+    obj = importlib.import_module(module_name)
+    for attribute in qualname.split('.'):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+Opt-in counters of member lookups by value, to see how often decoding takes the slow paths.
+
+Lookups are counted by `cls(value)`, `cls.get(value)` and `cls.parse_many(values)` as one of the events:
+
+* `hit` - a simple value is found by the dictionary lookup;
+* `extended_hit` - an extended value is found by the dictionary lookup;
+* `fallback` - the value is not found by the dictionary lookup, but is resolved by `_missing_`
+  (e.g. a normalized form of a value, see `index_normalized`);
+* `failure` - the value does not belong to the enumeration.
+
+Values that cannot be hashed and are found by comparison with all members are not counted.
+Instrumentation replaces `_value2member_map_` of the class with a counting dictionary,
+so the lookups of classes that are not instrumented do not change.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Type
+
+from extended_enum import BaseExtendedEnumValue, ExtendedEnum
+
+LookupCallbackType = Callable[[str, Any, Optional[int]], None]
+
+EVENTS = ('hit', 'extended_hit', 'fallback', 'failure')
+
+_NOT_FOUND = object()
+
+
+class LookupStats(NamedTuple):
+    """The numbers of lookups by events and their total time in nanoseconds (zero if timing is disabled)."""
+
+    hit: int
+    extended_hit: int
+    fallback: int
+    failure: int
+    time_ns: int
+
+
+class LookupInstrumentation(object):
+    """The counters of lookups of an enumeration class."""
+
+    def __init__(self, enum_cls: Type[ExtendedEnum], timing: bool, callback: Optional[LookupCallbackType]) -> None:
+        """
+        Initialize the counters.
+
+        Args:
+            enum_cls: Enumeration class.
+            timing: Measure the time of lookups.
+            callback: Called after each lookup with the event, the value and the time in nanoseconds
+                      (None if timing is disabled).
+        """
+        self.enum_cls = enum_cls
+        self.timing = timing
+        self.callback = callback
+        self.value2member_map = enum_cls._value2member_map_  # noqa: WPS437
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = dict.fromkeys(EVENTS, 0)
+        self._time_ns = 0
+
+    def snapshot(self) -> LookupStats:
+        """Get the current values of the counters."""
+        with self._lock:
+            return LookupStats(time_ns=self._time_ns, **self._counts)
+
+    def reset(self) -> None:
+        """Set the counters to zero."""
+        with self._lock:
+            self._counts = dict.fromkeys(EVENTS, 0)
+            self._time_ns = 0
+
+    def record(self, event: str, lookup_value: Any, start_ns: Optional[int]) -> None:
+        """Count a lookup that started at `start_ns` (None if timing is disabled)."""
+        elapsed_ns = None if start_ns is None else time.perf_counter_ns() - start_ns
+        with self._lock:
+            self._counts[event] += 1
+            if elapsed_ns is not None:
+                self._time_ns += elapsed_ns
+        if self.callback is not None:
+            self.callback(event, lookup_value, elapsed_ns)
+
+    def resolve_missing(self, lookup_value: Any, default: Any) -> Any:
+        """Get a member by a value that the dictionary lookup has not found and count the result."""
+        start_ns = time.perf_counter_ns() if self.timing else None
+        member = self.enum_cls._get_normalized_member(lookup_value, _NOT_FOUND)  # noqa: WPS437
+        if member is _NOT_FOUND:
+            self.record('failure', lookup_value, start_ns)
+            return default
+        self.record('fallback', lookup_value, start_ns)
+        return member
+
+
+def instrument(
+    enum_cls: Type[ExtendedEnum],
+    timing: bool = False,
+    callback: Optional[LookupCallbackType] = None,
+) -> LookupInstrumentation:
+    """
+    Count the lookups of members of an enumeration by value.
+
+    Examples:
+        ```python
+        from extended_enum.instrumentation import instrument
+
+        instrumentation = instrument(Currency, callback=lambda event, value, elapsed_ns: metrics.incr(event))
+        Currency(978)
+        assert instrumentation.snapshot().hit == 1
+        ```
+
+    Args:
+        enum_cls: Enumeration class, the counters of a previous instrumentation of the class are discarded.
+        timing: Measure the time of lookups.
+        callback: Called after each lookup with the event, the value and the time in nanoseconds
+                  (None if timing is disabled).
+
+    Returns:
+        The counters of lookups.
+
+    Raises:
+        TypeError: The enumeration is lazy.
+    """
+    if enum_cls.__dict__.get('_lazy_definitions') is not None:
+        raise TypeError(f'Lookups of the lazy enumeration {enum_cls.__qualname__} cannot be instrumented')
+    uninstrument(enum_cls)
+    instrumentation = LookupInstrumentation(enum_cls, timing, callback)
+    enum_cls._value2member_map_ = _CountingValueMap(instrumentation)  # noqa: WPS437
+    enum_cls._lookup_instrumentation = instrumentation  # noqa: WPS437
+    return instrumentation
+
+
+def uninstrument(enum_cls: Type[ExtendedEnum]) -> None:
+    """Stop counting the lookups of members of an enumeration, if they are counted."""
+    instrumentation = enum_cls.__dict__.get('_lookup_instrumentation')
+    if instrumentation is not None:
+        enum_cls._value2member_map_ = instrumentation.value2member_map  # noqa: WPS437
+        del enum_cls._lookup_instrumentation  # noqa: WPS420, WPS437
+
+
+class _CountingValueMap(dict):  # noqa: WPS600
+    """`_value2member_map_` of an instrumented enumeration, it counts the values that are found."""
+
+    def __init__(self, instrumentation: LookupInstrumentation) -> None:
+        super().__init__(instrumentation.value2member_map)
+        self.instrumentation = instrumentation
+        # Integer values are not keys of `_value2member_map_`, they are found here only by integers.
+        self.int2member = {
+            lookup_value: member
+            for lookup_value, member in instrumentation.enum_cls.get_simple_value_member().items()
+            if isinstance(lookup_value, int)
+        }
+
+    def __getitem__(self, lookup_value: Any) -> ExtendedEnum:
+        member = self.get(lookup_value, _NOT_FOUND)
+        if member is _NOT_FOUND:
+            raise KeyError(lookup_value)
+        return member  # type: ignore[no-any-return]
+
+    def get(self, lookup_value: Any, default: Any = None) -> Any:  # noqa: WPS110
+        instrumentation = self.instrumentation
+        start_ns = time.perf_counter_ns() if instrumentation.timing else None
+        member = dict.get(self, lookup_value, _NOT_FOUND)
+        if member is _NOT_FOUND and isinstance(lookup_value, int):
+            member = self.int2member.get(lookup_value, _NOT_FOUND)
+        if member is _NOT_FOUND:
+            # Values that are not found are counted by `_missing_`.
+            return default
+        instrumentation.record(_get_hit_event(lookup_value), lookup_value, start_ns)
+        return member
+
+
+def _get_hit_event(lookup_value: Any) -> str:
+    return 'extended_hit' if isinstance(lookup_value, BaseExtendedEnumValue) else 'hit'
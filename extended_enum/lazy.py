@@ -0,0 +1,371 @@
+"""
+Enumerations whose members are created on first access from a definition table.
+
+An enumeration with tens of thousands of members spends most of its import time creating the members.
+A lazy enumeration stores only the table and creates each member when it is first used:
+`cls.NAME`, `cls[name]`, `cls(value)`, `cls.get(value)`, `cls.from_ordinal(ordinal)` create one member,
+while iteration, `__members__`, `get_values()` and the other methods over all members create all of them.
+The results are the same as for an enumeration created from the same table eagerly.
+
+Members are created under a lock of the enumeration, so each member is created once
+even if several threads access it at the same time. Members that are already created are read without the lock.
+"""
+import sys
+import threading
+from itertools import repeat
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Type  # noqa: WPS235
+from uuid import UUID
+
+from extended_enum import ExtendedEnum, ExtendedEnumType, BaseExtendedEnumValue, EnumField
+
+# Since Python 3.12 members are found only as class attributes, before they are also found by `EnumMeta.__getattr__`.
+_MEMBERS_ARE_CLASS_ATTRIBUTES = sys.version_info >= (3, 12)
+
+
+def lazy_enum(  # noqa: WPS211
+    name: str,
+    definitions: Iterable[Sequence[Any]],
+    value_cls: Optional[Type[BaseExtendedEnumValue]] = None,
+    base: Type[ExtendedEnumType] = ExtendedEnum,  # type: ignore[assignment]
+    module: Optional[str] = None,
+    qualname: Optional[str] = None,
+) -> Type[ExtendedEnumType]:
+    """
+    Create an enumeration whose members are created on first access.
+
+    Members of a lazy enumeration cannot be aliases, so simple values must be unique.
+
+    Examples:
+        ```python
+        from extended_enum import ValueWithDescription
+        from extended_enum.lazy import lazy_enum
+
+        Country = lazy_enum(
+            'Country',
+            [('AD', 'ad', 'Andorra'), ('AE', 'ae', 'United Arab Emirates'), ...],
+            value_cls=ValueWithDescription,
+        )
+        assert Country('ae').extended_value.description == 'United Arab Emirates'
+        ```
+
+    Args:
+        name: The name of the enumeration class.
+        definitions: Rows of the table in the definition order.
+                     Without `value_cls` a row is `(member_name, value)`, where value is accepted by `EnumField`.
+                     With `value_cls` a row is `(member_name, value, *fields)`,
+                     the extended value is created as `value_cls(value, *fields)`.
+        value_cls: The class of extended values.
+        base: The base enumeration class without members.
+        module: The module of the enumeration class (for pickling), by default the module of the caller.
+        qualname: The qualified name of the enumeration class (for pickling).
+
+    Returns:
+        An enumeration class.
+
+    Raises:
+        ValueError: A member name is invalid or not unique, or a simple value is not unique.
+    """  # noqa: DAR402
+    if module is None:
+        module = sys._getframe(1).f_globals.get('__name__')  # noqa: WPS437
+    enum_cls = base(name, [], module=module, qualname=qualname)  # type: ignore[call-overload]
+    _LazyDefinitions(enum_cls, definitions, value_cls).install()
+    return enum_cls
+
+
+class _LazyDefinitions(object):  # noqa: WPS230
+    """The definition table of a lazy enumeration, it creates and indexes members on demand."""
+
+    def __init__(
+        self,
+        enum_cls: Type[ExtendedEnum],
+        definitions: Iterable[Sequence[Any]],
+        value_cls: Optional[Type[BaseExtendedEnumValue]],
+    ) -> None:
+        self.enum_cls = enum_cls
+        self.value_cls = value_cls
+        self.rows = [tuple(row) for row in definitions]
+        self.names = [row[0] for row in self.rows]
+        self.name2row = self._index_names()
+        self.value2row = self._index_values()
+        self.member_map = _LazyMemberMap(self)
+        self.value2member_map = _LazyValueMap(self, extended_values=True)
+        self.simple_value2member = _LazyValueMap(self, extended_values=False)
+        self.ordinal2member = _LazyOrdinalList(self)
+        self.missing = len(self.rows)
+        # Reentrant, because `__init__` of a member can access other members.
+        self.lock = threading.RLock()
+
+    def install(self) -> None:
+        """Replace the tables of the members of the enumeration class with the lazy ones."""
+        enum_cls = self.enum_cls
+        enum_cls._lazy_definitions = self  # noqa: WPS437
+        enum_cls._member_names_ = self.names  # noqa: WPS437
+        enum_cls._member_map_ = self.member_map  # noqa: WPS437
+        enum_cls._value2member_map_ = self.value2member_map  # noqa: WPS437
+        enum_cls._simple_value2member = self.simple_value2member  # noqa: WPS437
+        enum_cls._simple_value2member_proxy = MappingProxyType(self.simple_value2member)  # noqa: WPS437
+        enum_cls._ordinal2member = self.ordinal2member  # noqa: WPS437
+        if _MEMBERS_ARE_CLASS_ATTRIBUTES:
+            for member_name in self.names:
+                _set_class_attribute(enum_cls, member_name, _LazyMember(member_name))
+
+    def get_member(self, index: int) -> ExtendedEnum:
+        """Get the member defined by the row, create it on first access."""
+        member = self.ordinal2member.get_created(index)
+        if member is None:
+            with self.lock:
+                member = self.ordinal2member.get_created(index)
+                if member is None:
+                    member = self._create_member(index)
+        return member
+
+    def get_member_by_value(self, value: Any) -> Optional[ExtendedEnum]:
+        """Get the member with the simple value or the simple value of the extended value, if there is one."""
+        if isinstance(value, BaseExtendedEnumValue):
+            value = value.value
+        elif not isinstance(value, (UUID, int, str)):
+            # Numbers equal to integer values (e.g. `1.0`) are not values of the enumeration.
+            return None
+        index = self.value2row.get(value)
+        return None if index is None else self.get_member(index)
+
+    def create_all(self) -> None:
+        """Create all members that have not been accessed yet."""
+        if self.missing:
+            # The tables are complete and sorted when `missing` is zero, so they can be iterated without the lock.
+            with self.lock:
+                for index, _ in enumerate(self.rows):
+                    self.get_member(index)
+
+    def index_member(self, member: ExtendedEnum, value: BaseExtendedEnumValue) -> None:
+        """Set the ordinal of a member created by `_create_member`, it is added to the tables when it is initialized."""
+        member._ordinal = self.name2row[member._name_]  # noqa: WPS437
+
+    def _index_names(self) -> Dict[str, int]:
+        self._check_names()
+        name2row = {name: index for index, name in enumerate(self.names)}
+        if len(name2row) != len(self.names):
+            duplicate = self.names[_find_duplicate(self.names, name2row)]
+            raise ValueError(f'Member name {duplicate!r} is not unique')
+        return name2row
+
+    def _check_names(self) -> None:
+        reserved = _get_reserved_names(self.enum_cls)
+        for member_name in self.names:
+            if not _is_valid_member_name(member_name, reserved):
+                raise ValueError(f'{member_name!r} is not a valid member name of a lazy enumeration')
+
+    def _index_values(self) -> Dict[Any, int]:
+        values = self._get_values()
+        value2row = {value: index for index, value in enumerate(values)}
+        if len(value2row) != len(values):
+            index = _find_duplicate(values, value2row)
+            raise ValueError(
+                f'Value {values[index]!r} of {self.names[index]} is not unique, lazy enumerations cannot have aliases',
+            )
+        return value2row
+
+    def _get_values(self) -> List[Any]:
+        if self.value_cls is not None:
+            return [row[1] for row in self.rows]
+        invalid_rows = (row for row in self.rows if len(row) != 2)  # noqa: WPS432
+        invalid_row = next(invalid_rows, None)
+        if invalid_row is not None:
+            raise ValueError(f'Row {invalid_row!r} must be (member_name, value) without value_cls')
+        return [_get_simple_value(row[1]) for row in self.rows]
+
+    def _create_member(self, index: int) -> ExtendedEnum:
+        enum_cls = self.enum_cls
+        member_name, *args = self.rows[index]
+        extended_value = self._create_value(args)
+        # The same steps as the standard Enum takes for each member when the class is created.
+        member = object.__new__(enum_cls)  # noqa: WPS609
+        member._value_ = extended_value  # noqa: WPS437
+        member._name_ = member_name  # noqa: WPS437
+        member.__objclass__ = enum_cls  # noqa: WPS437
+        member._sort_order_ = index  # noqa: WPS437
+        member.__init__(extended_value)  # noqa: WPS609
+        # Readers that do not find the member in a table get it from `ordinal2member`,
+        # so it is published there first and only when it is completely initialized.
+        self.ordinal2member[index] = member
+        self.member_map[member_name] = member
+        self._index_value(member, extended_value)
+        _set_class_attribute(enum_cls, member_name, member)
+        if self.missing == 1:
+            self._sort_tables()
+        self.missing -= 1
+        return member
+
+    def _create_value(self, args: List[Any]) -> BaseExtendedEnumValue:
+        if self.value_cls is None:
+            return EnumField(args[0])
+        return self.value_cls(*args)
+
+    def _sort_tables(self) -> None:
+        """Put the members in the tables in the definition order, as in an enumeration created eagerly."""
+        members = list.copy(self.ordinal2member)
+        for table in (self.member_map, self.value2member_map, self.simple_value2member):
+            dict.clear(table)
+        for member in members:
+            self.member_map[member._name_] = member  # noqa: WPS437
+            self._index_value(member, member._value_)  # noqa: WPS437
+
+    def _index_value(self, member: ExtendedEnum, extended_value: BaseExtendedEnumValue) -> None:
+        self.simple_value2member[extended_value.value] = member
+        if not isinstance(extended_value.value, int):
+            # As in `ExtendedEnum._index_member`, integer values are found by `__missing__`, which checks the type.
+            self.value2member_map[extended_value.value] = member
+        dict.setdefault(self.value2member_map, extended_value, member)
+
+
+def _set_class_attribute(enum_cls: Type[ExtendedEnum], name: str, attribute_value: Any) -> None:
+    # `EnumMeta.__setattr__` does not allow to set the attributes named as members.
+    type.__setattr__(enum_cls, name, attribute_value)  # noqa: WPS609
+
+
+def _get_reserved_names(enum_cls: Type[ExtendedEnum]) -> Set[str]:
+    return {name for base in enum_cls.__mro__ for name in base.__dict__}
+
+
+def _is_valid_member_name(member_name: Any, reserved: Set[str]) -> bool:
+    if not isinstance(member_name, str) or member_name.startswith('_'):
+        return False
+    return member_name not in reserved
+
+
+def _get_simple_value(row_value: Any) -> Any:
+    return row_value.value if isinstance(row_value, BaseExtendedEnumValue) else row_value
+
+
+def _find_duplicate(keys: Sequence[Any], key2index: Dict[Any, int]) -> int:
+    """Find the position of the first key that is not indexed by it, since an equal key precedes it (-1 if none)."""
+    for index, key in enumerate(keys):
+        if key2index[key] != index:
+            return index
+    return -1
+
+
+class _LazyMember(object):
+    """A class attribute that creates the member with its name on first access."""
+
+    def __init__(self, member_name: str) -> None:
+        self.member_name = member_name
+
+    def __get__(self, instance: Any, ownerclass: Any = None) -> Any:
+        return ownerclass._member_map_[self.member_name]  # noqa: WPS437
+
+
+class _LazyMemberMap(dict):  # noqa: WPS600
+    """`_member_map_` of a lazy enumeration: members by name."""
+
+    def __init__(self, definitions: _LazyDefinitions) -> None:
+        super().__init__()
+        self.definitions = definitions
+
+    def __missing__(self, member_name: str) -> ExtendedEnum:
+        index = self.definitions.name2row.get(member_name)
+        if index is None:
+            raise KeyError(member_name)
+        return self.definitions.get_member(index)
+
+    def __contains__(self, member_name: Any) -> bool:
+        return member_name in self.definitions.name2row
+
+    def __len__(self) -> int:
+        return len(self.definitions.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.definitions.names)
+
+    def get(self, member_name: str, default: Any = None) -> Any:  # noqa: WPS110
+        return self[member_name] if member_name in self else default
+
+    def keys(self) -> Any:  # noqa: WPS110
+        self.definitions.create_all()
+        return super().keys()
+
+    def values(self) -> Any:  # noqa: WPS110
+        self.definitions.create_all()
+        return super().values()
+
+    def items(self) -> Any:  # noqa: WPS110
+        self.definitions.create_all()
+        return super().items()
+
+
+class _LazyValueMap(dict):  # noqa: WPS600
+    """`_value2member_map_` and `_simple_value2member` of a lazy enumeration: members by value."""
+
+    def __init__(self, definitions: _LazyDefinitions, extended_values: bool) -> None:
+        super().__init__()
+        self.definitions = definitions
+        self.extended_values = extended_values
+
+    def __missing__(self, value: Any) -> ExtendedEnum:
+        # The member is not taken from the table, which can be being sorted by another thread.
+        member = self.definitions.get_member_by_value(value)
+        if isinstance(value, BaseExtendedEnumValue):
+            # An extended value is found only if it is equal to the extended value of the member.
+            if not self.extended_values or member is None or member._value_ != value:  # noqa: WPS437
+                member = None
+        if member is None:
+            raise KeyError(value)
+        return member
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            self[value]  # noqa: WPS428
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        self.definitions.create_all()
+        return super().__len__()
+
+    def __iter__(self) -> Iterator[Any]:
+        self.definitions.create_all()
+        return super().__iter__()
+
+    def get(self, value: Any, default: Any = None) -> Any:  # noqa: WPS110
+        try:
+            return self[value]
+        except KeyError:
+            return default
+
+    def keys(self) -> Any:  # noqa: WPS110
+        self.definitions.create_all()
+        return super().keys()
+
+    def values(self) -> Any:  # noqa: WPS110
+        self.definitions.create_all()
+        return super().values()
+
+    def items(self) -> Any:  # noqa: WPS110
+        self.definitions.create_all()
+        return super().items()
+
+
+class _LazyOrdinalList(list):  # noqa: WPS600
+    """`_ordinal2member` of a lazy enumeration: members by ordinal, `None` for members not created yet."""
+
+    def __init__(self, definitions: _LazyDefinitions) -> None:
+        super().__init__(repeat(None, len(definitions.rows)))
+        self.definitions = definitions
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(self))[index]]
+        member = super().__getitem__(index)
+        if member is None:
+            member = self.definitions.get_member(index % len(self))
+        return member
+
+    def __iter__(self) -> Iterator[ExtendedEnum]:
+        self.definitions.create_all()
+        return super().__iter__()
+
+    def get_created(self, index: int) -> Optional[ExtendedEnum]:
+        """Get the member by ordinal if it is created, without creating it."""
+        return super().__getitem__(index)  # type: ignore[no-any-return]  # noqa: WPS613
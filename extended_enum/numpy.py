@@ -0,0 +1,197 @@
+"""
+Vectorized conversion between NumPy arrays of enumeration values and arrays of integer codes.
+
+The code of a member is its ordinal. This module is optional and requires NumPy.
+"""
+from typing import Any, Dict, List, NamedTuple, Tuple, Type
+from uuid import UUID
+from weakref import WeakKeyDictionary
+
+try:
+    import numpy as np  # noqa: WPS433
+except ImportError as exc:  # pragma: no cover
+    raise ImportError('extended_enum.numpy requires NumPy, install it with `pip install numpy`') from exc
+
+from extended_enum import ExtendedEnum
+
+CODE_DTYPE = np.int32
+_INVALID_CODE = -1
+_INT64_INFO = np.iinfo(np.int64)
+
+
+class _Tables(NamedTuple):
+    str_values: np.ndarray
+    str_codes: np.ndarray
+    int_values: np.ndarray
+    int_codes: np.ndarray
+    value2code: Dict[Any, int]
+    members: np.ndarray
+    values: np.ndarray
+
+
+_tables: 'WeakKeyDictionary[Type[ExtendedEnum], _Tables]' = WeakKeyDictionary()
+
+
+def values_to_codes(
+    enum_cls: Type[ExtendedEnum],
+    values: Any,
+    errors: str = 'raise',
+    default: int = -1,
+) -> np.ndarray:
+    """
+    Convert an array of simple values to an array of member codes.
+
+    Arrays of strings (`U` dtype) and integers are resolved with `np.searchsorted` on sorted tables of values.
+    Other arrays and sequences (and `uint64` arrays, whose values may not fit `int64`) are resolved
+    element by element through a dictionary, so that values of different types are never mixed up
+    (e.g. `1` and `'1'`, or `1` and `1.0`). Elements that are not simple values (e.g. lists) are invalid.
+
+    Args:
+        enum_cls: Enumeration class.
+        values: An array or a sequence of simple values.
+        errors: What to do with a value that does not belong to the enumeration.
+                `raise` - raise ValueError, `default` - replace its code with `default`.
+        default: The code of values that do not belong to the enumeration.
+
+    Returns:
+        An array of codes with the same shape as values.
+
+    Raises:
+        ValueError: Unknown error policy or a value that does not belong to the enumeration.
+        TypeError: Unsupported dtype of the array.
+    """
+    if errors not in {'raise', 'default'}:
+        raise ValueError(f'{errors!r} is not a valid error policy')
+
+    if not isinstance(values, np.ndarray):
+        values = np.asarray(values, dtype=object)
+    if values.dtype.kind not in {'U', 'i', 'u', 'O'}:
+        raise TypeError(f'Arrays of dtype {values.dtype} cannot contain values of {enum_cls.__qualname__}')
+    codes = _to_codes(_get_tables(enum_cls), values)
+    invalid = codes == _INVALID_CODE
+    if invalid.any():
+        if errors == 'raise':
+            invalid_value = _to_python(values.ravel()[np.argmax(invalid.ravel())])
+            raise ValueError(f'{invalid_value!r} is not a valid {enum_cls.__qualname__}')
+        codes[invalid] = default
+    return codes
+
+
+def codes_to_members(enum_cls: Type[ExtendedEnum], codes: Any) -> np.ndarray:
+    """
+    Convert an array of codes to an array of members.
+
+    Args:
+        enum_cls: Enumeration class.
+        codes: An array or a sequence of member codes.
+
+    Returns:
+        An array of members (object dtype) with the same shape as codes.
+    """
+    return _take(enum_cls, _get_tables(enum_cls).members, codes)
+
+
+def codes_to_values(enum_cls: Type[ExtendedEnum], codes: Any) -> np.ndarray:
+    """
+    Convert an array of codes to an array of simple values.
+
+    Args:
+        enum_cls: Enumeration class.
+        codes: An array or a sequence of member codes.
+
+    Returns:
+        An array of values with the same shape as codes.
+        Its dtype is `str` or `int64` if all values of the enumeration are of that type, otherwise `object`.
+    """
+    return _take(enum_cls, _get_tables(enum_cls).values, codes)
+
+
+def _get_tables(enum_cls: Type[ExtendedEnum]) -> _Tables:
+    tables = _tables.get(enum_cls)
+    if tables is None:
+        tables = _build_tables(enum_cls)
+        _tables[enum_cls] = tables
+    return tables
+
+
+def _build_tables(enum_cls: Type[ExtendedEnum]) -> _Tables:
+    value2code = {value: member.ordinal for value, member in enum_cls.get_simple_value_member().items()}
+    members = [enum_cls.from_ordinal(ordinal) for ordinal in range(len(enum_cls))]
+    members_table = np.empty(len(members), dtype=object)
+    members_table[:] = members  # noqa: WPS362
+    return _Tables(
+        *_build_search_table(value2code, np.str_),
+        *_build_search_table(value2code, np.int64),
+        value2code=value2code,
+        members=members_table,
+        values=_build_values_table([member.value for member in members]),
+    )
+
+
+def _build_search_table(
+    value2code: Dict[Any, int],
+    dtype: Any,
+) -> Tuple[np.ndarray, np.ndarray]:
+    sorted_values = sorted(value for value in value2code if _fits_dtype(value, dtype))
+    codes = [value2code[value] for value in sorted_values]
+    return np.array(sorted_values, dtype=dtype), np.array(codes, dtype=CODE_DTYPE)
+
+
+def _build_values_table(values: List[Any]) -> np.ndarray:
+    for dtype in (np.str_, np.int64):
+        if values and all(_fits_dtype(value, dtype) for value in values):
+            return np.array(values, dtype=dtype)
+    return np.array(values, dtype=object)
+
+
+def _fits_dtype(value: Any, dtype: Any) -> bool:
+    # Booleans are not put in integer arrays, integers outside int64 are found only through the dictionary.
+    if dtype is np.str_:
+        return isinstance(value, str)
+    return type(value) is int and _INT64_INFO.min <= value <= _INT64_INFO.max  # noqa: WPS516
+
+
+def _to_codes(tables: _Tables, values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind == 'U':
+        return _search(tables.str_values, tables.str_codes, values)
+    if values.dtype.kind != 'O' and np.can_cast(values.dtype, np.int64):
+        return _search(tables.int_values, tables.int_codes, values)
+    # Objects and uint64 values, which may not fit int64.
+    value2code = tables.value2code
+    codes = np.fromiter(
+        (_get_code(value2code, lookup_value) for lookup_value in values.ravel()),
+        dtype=CODE_DTYPE,
+        count=values.size,
+    )
+    return codes.reshape(values.shape)
+
+
+def _get_code(value2code: Dict[Any, int], lookup_value: Any) -> int:
+    # Numbers equal to integer values (e.g. `1.0`) and unhashable objects are not simple values.
+    if isinstance(lookup_value, (UUID, int, str, np.integer)):
+        return value2code.get(lookup_value, _INVALID_CODE)
+    return _INVALID_CODE
+
+
+def _search(sorted_values: np.ndarray, codes: np.ndarray, values: np.ndarray) -> np.ndarray:
+    if not sorted_values.size:
+        return np.full(values.shape, _INVALID_CODE, dtype=CODE_DTYPE)
+    positions = np.searchsorted(sorted_values, values)
+    np.minimum(positions, sorted_values.size - 1, out=positions)
+    found = sorted_values[positions] == values
+    return np.where(found, codes[positions], _INVALID_CODE).astype(CODE_DTYPE)
+
+
+def _take(enum_cls: Type[ExtendedEnum], table: np.ndarray, codes: Any) -> np.ndarray:
+    codes = np.asarray(codes)
+    if codes.dtype.kind not in {'i', 'u'}:
+        raise TypeError(f'Codes must be integers, got an array of dtype {codes.dtype}')
+    invalid = (codes < 0) | (codes >= table.size)  # noqa: WPS465
+    if invalid.any():
+        invalid_code = _to_python(codes[invalid].flat[0])
+        raise ValueError(f'{invalid_code!r} is not a valid code of {enum_cls.__qualname__}')
+    return table[codes]
+
+
+def _to_python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,65 @@
+"""Reading the records that define enumeration members from JSON, JSON Lines and CSV files."""
+import codecs
+import csv
+import json
+import mmap
+import os
+from types import MappingProxyType
+from typing import Any, Iterator, Literal, Mapping, Optional, Union, get_args
+
+RecordsFormatType = Literal['json', 'jsonl', 'csv']
+PathType = Union[str, 'os.PathLike[str]']
+
+FORMATS_BY_SUFFIX = MappingProxyType({
+    '.json': 'json',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.csv': 'csv',
+})
+
+
+def read_records(path: PathType, records_format: Optional[RecordsFormatType] = None) -> Iterator[Mapping[str, Any]]:
+    """
+    Read records from a file one by one.
+
+    JSON Lines and CSV files are memory-mapped and parsed line by line, so the file is not copied into memory.
+    A JSON file must contain an array of objects, it is parsed as a whole.
+
+    Args:
+        path: The path to the file.
+        records_format: `json`, `jsonl` or `csv`, by default it is determined by the suffix of the file.
+
+    Returns:
+        An iterator over records. The file is open until the iterator is exhausted or closed.
+
+    Raises:
+        ValueError: The format is unknown or a JSON file does not contain an array.
+    """
+    if records_format is None:
+        suffix = os.path.splitext(os.fspath(path))[1].lower()
+        records_format = FORMATS_BY_SUFFIX.get(suffix)  # type: ignore[assignment]
+        if records_format is None:
+            raise ValueError(f'Cannot determine the format of records from the suffix of {os.fspath(path)!r}')
+    if records_format not in get_args(RecordsFormatType):
+        raise ValueError(f'{records_format!r} is not a valid format of records')
+    return _read_records(path, records_format)
+
+
+def _read_records(path: PathType, records_format: RecordsFormatType) -> Iterator[Mapping[str, Any]]:
+    with open(path, 'rb') as records_file:
+        if records_format == 'json':
+            records = json.load(records_file)
+            if not isinstance(records, list):
+                raise ValueError(f'{os.fspath(path)!r} must contain a JSON array of records')
+            yield from records
+            return
+
+        if not os.fstat(records_file.fileno()).st_size:
+            # An empty file cannot be memory-mapped.
+            return
+        with mmap.mmap(records_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            lines = iter(mapped_file.readline, b'')
+            if records_format == 'csv':
+                yield from csv.DictReader(codecs.iterdecode(lines, 'utf-8-sig'))
+            else:
+                yield from (json.loads(line) for line in lines if line.strip())
@@ -0,0 +1,244 @@
+"""
+The registry of all ExtendedEnum classes and the resolver of tagged references to their members.
+
+Every enumeration class joins the registry when it is created. A reference names the class and the value:
+
+* a tagged string `"OrderStatus:shipped"`, the value is the text of the simple value (e.g. `"OrderStatus:3"`);
+* a pair `("OrderStatus", "shipped")`, the value is resolved as by `cls.get(value)`.
+
+The class is named by its qualified name or by `module.qualname`, which `to_tagged` writes. A qualified name
+of several registered classes raises `AmbiguousNameError`.
+Resolving a reference takes a lookup of the class and a lookup of the value in its index.
+"""
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from extended_enum import ErrorsPolicyType, ExtendedEnum  # noqa: F401
+
+ReferenceType = Union[str, Tuple[str, Any]]
+
+_NOT_FOUND = object()
+
+
+class AmbiguousNameError(ValueError):
+    """
+    A qualified name of several registered enumerations is used in a reference or to get a class.
+
+    The reference is not treated as invalid by the error policies, since the enumeration cannot be chosen.
+    """
+
+
+class EnumRegistry(object):
+    """Enumeration classes by qualified names."""
+
+    def __init__(self) -> None:  # noqa: D107
+        # Classes in the order of creation, a class replaces a previous class with the same name.
+        self._classes: List['weakref.ReferenceType[Any]'] = []
+        self._lock = threading.Lock()
+        self._names: Optional[Dict[str, Any]] = None
+        # The text indexes of classes by the names used in references.
+        self._text_indexes: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, enum_cls: Any) -> None:
+        """Register an enumeration class, it is called when the class is created."""
+        with self._lock:
+            self._classes.append(weakref.ref(enum_cls))
+            # The names are taken when the index is built: the functional API sets them after creating the class.
+            self._names = None
+            self._text_indexes = {}
+
+    def get_class(self, name: str) -> Any:
+        """
+        Get a registered enumeration class with members by `qualname` or `module.qualname`.
+
+        Args:
+            name: The qualified or the full name of the class.
+
+        Returns:
+            The enumeration class.
+
+        Raises:
+            ValueError: The class is not registered.
+            AmbiguousNameError: Several classes have the qualified name.
+        """  # noqa: DAR402
+        enum_cls = self._find_class(name)
+        if enum_cls is None:
+            raise ValueError(f'{name!r} is not a registered enumeration')
+        return enum_cls
+
+    def resolve(self, reference: ReferenceType) -> 'ExtendedEnum':
+        """
+        Get the member by a tagged string `"qualname:value"` or a pair `(qualname, value)`.
+
+        Args:
+            reference: A tagged string or a pair, the class is named by `qualname` or `module.qualname`.
+
+        Returns:
+            The member.
+
+        Raises:
+            ValueError: The class is not registered or the value does not belong to it.
+            AmbiguousNameError: Several classes have the qualified name of the reference.
+        """  # noqa: DAR402
+        member = self._resolve(reference, _NOT_FOUND)
+        if member is _NOT_FOUND:
+            raise ValueError(f'{reference!r} is not a valid reference to a member')
+        return member  # type: ignore[no-any-return]
+
+    def resolve_many(
+        self,
+        references: Iterable[ReferenceType],
+        errors: 'ErrorsPolicyType' = 'raise',
+        default: Any = None,
+    ) -> List[Any]:
+        """
+        Get the members for references to members of different enumerations in one pass.
+
+        Args:
+            references: Tagged strings or pairs.
+            errors: What to do with a reference that cannot be resolved, as in `ExtendedEnum.parse_many`.
+            default: The value that replaces invalid references.
+
+        Returns:
+            A list of members in the order of references.
+
+        Raises:
+            ValueError: Unknown error policy or an invalid reference when `errors='raise'`.
+            AmbiguousNameError: Several classes have the qualified name of a reference, whatever the error policy.
+        """  # noqa: DAR402
+        if errors not in {'raise', 'collect', 'default'}:
+            raise ValueError(f'{errors!r} is not a valid error policy')
+
+        resolve = self._resolve
+        members = []
+        for reference in references:
+            member = resolve(reference, _NOT_FOUND)
+            if member is _NOT_FOUND and errors == 'raise':
+                raise ValueError(f'{reference!r} is not a valid reference to a member')
+            members.append(member)
+        _replace_invalid(members, errors, default)
+        return members
+
+    def _find_class(self, name: str) -> Any:
+        names = self._names
+        if names is None:
+            names = self._index_names()
+        enum_cls = names.get(name)
+        if isinstance(enum_cls, list):
+            raise AmbiguousNameError(f'{name!r} is ambiguous, use one of: {", ".join(enum_cls)}')
+        return enum_cls
+
+    def _resolve(self, reference: ReferenceType, default: Any) -> Any:
+        if isinstance(reference, str):
+            return self._resolve_tagged(reference, default)
+        return self._resolve_pair(reference, default)
+
+    def _resolve_tagged(self, reference: str, default: Any) -> Any:
+        name, separator, text = reference.partition(':')
+        if not separator:
+            return default
+        text_index = self._get_text_index(name)
+        if text_index is None:
+            return default
+        return text_index.get(text, default)
+
+    def _resolve_pair(self, reference: Any, default: Any) -> Any:
+        try:
+            name, lookup_value = reference
+        except (TypeError, ValueError):
+            return default
+        enum_cls = self._find_class(name) if isinstance(name, str) else None
+        if enum_cls is None:
+            return default
+        member = enum_cls.get(lookup_value, _NOT_FOUND)
+        if member is _NOT_FOUND and isinstance(lookup_value, str):
+            member = _get_text_index(enum_cls).get(lookup_value, _NOT_FOUND)
+        return default if member is _NOT_FOUND else member
+
+    def _get_text_index(self, name: str) -> Optional[Dict[str, Any]]:
+        # A class added meanwhile replaces the dictionary, so a stale text index is not kept.
+        text_indexes = self._text_indexes
+        text_index = text_indexes.get(name)
+        if text_index is None:
+            enum_cls = self._find_class(name)
+            if enum_cls is None:
+                return None
+            text_index = _get_text_index(enum_cls)
+            text_indexes[name] = text_index
+        return text_index
+
+    def _index_names(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._names is None:
+                referents = [class_ref() for class_ref in self._classes]
+                classes = [enum_cls for enum_cls in referents if enum_cls is not None]
+                self._classes = [weakref.ref(enum_cls) for enum_cls in classes]
+                self._names = _index_class_names(classes)
+            return self._names
+
+
+def to_tagged(member: 'ExtendedEnum') -> str:
+    """
+    Get the tagged string `"module.qualname:value"` of a member, it is resolved by `registry.resolve`.
+
+    The full name of the class keeps the tag valid when another module defines an enumeration with the same name.
+    """
+    return f'{_get_full_name(member.__class__)}:{member.value}'
+
+
+def _get_full_name(enum_cls: Any) -> str:
+    return f'{enum_cls.__module__}.{enum_cls.__qualname__}'
+
+
+def _index_class_names(classes: List[Any]) -> Dict[str, Any]:
+    # Classes without members are not registered, a class replaces a previous class with the same full name.
+    full_names = {_get_full_name(enum_cls): enum_cls for enum_cls in filter(len, classes)}
+    names: Dict[str, Any] = dict(full_names)
+    for qualname, candidates in _group_by_qualname(full_names).items():
+        # An ambiguous qualified name refers to the list of the full names of the candidates.
+        unique_cls = full_names[candidates[0]]
+        names.setdefault(qualname, unique_cls if len(candidates) == 1 else candidates)
+    return names
+
+
+def _group_by_qualname(full_names: Dict[str, Any]) -> Dict[str, List[str]]:
+    qualnames: Dict[str, List[str]] = {}
+    for full_name, enum_cls in full_names.items():
+        qualnames.setdefault(enum_cls.__qualname__, []).append(full_name)
+    return qualnames
+
+
+def _replace_invalid(members: List[Any], errors: str, default: Any) -> None:
+    from extended_enum import InvalidValuesError  # noqa: WPS433
+
+    positions = [position for position, member in enumerate(members) if member is _NOT_FOUND]
+    for position in positions:
+        members[position] = default
+    if positions and errors == 'collect':
+        raise InvalidValuesError(
+            f'{len(positions)} references are not valid, positions: {positions}',
+            positions=positions,
+            members=members,
+        )
+
+
+def _get_text_index(enum_cls: Any) -> Dict[str, Any]:
+    text_index = enum_cls.__dict__.get('_text2member')
+    if text_index is None:
+        text_index = enum_cls._set_cache('_text2member', lambda: _index_texts(enum_cls))  # noqa: WPS437
+    return text_index  # type: ignore[no-any-return]
+
+
+def _index_texts(enum_cls: Any) -> Dict[str, Any]:
+    # String values take precedence over the texts of other values, e.g. '1' over 1, so they are indexed last.
+    members = sorted(enum_cls, key=_has_string_value)
+    return {str(member.value): member for member in members}
+
+
+def _has_string_value(member: Any) -> bool:
+    return isinstance(member.value, str)
+
+
+registry = EnumRegistry()
@@ -0,0 +1,53 @@
+"""Helpers for serializing enumeration members with precomputed JSON values."""
+import json
+from typing import Any, Union
+
+from extended_enum import ExtendedEnum
+
+
+def json_default(obj: Any) -> Union[int, str]:
+    """
+    Convert an enumeration member to a JSON type, for use as the `default` hook of `json.dumps`.
+
+    The result is precomputed when the member is created, UUID values are already converted to strings.
+
+    Examples:
+        ```python
+        import json
+        from extended_enum.serialization import json_default
+
+        json.dumps({'file_extension': CompressedFileExtension.ZIP}, default=json_default)
+        ```
+
+    Args:
+        obj: An object that the JSON encoder cannot serialize.
+
+    Returns:
+        The value of the enumeration member as a JSON type.
+
+    Raises:
+        TypeError: The object is not a member of an ExtendedEnum.
+    """
+    if isinstance(obj, ExtendedEnum):
+        return obj._json_value  # noqa: WPS437
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+
+class ExtendedEnumJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder that serializes enumeration members by their precomputed JSON values.
+
+    Examples:
+        ```python
+        import json
+        from extended_enum.serialization import ExtendedEnumJSONEncoder
+
+        json.dumps({'file_extension': CompressedFileExtension.ZIP}, cls=ExtendedEnumJSONEncoder)
+        ```
+    """
+
+    def default(self, o: Any) -> Any:  # noqa: WPS111
+        """Convert an enumeration member to a JSON type."""
+        if isinstance(o, ExtendedEnum):
+            return o._json_value  # noqa: WPS437
+        return super().default(o)
@@ -0,0 +1,262 @@
+"""A set of enumeration members stored as a bitmask indexed by member ordinals."""
+from collections.abc import Set
+from typing import AbstractSet, Any, Generic, Iterable, Iterator, Type
+
+from extended_enum import ExtendedEnumType
+
+
+class ExtendedEnumSet(Set, Generic[ExtendedEnumType]):
+    """
+    An immutable set of members of one enumeration.
+
+    The set is stored as a single integer in which bit N is set if the member with ordinal N is in the set,
+    so membership tests and set algebra do not hash members.
+    `int(members)` gives the compact form of the set, `ExtendedEnumSet.from_int` restores it.
+
+    Examples:
+        ```python
+        from extended_enum import ExtendedEnum, EnumField
+        from extended_enum.sets import ExtendedEnumSet
+
+        class Permission(ExtendedEnum):
+            READ = EnumField('read')
+            WRITE = EnumField('write')
+            DELETE = EnumField('delete')
+
+        allowed = ExtendedEnumSet(Permission, [Permission.READ, Permission.WRITE])
+        assert Permission.READ in allowed
+        assert allowed - ExtendedEnumSet.from_values(Permission, ['write']) == {Permission.READ}
+        assert ExtendedEnumSet.from_int(Permission, int(allowed)) == allowed
+        ```
+    """
+
+    __slots__ = ('_enum_cls', '_mask')
+
+    def __init__(self, enum_cls: Type[ExtendedEnumType], members: Iterable[ExtendedEnumType] = ()) -> None:
+        """
+        Initialize a set of members.
+
+        Args:
+            enum_cls: Enumeration class.
+            members: Members of the enumeration.
+        """
+        self._enum_cls = enum_cls
+        self._mask = self._to_mask(members)
+
+    def __contains__(self, member: Any) -> bool:
+        """Check if the member is in the set."""
+        # Enumerations with members cannot be subclassed, so only members are instances.
+        if not isinstance(member, self._enum_cls):
+            return False
+        return bool(self._mask >> member.ordinal & 1)
+
+    def __iter__(self) -> Iterator[ExtendedEnumType]:
+        """Iterate over the members in the definition order."""
+        mask = self._mask
+        ordinals = []
+        while mask:
+            lowest_bit = mask & -mask  # noqa: WPS465
+            ordinals.append(lowest_bit.bit_length() - 1)
+            mask ^= lowest_bit
+        return iter(self._enum_cls.from_ordinals(ordinals))
+
+    def __len__(self) -> int:
+        """Get the number of members in the set."""
+        return _count_bits(self._mask)
+
+    def __bool__(self) -> bool:
+        """Check if the set is not empty."""
+        return bool(self._mask)
+
+    def __int__(self) -> int:
+        """Get the bitmask of the set."""
+        return self._mask
+
+    def __hash__(self) -> int:
+        """Get the hash of the set, it is equal to the hash of a frozenset of the same members."""
+        return self._hash()
+
+    def __eq__(self, other: Any) -> bool:
+        """Check if the sets are equal."""
+        if isinstance(other, ExtendedEnumSet):
+            return self._enum_cls is other.enum_cls and self._mask == int(other)
+        return super().__eq__(other)
+
+    def __le__(self, other: Any) -> bool:
+        """Check if the set is a subset of the other set."""
+        if isinstance(other, ExtendedEnumSet) and self._enum_cls is other.enum_cls:
+            return (self._mask & int(other)) == self._mask
+        return super().__le__(other)
+
+    def __ge__(self, other: Any) -> bool:
+        """Check if the set is a superset of the other set."""
+        if isinstance(other, ExtendedEnumSet) and self._enum_cls is other.enum_cls:
+            return (self._mask & int(other)) == int(other)
+        return super().__ge__(other)
+
+    def __or__(self, other: Any) -> AbstractSet[Any]:
+        """Get the union of the sets, it is a frozenset if the other set contains objects that are not members."""
+        if not isinstance(other, Set):
+            return NotImplemented
+        mask = self._to_mask(other, strict=False)
+        if _count_bits(mask) != len(other):
+            return super().__or__(other)
+        return self._from_mask(self._mask | mask)
+
+    def __ror__(self, other: Any) -> AbstractSet[Any]:
+        """Get the union of the sets."""
+        return self.__or__(other)  # noqa: WPS609
+
+    def __and__(self, other: Any) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """Get the intersection of the sets."""
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __rand__(self, other: Any) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """Get the intersection of the sets."""
+        return self.__and__(other)  # noqa: WPS609
+
+    def __sub__(self, other: Any) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """Get the difference of the sets."""
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other: Any) -> AbstractSet[Any]:
+        """
+        Get the symmetric difference of the sets.
+
+        It is a frozenset if the other set contains objects that are not members.
+        """
+        if not isinstance(other, Set):
+            return NotImplemented
+        mask = self._to_mask(other, strict=False)
+        if _count_bits(mask) != len(other):
+            return super().__xor__(other)
+        return self._from_mask(self._mask ^ mask)
+
+    def __rxor__(self, other: Any) -> AbstractSet[Any]:
+        """Get the symmetric difference of the sets."""
+        return self.__xor__(other)  # noqa: WPS609
+
+    def __repr__(self) -> str:
+        """Get the representation of the set."""
+        enum_name = self._enum_cls.__qualname__
+        members = ', '.join(f'{enum_name}.{member.name}' for member in self)  # noqa: WPS221
+        class_name = self.__class__.__qualname__
+        return f'{class_name}({enum_name}, {{{members}}})'
+
+    def __reduce__(self) -> Any:  # noqa: WPS603
+        """Pickle the set as the enumeration class and the bitmask."""
+        return self.__class__.from_int, (self._enum_cls, self._mask)
+
+    @property
+    def enum_cls(self) -> Type[ExtendedEnumType]:
+        """Get the enumeration class of the members."""
+        return self._enum_cls
+
+    @classmethod
+    def from_values(
+        cls,
+        enum_cls: Type[ExtendedEnumType],
+        values: Iterable[Any],
+    ) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """
+        Create a set from simple or extended values.
+
+        Args:
+            enum_cls: Enumeration class.
+            values: Simple or extended values, as accepted by `enum_cls(value)`.
+
+        Returns:
+            A set of members.
+
+        Raises:
+            ValueError: Some value does not belong to the enumeration.
+        """  # noqa: DAR402
+        return cls(enum_cls, enum_cls.parse_many(values))
+
+    @classmethod
+    def from_int(cls, enum_cls: Type[ExtendedEnumType], mask: int) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """
+        Create a set from its bitmask.
+
+        Args:
+            enum_cls: Enumeration class.
+            mask: The bitmask created by `int(members)`.
+
+        Returns:
+            A set of members.
+
+        Raises:
+            ValueError: The bitmask contains bits that do not correspond to any member.
+        """
+        if mask < 0 or mask >> len(enum_cls):
+            raise ValueError(f'{mask!r} is not a valid bitmask of {enum_cls.__qualname__}')
+        enum_set = cls.__new__(cls)
+        enum_set._enum_cls = enum_cls  # noqa: WPS437
+        enum_set._mask = mask  # noqa: WPS437
+        return enum_set
+
+    @classmethod
+    def all(cls, enum_cls: Type[ExtendedEnumType]) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """Create a set of all members of the enumeration."""
+        return cls.from_int(enum_cls, (1 << len(enum_cls)) - 1)
+
+    def union(self, *others: Iterable[ExtendedEnumType]) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """Get the union of the set and the other sets or iterables of members."""
+        mask = self._mask
+        for other in others:
+            mask |= self._to_mask(other)
+        return self._from_mask(mask)
+
+    def intersection(self, *others: Iterable[ExtendedEnumType]) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """Get the intersection of the set and the other sets or iterables of members."""
+        mask = self._mask
+        for other in others:
+            mask &= self._to_mask(other, strict=False)
+        return self._from_mask(mask)
+
+    def difference(self, *others: Iterable[ExtendedEnumType]) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        """Get the members of the set that are not in the other sets or iterables of members."""
+        mask = self._mask
+        for other in others:
+            mask &= ~self._to_mask(other, strict=False)
+        return self._from_mask(mask)
+
+    def _from_iterable(self, iterable: Iterable[Any]) -> frozenset:
+        # Used by the operators of `collections.abc.Set`, whose results may contain objects that are not members.
+        return frozenset(iterable)
+
+    def _from_mask(self, mask: int) -> 'ExtendedEnumSet[ExtendedEnumType]':
+        return self.__class__.from_int(self._enum_cls, mask)
+
+    def _to_mask(self, members: Iterable[Any], strict: bool = True) -> int:
+        """
+        Get the bitmask of the members.
+
+        Args:
+            members: Members of the enumeration.
+            strict: Raise TypeError for objects that are not members of the enumeration, otherwise skip them.
+
+        Returns:
+            The bitmask.
+
+        Raises:
+            TypeError: An object is not a member of the enumeration.
+        """
+        if isinstance(members, ExtendedEnumSet) and members.enum_cls is self._enum_cls:
+            return int(members)
+
+        mask = 0
+        for member in members:
+            if isinstance(member, self._enum_cls):
+                mask |= 1 << member.ordinal
+            elif strict:
+                raise TypeError(f'{member!r} is not a member of {self._enum_cls.__qualname__}')
+        return mask
+
+
+def _count_bits(mask: int) -> int:
+    return bin(mask).count('1')
@@ -0,0 +1,239 @@
+"""Streaming decoding of a column of enumeration values in JSON Lines and CSV data."""
+import csv
+import io
+import json
+from contextlib import ExitStack
+from itertools import count, islice, repeat
+from typing import (  # noqa: WPS235
+    Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Type, Union,
+)
+
+from extended_enum import ExtendedEnum
+
+StreamErrorsPolicyType = Literal['raise', 'skip', 'default']
+ColumnType = Union[str, int]
+RecordType = Union[Dict[str, Any], List[Any]]
+
+DEFAULT_CHUNK_SIZE = 10000
+
+_INVALID = object()
+
+
+def decode_jsonl(  # noqa: WPS211
+    enum_cls: Type[ExtendedEnum],
+    stream: Iterable[Union[str, bytes]],
+    column: str,
+    errors: StreamErrorsPolicyType = 'raise',
+    default: Any = None,
+    converter: Optional[Callable[[Any], Any]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Decode JSON Lines records, replacing the value in the column with the enumeration member.
+
+    Records are decoded in chunks, so memory usage does not depend on the size of the stream.
+    Empty lines are skipped. A line that is not a JSON object is an invalid record,
+    with `errors='default'` it is returned unchanged, since it has no value to replace.
+
+    Examples:
+        ```python
+        with open('events.jsonl', 'rb') as stream:
+            for record in decode_jsonl(EventType, stream, column='type', errors='skip'):
+                handle(record['type'])
+        ```
+
+    Args:
+        enum_cls: Enumeration class.
+        stream: A text or binary stream, or any iterable of lines.
+        column: The key of the value in each record.
+        errors: What to do with a record whose value does not belong to the enumeration.
+                `raise` - raise ValueError, `skip` - skip the record, `default` - replace the value with `default`.
+        default: The value that replaces invalid values.
+        converter: A function applied to each raw value before decoding, e.g. `UUID`.
+                   Values that it cannot convert (ValueError, TypeError) are treated as invalid.
+        chunk_size: The number of records decoded at once.
+
+    Returns:
+        An iterator over records.
+    """
+    _check_arguments(errors, chunk_size)
+    records = (json.loads(line) for line in stream if line.strip())
+    return _decode_records(enum_cls, records, column, errors, default, converter, chunk_size)
+
+
+def decode_csv(  # noqa: WPS211
+    enum_cls: Type[ExtendedEnum],
+    stream: Iterable[Union[str, bytes]],
+    column: ColumnType,
+    errors: StreamErrorsPolicyType = 'raise',
+    default: Any = None,
+    converter: Optional[Callable[[str], Any]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **fmtparams: Any,
+) -> Iterator[RecordType]:
+    """
+    Decode CSV rows, replacing the value in the column with the enumeration member.
+
+    Rows are decoded in chunks, so memory usage does not depend on the size of the stream.
+    CSV values are strings, pass `converter` (e.g. `int` or `UUID`) for members with values of other types.
+    A row without the column has an invalid value, with `errors='default'` a short row is padded with None
+    (as `csv.DictReader` fills missing fields). Empty lines are skipped.
+
+    Examples:
+        ```python
+        with open('events.csv', newline='') as stream:
+            for row in decode_csv(EventType, stream, column='type', errors='default'):
+                handle(row['type'])
+        ```
+
+    Args:
+        enum_cls: Enumeration class.
+        stream: A text stream, a binary stream (UTF-8) or any iterable of lines (str or UTF-8 bytes).
+        column: The name of the column (rows are dictionaries, the first line is the header)
+                or its index (rows are lists).
+        errors: What to do with a row whose value does not belong to the enumeration.
+                `raise` - raise ValueError, `skip` - skip the row, `default` - replace the value with `default`.
+        default: The value that replaces invalid values.
+        converter: A function applied to each raw value before decoding.
+                   Values that it cannot convert (ValueError, TypeError) are treated as invalid.
+        chunk_size: The number of rows decoded at once.
+        fmtparams: Formatting parameters of `csv.reader`.
+
+    Returns:
+        An iterator over rows.
+    """
+    _check_arguments(errors, chunk_size)
+    return _decode_csv(enum_cls, stream, column, errors, default, converter, chunk_size, fmtparams)
+
+
+def _check_arguments(errors: str, chunk_size: int) -> None:
+    if errors not in {'raise', 'skip', 'default'}:
+        raise ValueError(f'{errors!r} is not a valid error policy')
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size must be positive, got {chunk_size!r}')
+
+
+def _decode_csv(  # noqa: WPS211
+    enum_cls: Type[ExtendedEnum],
+    stream: Iterable[Union[str, bytes]],
+    column: ColumnType,
+    errors: StreamErrorsPolicyType,
+    default: Any,
+    converter: Optional[Callable[[str], Any]],
+    chunk_size: int,
+    fmtparams: Dict[str, Any],
+) -> Iterator[RecordType]:
+    with ExitStack() as exit_stack:
+        lines: Iterable[str]
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            lines = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+            # Do not close the stream of the caller together with the wrapper.
+            exit_stack.callback(lines.detach)
+        else:
+            lines = map(_to_text, stream)
+        if isinstance(column, str):
+            rows: Iterator[Any] = csv.DictReader(lines, **fmtparams)
+        else:
+            rows = (row for row in csv.reader(lines, **fmtparams) if row)
+        yield from _decode_records(enum_cls, rows, column, errors, default, converter, chunk_size)
+
+
+def _decode_records(  # noqa: WPS211
+    enum_cls: Type[ExtendedEnum],
+    records: Iterator[Any],
+    column: ColumnType,
+    errors: StreamErrorsPolicyType,
+    default: Any,
+    converter: Optional[Callable[[Any], Any]],
+    chunk_size: int,
+) -> Iterator[Any]:
+    for record, member, index in _iter_decoded(enum_cls, records, column, converter, chunk_size):
+        if member is not _INVALID:
+            _set_value(record, column, member)
+            yield record
+        elif _apply_error_policy(enum_cls, record, column, errors, default, index):
+            yield record
+
+
+def _iter_decoded(
+    enum_cls: Type[ExtendedEnum],
+    records: Iterator[Any],
+    column: ColumnType,
+    converter: Optional[Callable[[Any], Any]],
+    chunk_size: int,
+) -> Iterator[Tuple[Any, Any, int]]:
+    """Decode records in chunks, yield each record with its member (or `_INVALID`) and its position."""
+    positions = count()
+    chunk = list(islice(records, chunk_size))
+    while chunk:
+        # The counter is the last, so that it is not advanced past the end of the chunk.
+        yield from zip(chunk, _decode_chunk(enum_cls, chunk, column, converter), positions)
+        chunk = list(islice(records, chunk_size))
+
+
+def _decode_chunk(
+    enum_cls: Type[ExtendedEnum],
+    chunk: List[Any],
+    column: ColumnType,
+    converter: Optional[Callable[[Any], Any]],
+) -> List[Any]:
+    values = [_get_value(record, column) for record in chunk]
+    if converter is not None:
+        values = [_convert(converter, value) for value in values]
+    return enum_cls.parse_many(values, errors='default', default=_INVALID)
+
+
+def _apply_error_policy(  # noqa: WPS211
+    enum_cls: Type[ExtendedEnum],
+    record: Any,
+    column: ColumnType,
+    errors: StreamErrorsPolicyType,
+    default: Any,
+    index: int,
+) -> bool:
+    """Handle a record with an invalid value, return whether it is kept."""
+    value = _get_value(record, column)
+    if errors == 'raise':
+        if value is _INVALID:
+            raise ValueError(f'{record!r} is not a record with the {column!r} column (record {index})')
+        raise ValueError(f'{value!r} is not a valid {enum_cls.__qualname__} (record {index})')
+    # A record that is not an object or a row has no value to replace.
+    if errors == 'default' and value is not _INVALID:
+        _set_value(record, column, default)
+    return errors == 'default'
+
+
+def _get_value(record: Any, column: ColumnType) -> Any:
+    if isinstance(record, dict):
+        return record.get(column)
+    if isinstance(record, list) and isinstance(column, int):
+        in_range = -len(record) <= column < len(record)
+        return record[column] if in_range else None
+    return _INVALID
+
+
+def _set_value(record: RecordType, column: ColumnType, member: Any) -> None:
+    if isinstance(record, list):
+        _pad_row(record, column)  # type: ignore[arg-type]
+    record[column] = member  # type: ignore[index]
+
+
+def _pad_row(row: List[Any], column: int) -> None:
+    # Pad a short row with None, as csv.DictReader fills missing fields.
+    if column >= 0:
+        row.extend(repeat(None, column + 1 - len(row)))
+    else:
+        row[:0] = repeat(None, -column - len(row))  # noqa: WPS362
+
+
+def _to_text(line: Union[str, bytes]) -> str:
+    return line.decode('utf-8') if isinstance(line, bytes) else line
+
+
+def _convert(converter: Callable[[Any], Any], value: Any) -> Any:
+    if value is _INVALID:
+        return value
+    try:
+        return converter(value)
+    except (TypeError, ValueError):
+        return _INVALID
@@ -1,33 +1,199 @@
 # noqa: D100
-from typing import Any, get_origin, Literal, get_args
+from functools import lru_cache
+from typing import Any, Dict, get_origin, Iterable, Literal, get_args, NoReturn, Protocol, Tuple, Union  # noqa: WPS235
+from uuid import UUID
 
-from extended_enum import ExtendedEnum, BaseExtendedEnumValue
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, SimpleValueType
+
+# The number of rendered descriptions kept by `format_to_markdown`, the least recently used one is evicted.
+MARKDOWN_CACHE_SIZE = 256
+# The number of schemas kept by `to_json_schema`, the least recently used one is evicted.
+JSON_SCHEMA_CACHE_SIZE = 256
+# The delimiter, the prefix and the value wrap of the descriptions stored by `extended_enum.freeze`.
+_DEFAULT_MARKDOWN_FORMATTING = ('\n', '*', '`')
+
+# An enumeration class or the members of a Literal.
+EnumSourceType = Union[type, Tuple[ExtendedEnum, ...]]
+
+
+class SupportsWrite(Protocol):
+    """A text file-like object."""
+
+    def write(self, text: str) -> Any:  # noqa: D102
+        ...  # noqa: WPS428
+
+
+def _forbid_change(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError('A cached JSON Schema cannot be changed, change a copy of it made with `copy.deepcopy`')
+
+
+class _ReadOnlyDict(dict):  # noqa: WPS600
+    """A subschema of a cached JSON Schema, JSON encoders write it as an ordinary dictionary."""
+
+    __setitem__ = _forbid_change
+    __delitem__ = _forbid_change
+    __ior__ = _forbid_change
+    clear = _forbid_change
+    pop = _forbid_change
+    popitem = _forbid_change
+    setdefault = _forbid_change
+    update = _forbid_change
+
+    def __reduce__(self) -> Any:  # noqa: WPS603
+        # Copies are ordinary dictionaries, which can be changed.
+        return dict, (dict(self),)
 
 
 def format_to_markdown(enum_cls: Any, delimiter: str = '\n', prefix: str = '*', value_wrap: str = '`') -> str:
-    """Convert ExtendedEnum to a markdown string."""
-    if get_origin(enum_cls) is not Literal and issubclass(enum_cls, ExtendedEnum):
-        extended_values = enum_cls.get_extended_values()
-    else:
-        extended_values = (
-            member.extended_value
-            for member in get_args(enum_cls)
-            if isinstance(member, ExtendedEnum)
-        )
+    """
+    Convert ExtendedEnum to a markdown string.
 
-    items = (
-        format_value_to_markdown(extended_value=value, prefix=prefix, value_wrap=value_wrap)
-        for value in extended_values
-    )
-    return delimiter.join(items)
+    The result is cached for the enumeration class (or the members of a Literal) and the formatting arguments.
+    """
+    return _format_to_markdown(_get_enum_source(enum_cls), delimiter, prefix, value_wrap)
+
+
+def write_markdown(
+    enum_cls: Any,
+    output: SupportsWrite,
+    delimiter: str = '\n',
+    prefix: str = '*',
+    value_wrap: str = '`',
+) -> None:
+    """
+    Write the markdown string of ExtendedEnum to a file-like object member by member.
+
+    Unlike `format_to_markdown`, the whole string is not built in memory.
+
+    Args:
+        enum_cls: Enumeration class or a Literal of its members.
+        output: Text file-like object.
+        delimiter: The string between members.
+        prefix: The prefix of each member.
+        value_wrap: The string around each value.
+    """
+    source = _get_enum_source(enum_cls)
+    markdown = _get_frozen_markdown(source, delimiter, prefix, value_wrap)
+    if markdown is not None:
+        output.write(markdown)
+        return
+    for index, extended_value in enumerate(_get_extended_values(source)):
+        if index:
+            output.write(delimiter)
+        output.write(format_value_to_markdown(extended_value=extended_value, prefix=prefix, value_wrap=value_wrap))
+
+
+def to_json_schema(enum_cls: Any) -> Dict[str, Any]:
+    """
+    Get the JSON Schema of ExtendedEnum or a Literal of its members.
+
+    The schema contains the simple values (aliases are skipped), their types and a subschema for each member
+    with its name and the description of `ValueWithDescription`. UUID values are written as strings.
+    The schema is cached for the enumeration class (or the members of a Literal). Each call returns
+    a new top-level dictionary, which can be modified, while its arrays (tuples) and member subschemas
+    are shared by all calls and cannot be modified (`copy.deepcopy` makes a modifiable copy of them).
+
+    Examples:
+        ```python
+        assert to_json_schema(Literal[MixedEnum.CONST1, MixedEnum.CONST8]) == {
+            'type': ('string', 'integer'),
+            'enum': ('const1', 3),
+            'anyOf': (
+                {'const': 'const1', 'title': 'CONST1'},
+                {'const': 3, 'title': 'CONST8', 'description': 'some const8 description'},
+            ),
+        }
+        ```
+
+    Args:
+        enum_cls: Enumeration class or a Literal of its members.
+
+    Returns:
+        JSON Schema, with `title` for an enumeration class.
+    """
+    return dict(_to_json_schema(_get_enum_source(enum_cls)))
 
 
 def format_value_to_markdown(extended_value: BaseExtendedEnumValue, prefix: str = '*', value_wrap: str = '`') -> str:
     """Convert ExtendedEnum member to a markdown string."""
     description = ''
-    if hasattr(extended_value, 'description') and extended_value.description is not None:  # noqa: WPS421
-        description = ' — {description}'.format(description=extended_value.description)
+    value_description = getattr(extended_value, 'description', None)
+    if value_description is not None:
+        description = ' — {description}'.format(description=value_description)
     if prefix:
         prefix = f'{prefix} '
     value = ''.join((value_wrap, str(extended_value.value), value_wrap))
     return ''.join((prefix, value, description))
+
+
+@lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def _format_to_markdown(source: EnumSourceType, delimiter: str, prefix: str, value_wrap: str) -> str:
+    markdown = _get_frozen_markdown(source, delimiter, prefix, value_wrap)
+    if markdown is not None:
+        return markdown
+    items = (
+        format_value_to_markdown(extended_value=value, prefix=prefix, value_wrap=value_wrap)
+        for value in _get_extended_values(source)
+    )
+    return delimiter.join(items)
+
+
+@lru_cache(maxsize=JSON_SCHEMA_CACHE_SIZE)
+def _to_json_schema(source: EnumSourceType) -> Dict[str, Any]:
+    members = source if isinstance(source, tuple) else tuple(source)  # type: ignore[call-overload]
+    member_schemas = tuple(_member_to_json_schema(member) for member in members)
+    schema: Dict[str, Any] = {}
+    if not isinstance(source, tuple):
+        schema['title'] = source.__name__
+    schema.update(_get_json_types(members))
+    # A string and a UUID member can have the same value in JSON.
+    json_values = (member_schema['const'] for member_schema in member_schemas)
+    schema['enum'] = tuple(dict.fromkeys(json_values))
+    schema['anyOf'] = member_schemas
+    return schema
+
+
+def _get_json_types(members: Tuple[ExtendedEnum, ...]) -> Dict[str, Any]:
+    types = tuple(dict.fromkeys(_get_json_type(member.value) for member in members))
+    schema: Dict[str, Any] = {}
+    if types:
+        schema['type'] = types[0] if len(types) == 1 else types
+    if members and all(isinstance(member.value, UUID) for member in members):
+        schema['format'] = 'uuid'
+    return schema
+
+
+def _get_json_type(value: SimpleValueType) -> str:
+    return 'integer' if isinstance(value, int) else 'string'
+
+
+def _member_to_json_schema(member: ExtendedEnum) -> Dict[str, Any]:
+    schema = {'const': _to_json_value(member.value), 'title': member.name}
+    description = getattr(member.extended_value, 'description', None)
+    if description is not None:
+        schema['description'] = description
+    return _ReadOnlyDict(schema)
+
+
+def _to_json_value(value: SimpleValueType) -> Any:
+    return str(value) if isinstance(value, UUID) else value
+
+
+def _get_enum_source(enum_cls: Any) -> EnumSourceType:
+    if get_origin(enum_cls) is not Literal and issubclass(enum_cls, ExtendedEnum):
+        return enum_cls  # type: ignore[no-any-return]
+    # Literals with the same members in a different order are equal, so the members are the key of the cache.
+    return tuple(member for member in get_args(enum_cls) if isinstance(member, ExtendedEnum))
+
+
+def _get_frozen_markdown(source: EnumSourceType, delimiter: str, prefix: str, value_wrap: str) -> Any:
+    if isinstance(source, tuple) or _DEFAULT_MARKDOWN_FORMATTING != (delimiter, prefix, value_wrap):
+        return None
+    # Modules generated by `extended_enum.freeze` store the description with the default formatting.
+    return source.__dict__.get('_markdown')
+
+
+def _get_extended_values(source: EnumSourceType) -> Iterable[BaseExtendedEnumValue]:
+    if isinstance(source, tuple):
+        return (member.extended_value for member in source)
+    return source.get_extended_values()  # type: ignore[attr-defined, no-any-return]
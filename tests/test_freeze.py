@@ -0,0 +1,216 @@
+import importlib.util
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Type
+from uuid import UUID
+
+import pytest
+
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, EnumField
+from extended_enum.freeze import freeze, main
+from extended_enum.tools import format_to_markdown
+
+
+class BaseEnumWithMethod(ExtendedEnum):
+    """An enumeration without members that is used as a base class."""
+
+    def get_label(self) -> str:
+        """Get the label of the member."""
+        return f'label {self.value}'
+
+
+class MixedEnum(BaseEnumWithMethod):
+    """A combined enumeration with an alias."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(ValueWithDescription(value=2, description="it's a description — 2"))
+    CONST3 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+    ALIAS1 = EnumField('const1')
+
+
+class SameValueClassEnum(BaseEnumWithMethod):
+    """An enumeration whose extended values have the same class."""
+
+    CONST1 = EnumField(ValueWithDescription(value='const1', description='description 1'))
+    CONST2 = EnumField(ValueWithDescription(value=UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83')))
+
+
+class DifferentValueClassesEnum(ExtendedEnum):
+    """An enumeration whose extended values have different classes."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(ValueWithDescription(value=2, description='description 2'))
+
+
+class EmptyEnum(ExtendedEnum):
+    """An enumeration without members."""
+
+
+def load_module(path: Path) -> ModuleType:
+    """Import a generated module from a file."""
+    spec = importlib.util.spec_from_file_location(f'frozen_{path.stem}', path)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+@pytest.mark.parametrize('enum_cls', [MixedEnum, EmptyEnum])
+def test_freeze(tmp_path: Path, enum_cls: Type[ExtendedEnum]):
+    """
+    Check generating a module from an enumeration.
+    Expected:
+        - The generated enumeration has the same members, values and description, the caches are set.
+    """
+
+    path = tmp_path / 'generated.py'
+    path.write_text(freeze(enum_cls), encoding='utf-8')
+    frozen_cls = getattr(load_module(path), enum_cls.__name__)
+
+    assert frozen_cls.__bases__ == enum_cls.__bases__
+    assert list(frozen_cls.__members__) == list(enum_cls.__members__)
+    assert [member.ordinal for member in frozen_cls] == [member.ordinal for member in enum_cls]
+    assert vars(frozen_cls)['_values'] == enum_cls.get_values()
+    assert vars(frozen_cls)['_extended_values'] == enum_cls.get_extended_values()
+    assert vars(frozen_cls)['_markdown'] == format_to_markdown(enum_cls)
+    assert format_to_markdown(frozen_cls, delimiter=';') == format_to_markdown(enum_cls, delimiter=';')
+    assert dict(frozen_cls.get_simple_value_member()).keys() == dict(enum_cls.get_simple_value_member()).keys()
+
+
+def test_frozen_members(tmp_path: Path):
+    """
+    Check the members of a generated enumeration.
+    Expected:
+        - Aliases refer to the original members, methods of the base class are inherited.
+    """
+
+    path = tmp_path / 'generated.py'
+    path.write_text(freeze(MixedEnum), encoding='utf-8')
+    frozen_cls = load_module(path).MixedEnum
+
+    assert frozen_cls.ALIAS1 is frozen_cls.CONST1
+    assert frozen_cls(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83')) is frozen_cls.CONST3
+    assert frozen_cls.CONST2.extended_value == ValueWithDescription(value=2, description="it's a description — 2")
+    assert frozen_cls.CONST2.get_label() == 'label 2'
+
+
+@pytest.mark.parametrize('enum_cls', [SameValueClassEnum, DifferentValueClassesEnum, EmptyEnum])
+def test_freeze_lazy(tmp_path: Path, enum_cls: Type[ExtendedEnum]):
+    """
+    Check generating a module with a lazy enumeration.
+    Expected:
+        - No members are created on import, the members, values and description are the same.
+    """
+
+    path = tmp_path / 'generated.py'
+    path.write_text(freeze(enum_cls, lazy=True), encoding='utf-8')
+    frozen_cls = getattr(load_module(path), enum_cls.__name__)
+
+    assert vars(frozen_cls)['_lazy_definitions'].missing == len(enum_cls)
+    assert frozen_cls.__bases__ == enum_cls.__bases__
+    assert vars(frozen_cls)['_values'] == enum_cls.get_values()
+    assert vars(frozen_cls)['_markdown'] == format_to_markdown(enum_cls)
+    assert frozen_cls.get_extended_values() == enum_cls.get_extended_values()
+    assert list(frozen_cls.__members__) == list(enum_cls.__members__)
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_freeze_invalid_names(tmp_path: Path, lazy: bool):
+    """
+    Check generating a module from an enumeration with member names that are not identifiers.
+    Expected:
+        - The generated module can be imported, the members have the same names and values.
+    """
+
+    enum_cls = BaseEnumWithMethod(
+        'CodeEnum',
+        [('004', EnumField('afn')), ('class', EnumField('cls')), ('US-D', EnumField('usd'))],
+        module=__name__,
+    )
+    path = tmp_path / 'generated.py'
+    path.write_text(freeze(enum_cls, lazy=lazy), encoding='utf-8')
+    frozen_cls = load_module(path).CodeEnum
+
+    assert frozen_cls.__bases__ == enum_cls.__bases__
+    assert list(frozen_cls.__members__) == ['004', 'class', 'US-D']
+    assert frozen_cls['US-D'] is frozen_cls('usd')
+    assert getattr(frozen_cls, 'class').get_label() == 'label cls'
+
+
+def test_freeze_invalid_names_several_bases():
+    """
+    Check generating a module from an enumeration with several bases and a name that is not an identifier.
+    Expected:
+        - ValueError.
+    """
+
+    enum_cls = ExtendedEnum('MixinCodeEnum', [('004', EnumField('afn'))], module=__name__, type=str)
+    assert len(enum_cls.__bases__) == 2
+    with pytest.raises(ValueError, match="the member '004' whose name is not an identifier"):
+        freeze(enum_cls)
+
+
+def test_freeze_lazy_aliases():
+    """
+    Check generating a module with a lazy enumeration from an enumeration with aliases.
+    Expected:
+        - ValueError.
+    """
+
+    with pytest.raises(ValueError, match='has aliases'):
+        freeze(MixedEnum, lazy=True)
+
+
+def test_freeze_from_file(tmp_path: Path, capsys: pytest.CaptureFixture):
+    """
+    Check generating a module from a data file on the command line.
+    Expected:
+        - The module is written to standard output or to a file.
+    """
+
+    records_path = tmp_path / 'currencies.csv'
+    records_path.write_text('name,value,description\nEUR,978,Euro\nUSD,840,\n', encoding='utf-8')
+    output_path = tmp_path / 'currencies.py'
+
+    main([str(records_path), '--name', 'Currency', '--converter', 'builtins:int'])
+    assert 'class Currency(ExtendedEnum):' in capsys.readouterr().out
+
+    main([str(records_path), '--name', 'Currency', '--converter', 'builtins:int', '-o', str(output_path)])
+    frozen_cls = load_module(output_path).Currency
+    assert frozen_cls(978).extended_value == ValueWithDescription(value=978, description='Euro')
+    assert frozen_cls(840).extended_value.description == ''
+
+
+@pytest.mark.parametrize(
+    'extended_value',
+    [
+        BaseExtendedEnumValue(value=float('nan')),  # type: ignore[arg-type]
+        ValueWithDescription(value='const1', description=object()),  # type: ignore[arg-type]
+    ]
+)
+def test_freeze_errors(extended_value: Any):
+    """
+    Check generating a module from an enumeration with values that are not literals.
+    Expected:
+        - TypeError.
+    """
+
+    enum_cls = ExtendedEnum('InvalidEnum', [('CONST1', extended_value)], module=__name__)
+    with pytest.raises(TypeError, match='as a literal'):
+        freeze(enum_cls)
+
+
+def test_freeze_local_class():
+    """
+    Check generating a module from an enumeration whose value class cannot be imported.
+    Expected:
+        - TypeError.
+    """
+
+    @dataclass(frozen=True)
+    class LocalValue(BaseExtendedEnumValue):
+        """A value class defined in a function."""
+
+    enum_cls = ExtendedEnum('LocalEnum', [('CONST1', LocalValue(value='const1'))], module=__name__)
+    with pytest.raises(TypeError, match='cannot be imported'):
+        freeze(enum_cls)
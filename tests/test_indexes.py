@@ -0,0 +1,210 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from uuid import UUID
+
+import pytest
+
+from extended_enum import (
+    ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, EnumField, index_by, index_normalized,
+)
+from extended_enum.lazy import lazy_enum
+
+
+@dataclass(frozen=True)
+class SomeExtendedEnumValue(BaseExtendedEnumValue):
+    """An extended value with additional fields."""
+
+    display_name: str = field(compare=False)
+    legacy_code: Optional[int] = field(default=None, compare=False)
+
+
+@index_by('display_name', 'legacy_code')
+class DetailedEnum(ExtendedEnum):
+    """An enumeration indexed by fields of its extended values."""
+
+    CONST1 = EnumField(SomeExtendedEnumValue(value='const1', display_name='ONE', legacy_code=1))
+    CONST2 = EnumField(SomeExtendedEnumValue(value='const2', display_name='TWO', legacy_code=2))
+    CONST3 = EnumField(SomeExtendedEnumValue(value='const3', display_name='THREE'))
+    ALIAS_CONST1 = EnumField(SomeExtendedEnumValue(value='const1', display_name='ONE'))
+    CONST4 = EnumField(ValueWithDescription(value='const4', description='some description 4'))
+
+
+@index_normalized
+class NormalizedEnum(ExtendedEnum):
+    """An enumeration whose members are also found by normalized forms of values."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(ValueWithDescription(value='Const2', description='some description 2'))
+    CONST3 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+    CONST4 = EnumField(4)
+
+
+class StrictEnum(ExtendedEnum):
+    """An enumeration whose members are found only by the exact values."""
+
+    CONST1 = EnumField('const1')
+    CONST3 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+
+
+@pytest.mark.parametrize(
+    'field_name,key,expected',
+    [
+        {'field_name': 'display_name', 'key': 'ONE', 'expected': DetailedEnum.CONST1}.values(),
+        {'field_name': 'display_name', 'key': 'THREE', 'expected': DetailedEnum.CONST3}.values(),
+        {'field_name': 'display_name', 'key': 'const1', 'expected': None}.values(),
+        {'field_name': 'display_name', 'key': ['ONE'], 'expected': None}.values(),
+        {'field_name': 'legacy_code', 'key': 2, 'expected': DetailedEnum.CONST2}.values(),
+        {'field_name': 'legacy_code', 'key': None, 'expected': DetailedEnum.CONST3}.values(),
+    ]
+)
+def test_get_by(field_name: str, key: Any, expected: Optional[DetailedEnum]):
+    """
+    Check getting a member by an indexed field.
+    Expected:
+        - The member with the value of the field or None.
+    """
+
+    assert DetailedEnum.get_by(field_name, key) is expected
+
+
+def test_get_by_default():
+    """
+    Check getting a member by a value of an indexed field that no member has.
+    Expected:
+        - The default value.
+    """
+
+    assert DetailedEnum.get_by('display_name', 'FOUR', DetailedEnum.CONST4) is DetailedEnum.CONST4
+
+
+@pytest.mark.parametrize('field_name', ['value', 'description', 'unknown'])
+def test_get_by_not_indexed(field_name: str):
+    """
+    Check getting a member by a field that is not indexed.
+    Expected:
+        - ValueError.
+    """
+
+    with pytest.raises(ValueError, match=f"'{field_name}' is not an indexed field of DetailedEnum"):
+        DetailedEnum.get_by(field_name, 'const1')
+
+
+def test_index_by_duplicates():
+    """
+    Check indexing an enumeration in which several members have equal values of the field.
+    Expected:
+        - ValueError with the duplicated members.
+    """
+
+    enum_cls = ExtendedEnum('DuplicateEnum', [
+        ('CONST1', SomeExtendedEnumValue(value='const1', display_name='ONE')),
+        ('CONST2', SomeExtendedEnumValue(value='const2', display_name='TWO')),
+        ('CONST3', SomeExtendedEnumValue(value='const3', display_name='ONE')),
+        ('CONST4', SomeExtendedEnumValue(value='const4', display_name='TWO')),
+    ])
+    message = 'duplicate display_name values found in <.+>: CONST3 -> CONST1, CONST4 -> CONST2'
+    with pytest.raises(ValueError, match=message):
+        index_by('display_name')(enum_cls)
+
+
+def test_index_by_unknown_field():
+    """
+    Check indexing an enumeration by a field that its extended values do not have.
+    Expected:
+        - ValueError.
+    """
+
+    with pytest.raises(ValueError, match="Extended values of DetailedEnum do not have the 'unknown' field"):
+        index_by('unknown')(DetailedEnum)
+
+
+def test_index_by_lazy():
+    """
+    Check indexing a lazy enumeration.
+    Expected:
+        - Members are found by the indexed field.
+    """
+
+    enum_cls = index_by('description')(lazy_enum(
+        'LazyEnum',
+        [('CONST1', 'const1', 'one'), ('CONST2', 'const2', 'two')],
+        value_cls=ValueWithDescription,
+    ))
+    assert enum_cls.get_by('description', 'two') is enum_cls.CONST2
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        {'value': 'const1', 'expected': NormalizedEnum.CONST1}.values(),
+        {'value': 'CONST1', 'expected': NormalizedEnum.CONST1}.values(),
+        {'value': 'const2', 'expected': NormalizedEnum.CONST2}.values(),
+        {'value': 'CONST2', 'expected': NormalizedEnum.CONST2}.values(),
+        {'value': UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'), 'expected': NormalizedEnum.CONST3}.values(),
+        {'value': '79ff3431-3e98-4bec-9a4c-63ede2580f83', 'expected': NormalizedEnum.CONST3}.values(),
+        {'value': '79FF3431-3E98-4BEC-9A4C-63EDE2580F83', 'expected': NormalizedEnum.CONST3}.values(),
+        {'value': '79ff34313e984bec9a4c63ede2580f83', 'expected': NormalizedEnum.CONST3}.values(),
+        {'value': '{79FF3431-3E98-4BEC-9A4C-63EDE2580F83}', 'expected': NormalizedEnum.CONST3}.values(),
+        {'value': 'urn:uuid:79ff3431-3e98-4bec-9a4c-63ede2580f83', 'expected': NormalizedEnum.CONST3}.values(),
+        {'value': UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83').int, 'expected': NormalizedEnum.CONST3}.values(),
+        {'value': UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83').bytes, 'expected': NormalizedEnum.CONST3}.values(),
+        {'value': 4, 'expected': NormalizedEnum.CONST4}.values(),
+    ]
+)
+def test_normalized_lookup(value: Any, expected: NormalizedEnum):
+    """
+    Check getting a member by a normalized form of its value.
+    Expected:
+        - The member is found by `cls(value)`, `cls.get(value)` and `cls.parse_many(values)`.
+    """
+
+    assert NormalizedEnum(value) is expected
+    assert NormalizedEnum.get(value) is expected
+    assert NormalizedEnum.parse_many([value, 'const1']) == [expected, NormalizedEnum.CONST1]
+
+
+@pytest.mark.parametrize('value', ['const 1', '4', 'CONST3', b'const1', ['const1'], 5])
+def test_normalized_lookup_miss(value: Any):
+    """
+    Check getting a member by a value that does not belong to an enumeration with normalized lookup.
+    Expected:
+        - ValueError or the default value.
+    """
+
+    with pytest.raises(ValueError, match='is not a valid NormalizedEnum'):
+        NormalizedEnum(value)
+    assert NormalizedEnum.get(value, 'default') == 'default'
+
+
+@pytest.mark.parametrize(
+    'value',
+    ['CONST1', '79FF3431-3E98-4BEC-9A4C-63EDE2580F83', UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83').int],
+)
+def test_strict_lookup(value: Any):
+    """
+    Check getting a member by a normalized form of its value without `index_normalized`.
+    Expected:
+        - ValueError.
+    """
+
+    with pytest.raises(ValueError, match='is not a valid StrictEnum'):
+        StrictEnum(value)
+    assert StrictEnum.get(value) is None
+
+
+def test_index_normalized_duplicates():
+    """
+    Check the normalized lookup of an enumeration in which members have the same normalized form of values.
+    Expected:
+        - ValueError with the duplicated members.
+    """
+
+    enum_cls = ExtendedEnum('DuplicateEnum', [
+        ('CONST1', EnumField('const1')),
+        ('CONST2', EnumField('CONST1')),
+        ('CONST3', EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))),
+        ('CONST4', EnumField('79FF3431-3E98-4BEC-9A4C-63EDE2580F83')),
+    ])
+    message = 'duplicate normalized values found in <.+>: CONST2 -> CONST1, CONST4 -> CONST3'
+    with pytest.raises(ValueError, match=message):
+        index_normalized(enum_cls)
@@ -0,0 +1,111 @@
+from typing import Any, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+import pytest
+
+from extended_enum import ExtendedEnum, ValueWithDescription, EnumField, index_normalized
+from extended_enum.instrumentation import LookupStats, instrument, uninstrument
+from extended_enum.lazy import lazy_enum
+
+
+@index_normalized
+class MixedEnum(ExtendedEnum):
+    """A combined enumeration in which member values are of different types."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(ValueWithDescription(value=2, description='some description 2'))
+    CONST3 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+
+
+@pytest.fixture
+def events() -> Iterator[List[Tuple[str, Any, Optional[int]]]]:
+    """Instrument the enumeration with a callback that collects the events."""
+    collected: List[Tuple[str, Any, Optional[int]]] = []
+    instrument(MixedEnum, callback=lambda event, value, elapsed_ns: collected.append((event, value, elapsed_ns)))
+    yield collected
+    uninstrument(MixedEnum)
+
+
+def test_lookup_events(events: List[Tuple[str, Any, Optional[int]]]):
+    """
+    Check counting the lookups of an instrumented enumeration.
+    Expected:
+        - Each lookup is counted once as a hit, an extended hit, a fallback or a failure.
+        - The callback gets the events without time.
+    """
+
+    assert MixedEnum('const1') is MixedEnum.CONST1
+    assert MixedEnum(ValueWithDescription(value=2)) is MixedEnum.CONST2
+    assert MixedEnum('CONST1') is MixedEnum.CONST1
+    with pytest.raises(ValueError, match='is not a valid MixedEnum'):
+        MixedEnum('unknown')
+    assert MixedEnum.get(2) is MixedEnum.CONST2
+    assert MixedEnum.get('unknown') is None
+    assert MixedEnum.parse_many(['const1', '79FF3431-3E98-4BEC-9A4C-63EDE2580F83'], errors='default') == [
+        MixedEnum.CONST1, MixedEnum.CONST3,
+    ]
+
+    assert events == [
+        ('hit', 'const1', None),
+        ('extended_hit', ValueWithDescription(value=2), None),
+        ('fallback', 'CONST1', None),
+        ('failure', 'unknown', None),
+        ('hit', 2, None),
+        ('failure', 'unknown', None),
+        ('hit', 'const1', None),
+        ('fallback', '79FF3431-3E98-4BEC-9A4C-63EDE2580F83', None),
+    ]
+    assert MixedEnum._lookup_instrumentation.snapshot() == LookupStats(  # noqa: WPS437
+        hit=3, extended_hit=1, fallback=2, failure=2, time_ns=0,
+    )
+
+
+def test_lookup_timing():
+    """
+    Check measuring the time of the lookups of an instrumented enumeration.
+    Expected:
+        - The total time is counted, the counters are set to zero by `reset`.
+    """
+
+    instrumentation = instrument(MixedEnum, timing=True)
+    try:
+        MixedEnum('const1')
+        MixedEnum.get('unknown')
+        stats = instrumentation.snapshot()
+        assert (stats.hit, stats.failure) == (1, 1)
+        assert stats.time_ns > 0
+
+        instrumentation.reset()
+        assert instrumentation.snapshot() == LookupStats(hit=0, extended_hit=0, fallback=0, failure=0, time_ns=0)
+    finally:
+        uninstrument(MixedEnum)
+
+
+def test_uninstrument():
+    """
+    Check removing the instrumentation.
+    Expected:
+        - The original mapping of values is restored, lookups are not counted.
+    """
+
+    value2member_map = MixedEnum._value2member_map_  # noqa: WPS437
+    instrumentation = instrument(MixedEnum)
+    uninstrument(MixedEnum)
+    uninstrument(MixedEnum)
+
+    assert MixedEnum('const1') is MixedEnum.CONST1
+    assert instrumentation.snapshot().hit == 0
+    assert MixedEnum._value2member_map_ is value2member_map  # noqa: WPS437
+    assert '_lookup_instrumentation' not in vars(MixedEnum)
+
+
+def test_instrument_lazy():
+    """
+    Check instrumenting a lazy enumeration.
+    Expected:
+        - TypeError.
+    """
+
+    enum_cls = lazy_enum('LazyEnum', [('CONST1', 'const1')])
+    with pytest.raises(TypeError, match='cannot be instrumented'):
+        instrument(enum_cls)
@@ -0,0 +1,201 @@
+import pickle
+from typing import Any, List, Sequence
+
+import pytest
+
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, EnumField
+from extended_enum import lazy
+from extended_enum.lazy import lazy_enum
+from extended_enum.sets import ExtendedEnumSet
+
+DEFINITIONS = [
+    ('CONST1', 'const1', 'some description 1'),
+    ('CONST2', 2, None),
+    ('CONST3', 'const3', 'some description 3'),
+]
+
+
+class EagerEnum(ExtendedEnum):
+    """The enumeration created eagerly from the same definitions."""
+
+    CONST1 = EnumField(ValueWithDescription(value='const1', description='some description 1'))
+    CONST2 = EnumField(ValueWithDescription(value=2))
+    CONST3 = EnumField(ValueWithDescription(value='const3', description='some description 3'))
+
+
+LazyEnum = lazy_enum('LazyEnum', DEFINITIONS, value_cls=ValueWithDescription)
+
+
+def make_lazy_enum() -> Any:
+    """Create a new lazy enumeration, so that no member is created yet."""
+    return lazy_enum('LazyEnum', DEFINITIONS, value_cls=ValueWithDescription)
+
+
+def count_created(enum_cls: Any) -> int:
+    """Get the number of members that have been created."""
+    definitions = enum_cls._lazy_definitions  # noqa: WPS437
+    return len(definitions.rows) - definitions.missing
+
+
+def dump(members: Sequence[ExtendedEnum]) -> List[Any]:
+    """Get comparable representations of members."""
+    return [(member.name, member.extended_value, member.ordinal) for member in members]
+
+
+@pytest.mark.parametrize(
+    'access,expected',
+    [
+        (lambda enum_cls: enum_cls.CONST3, 'CONST3'),
+        (lambda enum_cls: enum_cls['CONST3'], 'CONST3'),
+        (lambda enum_cls: enum_cls('const3'), 'CONST3'),
+        (lambda enum_cls: enum_cls(ValueWithDescription(value=2)), 'CONST2'),
+        (lambda enum_cls: enum_cls.get(2), 'CONST2'),
+        (lambda enum_cls: enum_cls.get_simple_value_member()['const1'], 'CONST1'),
+        (lambda enum_cls: enum_cls.from_ordinal(2), 'CONST3'),
+        (lambda enum_cls: enum_cls.from_ordinals([1])[0], 'CONST2'),
+        (lambda enum_cls: enum_cls.parse_many(['const1'])[0], 'CONST1'),
+    ]
+)
+def test_access_creates_one_member(access: Any, expected: str):
+    """
+    Check access to a single member of a lazy enumeration.
+    Expected:
+        - Only the accessed member is created, it is the same object on the next access.
+    """
+
+    enum_cls = make_lazy_enum()
+    member = access(enum_cls)
+    assert member.name == expected
+    assert count_created(enum_cls) == 1
+    assert access(enum_cls) is member
+    assert enum_cls[expected] is member
+    assert count_created(enum_cls) == 1
+
+
+@pytest.mark.parametrize(
+    'access',
+    [
+        list,
+        lambda enum_cls: list(enum_cls.__members__.values()),
+        lambda enum_cls: enum_cls.get_values(),
+        lambda enum_cls: dict(enum_cls.get_simple_value_member()),
+        lambda enum_cls: enum_cls.to_categorical([]),
+        lambda enum_cls: list(ExtendedEnumSet.all(enum_cls)),
+    ]
+)
+def test_bulk_access_creates_all_members(access: Any):
+    """
+    Check access to all members of a lazy enumeration.
+    Expected:
+        - All members are created.
+    """
+
+    enum_cls = make_lazy_enum()
+    enum_cls.CONST2  # noqa: WPS428
+    access(enum_cls)
+    assert count_created(enum_cls) == len(DEFINITIONS)
+
+
+def test_same_results_as_eager():
+    """
+    Check that a lazy enumeration behaves as the eager one.
+    Expected:
+        - The members, values, ordinals and lookups are the same in the definition order.
+    """
+
+    enum_cls = make_lazy_enum()
+    enum_cls.CONST3  # noqa: WPS428
+    assert len(enum_cls) == len(EagerEnum)
+    assert dump(list(enum_cls)) == dump(list(EagerEnum))
+    assert dump(list(reversed(enum_cls))) == dump(list(reversed(EagerEnum)))
+    assert list(enum_cls.__members__) == list(EagerEnum.__members__)
+    assert enum_cls.get_values() == EagerEnum.get_values()
+    assert enum_cls.get_extended_values() == EagerEnum.get_extended_values()
+    assert list(enum_cls.get_simple_value_member()) == list(EagerEnum.get_simple_value_member())
+    assert enum_cls.to_categorical([enum_cls.CONST2])[0] == EagerEnum.to_categorical([EagerEnum.CONST2])[0]
+    assert enum_cls.CONST1 in enum_cls
+    assert enum_cls.CONST1.json_fragment == EagerEnum.CONST1.json_fragment
+
+
+@pytest.mark.parametrize(
+    'value',
+    ['missing', 'CONST1', 2.0, ValueWithDescription(value=3), BaseExtendedEnumValue(value=2)],
+)
+def test_invalid_values(value: Any):
+    """
+    Check lookup of values that do not belong to a lazy enumeration.
+    Expected:
+        - ValueError, `get` returns the default, no member is created.
+    """
+
+    enum_cls = make_lazy_enum()
+    with pytest.raises(ValueError, match='is not a valid LazyEnum'):
+        enum_cls(value)
+    assert enum_cls.get(value) is None
+    with pytest.raises(AttributeError):
+        enum_cls.MISSING  # noqa: WPS428
+    with pytest.raises(KeyError):
+        enum_cls['MISSING']  # noqa: WPS428
+    assert count_created(enum_cls) <= 1
+
+
+def test_pickle():
+    """
+    Check pickling of members of a lazy enumeration.
+    Expected:
+        - The same member is restored.
+    """
+
+    assert pickle.loads(pickle.dumps(LazyEnum.CONST2)) is LazyEnum.CONST2
+    assert pickle.loads(pickle.dumps(LazyEnum.from_ordinal(2))) is LazyEnum.CONST3
+
+
+def test_simple_definitions():
+    """
+    Check a lazy enumeration defined without a value class.
+    Expected:
+        - Values are prepared by EnumField.
+    """
+
+    enum_cls = lazy_enum('SimpleEnum', [('CONST1', 'const1'), ('CONST2', ValueWithDescription(value=2))])
+    assert enum_cls.CONST1.extended_value == BaseExtendedEnumValue(value='const1')
+    assert enum_cls(2).extended_value == ValueWithDescription(value=2)
+    assert enum_cls.__module__ == __name__
+
+
+@pytest.mark.parametrize(
+    'definitions,message',
+    [
+        ([('CONST1', 'const1'), ('CONST1', 'const2')], 'is not unique'),
+        ([('CONST1', 'const1'), ('CONST2', 'const1')], 'cannot have aliases'),
+        ([('_CONST1', 'const1')], 'is not a valid member name'),
+        ([('value', 'const1')], 'is not a valid member name'),
+        ([('CONST1', 'const1', 'some description')], 'must be'),
+    ]
+)
+def test_invalid_definitions(definitions: Any, message: str):
+    """
+    Check invalid definitions of a lazy enumeration.
+    Expected:
+        - ValueError.
+    """
+
+    with pytest.raises(ValueError, match=message):
+        lazy_enum('InvalidEnum', definitions)
+
+
+def test_members_as_class_attributes(monkeypatch: pytest.MonkeyPatch):
+    """
+    Check a lazy enumeration whose members are class attributes, as Python 3.12+ requires.
+    Expected:
+        - A member is created on access to the class attribute and replaces it.
+    """
+
+    monkeypatch.setattr(lazy, '_MEMBERS_ARE_CLASS_ATTRIBUTES', True)
+    enum_cls = make_lazy_enum()
+    assert type(vars(enum_cls)['CONST2']).__name__ == '_LazyMember'
+    member = enum_cls.CONST2
+    assert vars(enum_cls)['CONST2'] is member
+    assert count_created(enum_cls) == 1
+    assert enum_cls.CONST2.value == 2
+    assert dump(list(enum_cls)) == dump(list(EagerEnum))
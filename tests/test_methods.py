@@ -1,4 +1,5 @@
-from typing import Type, Tuple
+from array import array
+from typing import Any, Type, Tuple
 from uuid import UUID
 
 import pytest
@@ -116,6 +117,38 @@ def test_get_members(enum_cls: Type[ExtendedEnum], expected: Tuple[ExtendedEnumV
     assert dict(enum_cls.get_members()) == expected
 
 
+@pytest.mark.parametrize(
+    'enum_cls,expected',
+    [
+        {
+            'enum_cls': MixedEnum,
+            'expected': {
+                'const1': MixedEnum.CONST1,
+                1: MixedEnum.CONST2,
+                UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'): MixedEnum.CONST3,
+                '79ff3431-3e98-4bec-9a4c-63ede2580f83': MixedEnum.NOT_DUPLICATE_CONST3,
+                'const4': MixedEnum.CONST4,
+                2: MixedEnum.CONST5,
+                UUID('e7b4b8ae-2224-47ec-afce-40aeb10b85e2'): MixedEnum.CONST6,
+                'const7': MixedEnum.CONST7,
+                3: MixedEnum.CONST8,
+            }
+        }.values(),
+        {
+            'enum_cls': ExtendedEnum,
+            'expected': {}
+        }.values(),
+    ]
+)
+def test_get_simple_value_member(enum_cls: Type[ExtendedEnum], expected: dict):
+    """
+    Check out the function that gets the mapping of simple values to members.
+    Expected:
+        - Dictionary in which the key is the simple value, and the value is the Enum class constant itself.
+    """
+    assert dict(enum_cls.get_simple_value_member()) == expected
+
+
 @pytest.mark.parametrize(
     'enum_member,expected',
     [
@@ -154,3 +187,164 @@ def test_extended_value(enum_member: ExtendedEnum, expected: ExtendedEnumValueTy
     """Check getting a extended enum value."""
 
     assert enum_member.extended_value == expected
+
+
+class ShadowingEnum(ExtendedEnum):
+    """An enumeration with members named like member attributes."""
+
+    value = EnumField('value')
+    extended_value = EnumField(ValueWithDescription(value='extended', description='some description'))
+    CONST1 = EnumField('const1')
+
+
+def test_class_level_attributes():
+    """
+    Check access to the member attributes through the enumeration class.
+    Expected:
+        - Without a member of the same name AttributeError is raised.
+        - A member of the same name is returned and the attributes of all members still work.
+    """
+
+    with pytest.raises(AttributeError):
+        MixedEnum.value  # noqa: WPS428
+    with pytest.raises(AttributeError):
+        MixedEnum.extended_value  # noqa: WPS428
+
+    assert ShadowingEnum.value is ShadowingEnum('value')
+    assert ShadowingEnum.extended_value is ShadowingEnum('extended')
+    assert ShadowingEnum.value.value == 'value'
+    assert ShadowingEnum.extended_value.extended_value == ValueWithDescription(value='extended')
+    assert ShadowingEnum.CONST1.value == 'const1'
+    assert ShadowingEnum.CONST1.extended_value == BaseExtendedEnumValue(value='const1')
+
+
+def test_member_attributes_are_stored():
+    """
+    Check that the member attributes are stored in the member.
+    Expected:
+        - The value and the extended value are instance attributes.
+    """
+
+    assert vars(MixedEnum.CONST8)['value'] == 3
+    assert vars(MixedEnum.CONST8)['extended_value'] is MixedEnum.CONST8._value_  # noqa: WPS437
+
+
+class BaseEnumWithMethod(ExtendedEnum):
+    """An enumeration without members that is used as a base class."""
+
+    @classmethod
+    def get_first_value(cls) -> SimpleValueType:
+        """Get the value of the first member."""
+        return cls.get_values()[0]
+
+
+class InheritedEnum(BaseEnumWithMethod):
+    """An enumeration inherited from an enumeration without members."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(ValueWithDescription(value=2, description='some description'))
+
+
+@pytest.mark.parametrize('enum_cls', [MixedEnum, InheritedEnum, BaseEnumWithMethod])
+def test_precomputed_values(enum_cls: Type[ExtendedEnum]):
+    """
+    Check that the values of an enumeration are computed once.
+    Expected:
+        - Repeated calls return the same objects.
+        - The mapping of simple values cannot be changed.
+    """
+
+    assert enum_cls.get_values() is enum_cls.get_values()
+    assert enum_cls.get_extended_values() is enum_cls.get_extended_values()
+    assert enum_cls.get_simple_value_member() is enum_cls.get_simple_value_member()
+    with pytest.raises(TypeError):
+        enum_cls.get_simple_value_member()['new'] = None
+
+
+def test_inherited_values():
+    """
+    Check the values of an enumeration inherited from an enumeration without members.
+    Expected:
+        - The values of the base class and the subclass do not mix.
+    """
+
+    assert BaseEnumWithMethod.get_values() == ()
+    assert InheritedEnum.get_values() == ('const1', 2)
+    assert InheritedEnum.get_first_value() == 'const1'
+    assert InheritedEnum.get_extended_values() == (
+        BaseExtendedEnumValue(value='const1'),
+        ValueWithDescription(value=2, description='some description'),
+    )
+    assert dict(InheritedEnum.get_simple_value_member()) == {'const1': InheritedEnum.CONST1, 2: InheritedEnum.CONST2}
+    assert InheritedEnum(2) is InheritedEnum.CONST2
+
+
+class AliasEnum(ExtendedEnum):
+    """An enumeration with aliases."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(2)
+    ALIAS_CONST1 = EnumField('const1')
+    CONST3 = EnumField(ValueWithDescription(value='const3'))
+
+
+@pytest.mark.parametrize(
+    'enum_member,expected',
+    [
+        (MixedEnum.CONST1, 0),
+        (MixedEnum.CONST8, 8),
+        (AliasEnum.CONST1, 0),
+        (AliasEnum.CONST2, 1),
+        (AliasEnum.ALIAS_CONST1, 0),
+        (AliasEnum.CONST3, 2),
+    ]
+)
+def test_ordinal(enum_member: ExtendedEnum, expected: int):
+    """
+    Check getting the ordinal of a member and the member by ordinal.
+    Expected:
+        - Ordinals follow the definition order, aliases share the ordinal of the original member.
+    """
+
+    assert enum_member.ordinal == expected
+    assert type(enum_member).from_ordinal(expected) is enum_member
+
+
+@pytest.mark.parametrize('ordinal', [3, -1, 'const1'])
+def test_invalid_ordinal(ordinal: Any):
+    """
+    Check getting a member by an ordinal that does not belong to the enumeration.
+    Expected:
+        - Exception raised.
+    """
+
+    with pytest.raises((ValueError, TypeError)):
+        AliasEnum.from_ordinal(ordinal)
+
+
+def test_ordinals_conversion():
+    """
+    Check the bulk conversion of members to ordinals and back.
+    Expected:
+        - 2 bytes per member.
+        - The conversion from an array, bytes and a list returns the same members.
+        - Objects that are not members of the enumeration are not converted.
+    """
+
+    members = [AliasEnum.CONST3, AliasEnum.CONST1, AliasEnum.ALIAS_CONST1, AliasEnum.CONST2]
+    ordinals = AliasEnum.to_ordinals(members)
+    assert ordinals == array('H', [2, 0, 0, 1])
+    assert len(ordinals.tobytes()) == 8
+    assert AliasEnum.from_ordinals(ordinals) == members
+    assert AliasEnum.from_ordinals(ordinals.tobytes()) == members
+    assert AliasEnum.from_ordinals([2, 0, 0, 1]) == members
+
+    with pytest.raises(ValueError, match='3 is not a valid ordinal of AliasEnum'):
+        AliasEnum.from_ordinals([0, 3])
+    with pytest.raises(ValueError, match='Negative or too large ordinals for AliasEnum'):
+        AliasEnum.from_ordinals([0, -1])
+
+    with pytest.raises(ValueError, match='is not a member of AliasEnum'):
+        AliasEnum.to_ordinals([AliasEnum.CONST1, MixedEnum.CONST1])
+    with pytest.raises(ValueError, match="'const1' is not a member of AliasEnum"):
+        AliasEnum.to_ordinals(iter([AliasEnum.CONST1, 'const1']))
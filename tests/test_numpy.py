@@ -0,0 +1,125 @@
+from uuid import UUID
+
+import pytest
+
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, EnumField
+
+np = pytest.importorskip('numpy')
+enum_numpy = pytest.importorskip('extended_enum.numpy')
+
+
+class MixedEnum(ExtendedEnum):
+    """A combined enumeration in which member values are of different types."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(1)
+    CONST3 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+    NOT_DUPLICATE_CONST3 = EnumField('79ff3431-3e98-4bec-9a4c-63ede2580f83')
+    CONST4 = EnumField(BaseExtendedEnumValue(value='const4'))
+    CONST5 = EnumField(BaseExtendedEnumValue(value=2))
+    CONST6 = EnumField(BaseExtendedEnumValue(value=UUID('e7b4b8ae-2224-47ec-afce-40aeb10b85e2')))
+    CONST7 = EnumField(ValueWithDescription(value='const7'))
+    CONST8 = EnumField(ValueWithDescription(value=3, description='some const8 description'))
+
+
+class StringEnum(ExtendedEnum):
+    """An enumeration in which the values of all members are strings."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField('const2')
+    CONST3 = EnumField('const3')
+
+
+@pytest.mark.parametrize(
+    'values,expected',
+    [
+        (np.array(['const7', 'const1', '79ff3431-3e98-4bec-9a4c-63ede2580f83']), [7, 0, 3]),
+        (np.array([[3, 1], [2, 3]]), [[8, 1], [5, 8]]),
+        (np.array([UUID('e7b4b8ae-2224-47ec-afce-40aeb10b85e2'), 'const4', 2], dtype=object), [6, 4, 5]),
+        (['const1', 1, '1'], None),
+    ]
+)
+def test_values_to_codes(values, expected):
+    """
+    Check the conversion of values to codes.
+    Expected:
+        - The codes are the ordinals of the members, values of different types are not mixed up.
+    """
+
+    if expected is None:
+        with pytest.raises(ValueError, match="'1' is not a valid MixedEnum"):
+            enum_numpy.values_to_codes(MixedEnum, values)
+    else:
+        assert enum_numpy.values_to_codes(MixedEnum, values).tolist() == expected
+
+
+def test_values_to_codes_default():
+    """
+    Check the conversion of values that do not belong to the enumeration.
+    Expected:
+        - The default code replaces invalid values.
+    """
+
+    values = np.array(['const2', 'unknown', 'const0', 'const3'])
+    assert enum_numpy.values_to_codes(StringEnum, values, errors='default').tolist() == [1, -1, -1, 2]
+    assert enum_numpy.values_to_codes(StringEnum, np.array([1, 2]), errors='default', default=0).tolist() == [0, 0]
+
+
+def test_codes_to_members_and_values():
+    """
+    Check the conversion of codes to members and values.
+    Expected:
+        - Members and values by ordinals, values keep a native dtype when possible.
+    """
+
+    codes = enum_numpy.values_to_codes(StringEnum, np.array(['const3', 'const1']))
+    assert enum_numpy.codes_to_members(StringEnum, codes).tolist() == [StringEnum.CONST3, StringEnum.CONST1]
+    values = enum_numpy.codes_to_values(StringEnum, codes)
+    assert values.dtype.kind == 'U'
+    assert values.tolist() == ['const3', 'const1']
+
+    values = enum_numpy.codes_to_values(MixedEnum, [8, 2])
+    assert values.dtype == object
+    assert values.tolist() == [3, UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83')]
+
+    with pytest.raises(ValueError, match='3 is not a valid code of StringEnum'):
+        enum_numpy.codes_to_members(StringEnum, [0, 3])
+    with pytest.raises(ValueError, match='-1 is not a valid code of StringEnum'):
+        enum_numpy.codes_to_values(StringEnum, [-1])
+
+
+class LargeIntEnum(ExtendedEnum):
+    """An enumeration with integer values outside int64."""
+
+    CONST1 = EnumField(1)
+    CONST2 = EnumField(2 ** 63)
+    CONST3 = EnumField(-2 ** 64)
+
+
+def test_values_outside_int64():
+    """
+    Check the conversion of integer values that do not fit int64.
+    Expected:
+        - The tables are built, such values are found in sequences and uint64 arrays, values keep their types.
+    """
+
+    assert enum_numpy.values_to_codes(LargeIntEnum, [2 ** 63, 1, -2 ** 64]).tolist() == [1, 0, 2]
+    assert enum_numpy.values_to_codes(LargeIntEnum, np.array([1, 2 ** 63], dtype=np.uint64)).tolist() == [0, 1]
+    int8_values = np.array([1, 3], dtype=np.int8)
+    assert enum_numpy.values_to_codes(LargeIntEnum, int8_values, errors='default').tolist() == [0, -1]
+    assert enum_numpy.codes_to_values(LargeIntEnum, [2, 0]).tolist() == [-2 ** 64, 1]
+
+
+@pytest.mark.parametrize('invalid_value', [[1], {'const1': 1}, 1.0])
+def test_values_to_codes_not_simple_values(invalid_value):
+    """
+    Check the conversion of elements of an object array that are not simple values.
+    Expected:
+        - Unhashable elements and numbers equal to integer values follow the error policy.
+    """
+
+    values = np.empty(2, dtype=object)
+    values[:] = ['const1', invalid_value]
+    assert enum_numpy.values_to_codes(MixedEnum, values, errors='default').tolist() == [0, -1]
+    with pytest.raises(ValueError, match='is not a valid MixedEnum'):
+        enum_numpy.values_to_codes(MixedEnum, values)
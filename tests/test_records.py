@@ -0,0 +1,161 @@
+import json
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+from uuid import UUID
+
+import pytest
+
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, with_slots
+from extended_enum.records import read_records
+
+RECORDS = [
+    {'name': 'CONST1', 'value': 'const1', 'description': 'some description 1'},
+    {'name': 'CONST2', 'value': 'const2', 'description': 'some description 2', 'comment': 'ignored'},
+    {'name': 'CONST3', 'value': 'const3'},
+]
+
+FILES = {
+    'records.json': json.dumps(RECORDS),
+    'records.jsonl': '\n'.join(json.dumps(record) for record in RECORDS) + '\n\n',
+    'records.csv': (
+        '\ufeffname,value,description,comment\n'
+        'CONST1,const1,some description 1,\n'
+        'CONST2,const2,"some description 2",ignored\n'
+    ),
+}
+
+
+@with_slots
+@dataclass(frozen=True)
+class CurrencyValue(ValueWithDescription):
+    """A value class with an additional field."""
+
+    minor_units: Optional[int] = field(default=None, compare=False)
+
+
+FileEnum = ExtendedEnum.from_records('FileEnum', RECORDS)
+
+
+@pytest.mark.parametrize('file_name', list(FILES))
+def test_from_file(tmp_path: Path, file_name: str):
+    """
+    Check creating an enumeration from a file.
+    Expected:
+        - Members are created in the order of records with the fields of the value class.
+    """
+
+    path = tmp_path / file_name
+    path.write_text(FILES[file_name], encoding='utf-8')
+
+    enum_cls = ExtendedEnum.from_records('RecordsEnum', path)
+    assert [member.name for member in enum_cls][:2] == ['CONST1', 'CONST2']
+    assert enum_cls('const1').extended_value == ValueWithDescription(value='const1')
+    assert enum_cls.CONST2.extended_value.description == 'some description 2'
+    assert enum_cls.__module__ == __name__
+
+
+def test_from_iterable():
+    """
+    Check creating an enumeration from an iterable of records.
+    Expected:
+        - Missing fields take default values, the members can be pickled.
+    """
+
+    assert FileEnum.get_extended_values() == (
+        ValueWithDescription(value='const1', description='some description 1'),
+        ValueWithDescription(value='const2', description='some description 2'),
+        ValueWithDescription(value='const3'),
+    )
+    assert FileEnum.CONST3.extended_value.description is None
+    assert pickle.loads(pickle.dumps(FileEnum.CONST2)) is FileEnum.CONST2
+
+
+def test_options():
+    """
+    Check the options of the creation of an enumeration from records.
+    Expected:
+        - Fields, the value class and the converter are applied.
+    """
+
+    records = iter([
+        {'code': 'EUR', 'number': '978', 'description': 'Euro', 'minor_units': 2},
+        {'code': 'USD', 'number': '840', 'description': 'US Dollar'},
+    ])
+    enum_cls = ExtendedEnum.from_records(
+        'Currency', records, value_cls=CurrencyValue, name_field='code', value_field='number', converter=int,
+    )
+    assert enum_cls(978).extended_value == CurrencyValue(value=978)
+    assert enum_cls.EUR.extended_value.minor_units == 2
+    assert enum_cls.USD.extended_value.minor_units is None
+
+    enum_cls = ExtendedEnum.from_records(
+        'UUIDEnum', [{'name': 'CONST1', 'value': '79ff3431-3e98-4bec-9a4c-63ede2580f83'}],
+        value_cls=BaseExtendedEnumValue, converter=UUID,
+    )
+    assert enum_cls(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83')) is enum_cls.CONST1
+
+
+@pytest.mark.parametrize(
+    'records,message',
+    [
+        ([{'value': 'const1'}], "Record 0 does not have the 'name' field"),
+        ([{'name': 'CONST1', 'value': 'const1'}, {'name': 'CONST2'}], "Record 1 does not have the 'value' field"),
+    ]
+)
+def test_invalid_records(records: Any, message: str):
+    """
+    Check creating an enumeration from invalid records.
+    Expected:
+        - ValueError.
+    """
+
+    with pytest.raises(ValueError, match=message):
+        ExtendedEnum.from_records('InvalidEnum', records)
+
+
+@pytest.mark.parametrize(
+    'file_name,content,records_format',
+    [
+        ('records.txt', '', None),
+        ('records.csv', '', 'xml'),
+    ]
+)
+def test_invalid_format(tmp_path: Path, file_name: str, content: str, records_format: Any):
+    """
+    Check reading records of an unknown format.
+    Expected:
+        - ValueError.
+    """
+
+    path = tmp_path / file_name
+    path.write_text(content)
+    with pytest.raises(ValueError, match='format of records'):
+        read_records(path, records_format)
+
+
+@pytest.mark.parametrize('records_format', ['jsonl', 'csv'])
+def test_empty_file(tmp_path: Path, records_format: Any):
+    """
+    Check reading records from an empty file.
+    Expected:
+        - No records.
+    """
+
+    path = tmp_path / 'records'
+    path.write_bytes(b'')
+    assert list(read_records(path, records_format)) == []
+
+
+def test_json_not_array(tmp_path: Path):
+    """
+    Check reading a JSON file that does not contain an array.
+    Expected:
+        - ValueError.
+    """
+
+    path = tmp_path / 'records.json'
+    path.write_text('{"name": "CONST1"}')
+    with pytest.raises(ValueError, match='must contain a JSON array'):
+        list(read_records(path))
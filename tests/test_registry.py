@@ -0,0 +1,182 @@
+import gc
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from extended_enum import ExtendedEnum, ValueWithDescription, EnumField, InvalidValuesError
+from extended_enum.lazy import lazy_enum
+from extended_enum.registry import AmbiguousNameError, EnumRegistry, registry, to_tagged
+
+
+class OrderStatus(ExtendedEnum):
+    """An enumeration with string values."""
+
+    CREATED = EnumField('created')
+    SHIPPED = EnumField(ValueWithDescription(value='shipped', description='The order is shipped'))
+
+
+class MixedRegistryEnum(ExtendedEnum):
+    """An enumeration in which member values are of different types."""
+
+    CONST1 = EnumField('1')
+    CONST2 = EnumField(1)
+    CONST3 = EnumField(2)
+    CONST4 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+
+
+@pytest.mark.parametrize(
+    ('reference', 'expected'),
+    {
+        'tagged string': ('OrderStatus:shipped', OrderStatus.SHIPPED),
+        'tagged string with full name': (f'{__name__}.OrderStatus:created', OrderStatus.CREATED),
+        'pair': (('OrderStatus', 'shipped'), OrderStatus.SHIPPED),
+        'pair with extended value': (
+            ('OrderStatus', ValueWithDescription(value='shipped', description='The order is shipped')),
+            OrderStatus.SHIPPED,
+        ),
+        'string value over text': ('MixedRegistryEnum:1', MixedRegistryEnum.CONST1),
+        'text of int': ('MixedRegistryEnum:2', MixedRegistryEnum.CONST3),
+        'text of uuid': ('MixedRegistryEnum:79ff3431-3e98-4bec-9a4c-63ede2580f83', MixedRegistryEnum.CONST4),
+        'pair with int': (('MixedRegistryEnum', 1), MixedRegistryEnum.CONST2),
+        'pair with text of int': (('MixedRegistryEnum', '2'), MixedRegistryEnum.CONST3),
+    }.values(),
+)
+def test_resolve(reference: Any, expected: ExtendedEnum):
+    """
+    Check resolving references to members.
+    Expected:
+        - Members are found by tagged strings and pairs, the class is named by the qualified or full name.
+    """
+
+    assert registry.resolve(reference) is expected
+
+
+@pytest.mark.parametrize(
+    'reference',
+    (
+        'OrderStatus:unknown',
+        'OrderStatus',
+        'UnknownEnum:shipped',
+        ('OrderStatus', 'unknown'),
+        ('OrderStatus',),
+        ('MixedRegistryEnum', 3),
+    ),
+)
+def test_resolve_invalid(reference: Any):
+    """
+    Check resolving invalid references.
+    Expected:
+        - ValueError.
+    """
+
+    with pytest.raises(ValueError, match='is not a valid reference to a member'):
+        registry.resolve(reference)
+
+
+def test_to_tagged():
+    """
+    Check tagging members.
+    Expected:
+        - The tagged string is resolved to the same member, unless its text is a string value of another member.
+    """
+
+    for member in [*OrderStatus, MixedRegistryEnum.CONST1, MixedRegistryEnum.CONST3, MixedRegistryEnum.CONST4]:
+        assert registry.resolve(to_tagged(member)) is member
+    assert to_tagged(OrderStatus.SHIPPED) == f'{__name__}.OrderStatus:shipped'
+    assert registry.resolve(to_tagged(MixedRegistryEnum.CONST2)) is MixedRegistryEnum.CONST1
+
+
+def test_resolve_many():
+    """
+    Check resolving references to members of different enumerations in bulk.
+    Expected:
+        - Members are returned in the order of references.
+        - Invalid references are handled by the error policy.
+    """
+
+    references = ['OrderStatus:created', ('MixedRegistryEnum', 1), 'UnknownEnum:1', 'MixedRegistryEnum:1']
+    assert registry.resolve_many(references[:2]) == [OrderStatus.CREATED, MixedRegistryEnum.CONST2]
+
+    with pytest.raises(ValueError, match="'UnknownEnum:1' is not a valid reference to a member"):
+        registry.resolve_many(references)
+    assert registry.resolve_many(references, errors='default', default=0) == [
+        OrderStatus.CREATED, MixedRegistryEnum.CONST2, 0, MixedRegistryEnum.CONST1,
+    ]
+    with pytest.raises(InvalidValuesError, match='1 references are not valid, positions: \\[2\\]') as exc_info:
+        registry.resolve_many(references, errors='collect')
+    assert exc_info.value.positions == [2]
+    assert exc_info.value.members == [OrderStatus.CREATED, MixedRegistryEnum.CONST2, None, MixedRegistryEnum.CONST1]
+
+    with pytest.raises(ValueError, match="'ignore' is not a valid error policy"):
+        registry.resolve_many(references, errors='ignore')  # type: ignore[arg-type]
+
+
+def test_get_class():
+    """
+    Check getting registered classes by names.
+    Expected:
+        - Classes created by the functional API and lazy classes are registered.
+        - A qualified name of several classes is ambiguous, the full names are not.
+        - Classes without members are not registered.
+    """
+
+    functional_cls = ExtendedEnum('FunctionalRegistryEnum', [('CONST1', EnumField('const1'))])
+    lazy_cls = lazy_enum('LazyRegistryEnum', [('CONST1', 'const1')])
+    assert registry.get_class('FunctionalRegistryEnum') is functional_cls
+    assert registry.get_class('LazyRegistryEnum') is lazy_cls
+    assert registry.resolve('LazyRegistryEnum:const1') is lazy_cls.CONST1
+
+    first_cls = ExtendedEnum('DuplicateRegistryEnum', [('CONST1', EnumField('const1'))], module='first')
+    second_cls = ExtendedEnum('DuplicateRegistryEnum', [('CONST1', EnumField('const1'))], module='second')
+    ambiguous_message = "'DuplicateRegistryEnum' is ambiguous, use one of: first.DuplicateRegistryEnum, second."
+    with pytest.raises(AmbiguousNameError, match=ambiguous_message):
+        registry.get_class('DuplicateRegistryEnum')
+    assert registry.get_class('first.DuplicateRegistryEnum') is first_cls
+    assert registry.resolve('second.DuplicateRegistryEnum:const1') is second_cls.CONST1
+    assert registry.get_class(f'{__name__}.OrderStatus') is OrderStatus
+
+    with pytest.raises(ValueError, match="'ExtendedEnum' is not a registered enumeration"):
+        registry.get_class('ExtendedEnum')
+
+
+def test_references_to_classes_with_the_same_name():
+    """
+    Check references to enumerations with the same qualified name in different modules.
+    Expected:
+        - Tagged strings of members name the module, they are resolved to the members of the right class.
+        - References by the ambiguous qualified name raise AmbiguousNameError, whatever the error policy.
+    """
+
+    first_cls = ExtendedEnum('Status', [('ACTIVE', EnumField('active'))], module='mod_a')
+    second_cls = ExtendedEnum('Status', [('ACTIVE', EnumField('active'))], module='mod_b')
+    assert to_tagged(first_cls.ACTIVE) == 'mod_a.Status:active'
+    assert to_tagged(second_cls.ACTIVE) == 'mod_b.Status:active'
+    assert registry.resolve_many([to_tagged(second_cls.ACTIVE), to_tagged(first_cls.ACTIVE)]) == [
+        second_cls.ACTIVE, first_cls.ACTIVE,
+    ]
+    assert registry.resolve(('mod_a.Status', 'active')) is first_cls.ACTIVE
+
+    for reference in ('Status:active', ('Status', 'active')):
+        with pytest.raises(AmbiguousNameError, match="'Status' is ambiguous, use one of: mod_a.Status, mod_b.Status"):
+            registry.resolve(reference)
+        for errors in ('raise', 'collect', 'default'):
+            with pytest.raises(AmbiguousNameError):
+                registry.resolve_many(['mod_a.Status:active', reference], errors=errors)  # type: ignore[arg-type]
+
+
+def test_registry_weak_references():
+    """
+    Check that the registry does not keep classes alive.
+    Expected:
+        - A class that is not referenced is removed from the registry.
+    """
+
+    local_registry = EnumRegistry()
+    local_registry.add(OrderStatus)
+    local_registry.add(ExtendedEnum('TemporaryEnum', [('CONST1', EnumField('const1'))]))
+    gc.collect()
+
+    with pytest.raises(ValueError, match="'TemporaryEnum' is not a registered enumeration"):
+        local_registry.get_class('TemporaryEnum')
+    assert local_registry.resolve(('OrderStatus', 'created')) is OrderStatus.CREATED
@@ -1,11 +1,18 @@
+import copy
+import json
+import pickle
 from contextlib import AbstractContextManager
+from decimal import Decimal
+from fractions import Fraction
 from typing import Any, Type
+from unittest import mock
 from uuid import UUID
 
 import orjson
 import pytest
 
-from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, EnumField
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, EnumField, InvalidValuesError
+from extended_enum.serialization import ExtendedEnumJSONEncoder, json_default
 
 
 class MixedEnum(ExtendedEnum):
@@ -150,3 +157,381 @@ def test_conversion_to_json(obj: Any, expected: Any):
     """
 
     assert orjson.dumps(obj).decode() == orjson.dumps(expected).decode()
+
+
+@pytest.mark.parametrize(
+    'enum_cls,value,expected_enum_member',
+    [
+        (MixedEnum, 'const1', MixedEnum.CONST1),
+        (MixedEnum, UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'), MixedEnum.CONST3),
+        (MixedEnum, '79ff3431-3e98-4bec-9a4c-63ede2580f83', MixedEnum.NOT_DUPLICATE_CONST3),
+        (MixedEnum, 'const4', MixedEnum.CONST4),
+        (DetailedEnum, 'const1', DetailedEnum.CONST1),
+    ]
+)
+def test_loads_without_missing(enum_cls: Type[ExtendedEnum], value: Any, expected_enum_member: ExtendedEnum):
+    """
+    Check that a string or UUID simple value is resolved by the index built when the class is created.
+    Expected:
+        - The member is found without calling `_missing_`.
+    """
+
+    with mock.patch.object(enum_cls, '_missing_', side_effect=AssertionError('_missing_ was called')):
+        assert enum_cls(value) is expected_enum_member
+
+
+@pytest.mark.parametrize('value', [1.0, Decimal(1), Fraction(3), 3.0])
+def test_loads_numbers_equal_to_int_values(value: Any):
+    """
+    Check that numbers equal to integer simple values do not belong to the enumeration.
+    Expected:
+        - ValueError, `get` returns the default, `parse_many` raises or replaces the value with the default.
+        - Integers and booleans are still resolved.
+    """
+
+    with pytest.raises(ValueError, match='is not a valid MixedEnum'):
+        MixedEnum(value)
+    assert MixedEnum.get(value) is None
+    with pytest.raises(ValueError, match='is not a valid MixedEnum'):
+        MixedEnum.parse_many([value])
+    assert MixedEnum.parse_many([value, 1], errors='default') == [None, MixedEnum.CONST2]
+    with pytest.raises(ValueError, match='is not a valid MixedEnum'):
+        MixedEnum.validator()(value)
+    assert MixedEnum(int(value)) is MixedEnum.get(int(value)) is MixedEnum.validator()(int(value))
+    assert MixedEnum(True) is MixedEnum.CONST2
+
+
+def test_parse_many():
+    """
+    Check decoding of an iterable of simple and extended values.
+    Expected:
+        - Members in the order of values, the same as `cls(value)` returns.
+    """
+
+    values = [
+        'const1',
+        1,
+        UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'),
+        '79ff3431-3e98-4bec-9a4c-63ede2580f83',
+        BaseExtendedEnumValue(value='const4'),
+        ValueWithDescription(value=3),
+        MixedEnum.CONST7,
+        'const1',
+    ]
+    assert MixedEnum.parse_many(iter(values)) == [MixedEnum(value) for value in values]
+
+
+@pytest.mark.parametrize(
+    'errors,context',
+    [
+        {
+            'errors': 'raise',
+            'context': pytest.raises(ValueError, match="'const0' is not a valid MixedEnum"),
+        }.values(),
+        {
+            'errors': 'collect',
+            'context': pytest.raises(
+                InvalidValuesError,
+                match=r'2 values are not valid MixedEnum, positions: \[1, 3\]',
+            ),
+        }.values(),
+        {
+            'errors': 'unknown',
+            'context': pytest.raises(ValueError, match="'unknown' is not a valid error policy"),
+        }.values(),
+    ]
+)
+def test_parse_many_errors(errors: str, context: AbstractContextManager):
+    """
+    Check decoding of an iterable with invalid values.
+    Expected:
+        - An exception according to the error policy.
+    """
+
+    with context as exc_info:
+        MixedEnum.parse_many(['const1', 'const0', 1, [1]], errors=errors)
+    if errors == 'collect':
+        assert exc_info.value.positions == [1, 3]
+        assert exc_info.value.members == [MixedEnum.CONST1, None, MixedEnum.CONST2, None]
+
+
+def test_parse_many_default():
+    """
+    Check decoding of an iterable with invalid values replaced by the default value.
+    Expected:
+        - Invalid values are replaced by the default value.
+    """
+
+    actual = MixedEnum.parse_many(['const1', 'const0', None, 3], errors='default', default=MixedEnum.CONST7)
+    assert actual == [MixedEnum.CONST1, MixedEnum.CONST7, MixedEnum.CONST7, MixedEnum.CONST8]
+
+
+def test_dump_many():
+    """
+    Check encoding of members to simple values.
+    Expected:
+        - Simple values in the order of members.
+    """
+
+    members = list(MixedEnum)
+    assert MixedEnum.dump_many(members) == [member.value for member in members]
+    assert MixedEnum.parse_many(MixedEnum.dump_many(members)) == members
+
+
+@pytest.mark.parametrize(
+    'value,default,expected',
+    [
+        ('const1', None, MixedEnum.CONST1),
+        (UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'), None, MixedEnum.CONST3),
+        (ValueWithDescription(value=3), None, MixedEnum.CONST8),
+        (MixedEnum.CONST4, None, MixedEnum.CONST4),
+        ('const0', None, None),
+        ('const0', MixedEnum.CONST1, MixedEnum.CONST1),
+        (UUID('e51107a4-7f2b-4de3-9034-fdfb0a50e30f'), 'unknown', 'unknown'),
+        ([1], None, None),
+        (DetailedEnum.CONST1, None, None),
+    ]
+)
+def test_get(value: Any, default: Any, expected: Any):
+    """
+    Check getting a member without raising an exception.
+    Expected:
+        - The member if the value belongs to the enumeration, otherwise the default value.
+    """
+
+    with mock.patch.object(MixedEnum, '_missing_', side_effect=AssertionError('_missing_ was called')):
+        assert MixedEnum.get(value, default) is expected
+
+
+def test_categorical():
+    """
+    Check the conversion of members to a dictionary-encoded column and back.
+    Expected:
+        - The categories are the values of the members in the definition order.
+        - The codes are positions in the categories.
+    """
+
+    members = [MixedEnum.CONST8, MixedEnum.CONST1, MixedEnum.CONST8, MixedEnum.CONST3]
+    categories, codes = MixedEnum.to_categorical(members)
+    assert categories == MixedEnum.get_values()
+    assert list(codes) == [8, 0, 8, 2]
+    assert MixedEnum.from_categorical(codes, categories) == members
+    assert MixedEnum.from_categorical(codes.tobytes(), list(categories)) == members
+
+    # Members with the same simple value keep their identity.
+    categories, codes = DetailedEnum.to_categorical([DetailedEnum.DUPLICATE_CONST2, DetailedEnum.CONST1])
+    assert categories == ('const1', 'const1')
+    assert DetailedEnum.from_categorical(codes, categories) == [DetailedEnum.DUPLICATE_CONST2, DetailedEnum.CONST1]
+
+
+@pytest.mark.parametrize(
+    'codes,categories,expected',
+    [
+        ([1, 0, 1], ['const7', 3], [MixedEnum.CONST8, MixedEnum.CONST7, MixedEnum.CONST8]),
+        ([0], [BaseExtendedEnumValue(value='const4')], [MixedEnum.CONST4]),
+        ([], [], []),
+    ]
+)
+def test_from_categorical(codes: list, categories: list, expected: list):
+    """
+    Check the conversion of a dictionary-encoded column with foreign categories.
+    Expected:
+        - The categories are resolved to members by value.
+    """
+
+    assert MixedEnum.from_categorical(codes, categories) == expected
+
+
+@pytest.mark.parametrize(
+    'codes,categories,message',
+    [
+        ([0], ['const0'], "'const0' is not a valid MixedEnum"),
+        ([0, 2], ['const1', 1], '2 is not a valid code of MixedEnum'),
+        ([-1], ['const1'], 'Negative or too large codes for MixedEnum'),
+    ]
+)
+def test_from_categorical_errors(codes: list, categories: list, message: str):
+    """
+    Check the conversion of an invalid dictionary-encoded column.
+    Expected:
+        - Exception raised.
+    """
+
+    with pytest.raises(ValueError, match=message):
+        MixedEnum.from_categorical(codes, categories)
+
+
+@pytest.mark.parametrize(
+    'enum_member,json_value,json_fragment',
+    [
+        (MixedEnum.CONST1, 'const1', '"const1"'),
+        (MixedEnum.CONST2, 1, '1'),
+        (MixedEnum.CONST3, '79ff3431-3e98-4bec-9a4c-63ede2580f83', '"79ff3431-3e98-4bec-9a4c-63ede2580f83"'),
+        (MixedEnum.CONST8, 3, '3'),
+    ]
+)
+def test_json_fragment(enum_member: ExtendedEnum, json_value: Any, json_fragment: str):
+    """
+    Check the JSON of a member.
+    Expected:
+        - The same result as serialization of the value by `json` and `orjson`.
+    """
+
+    assert enum_member.json_value == json_value
+    assert enum_member.json_fragment == json_fragment == json.dumps(json_value)
+    assert enum_member.json_fragment_bytes == orjson.dumps(enum_member)
+
+
+def test_json_fragment_escaping():
+    """
+    Check the JSON of values that must be escaped.
+    Expected:
+        - The same result as `json.dumps`.
+    """
+
+    enum_cls = ExtendedEnum('EscapedEnum', [('QUOTE', EnumField('"quoted"\n')), ('UNICODE', EnumField('значение'))])
+    for member in enum_cls:
+        assert member.json_fragment == json.dumps(member.value)
+        assert json.loads(member.json_fragment_bytes) == member.value
+
+
+def test_json_fragment_on_first_access():
+    """
+    Check when the JSON of a member is computed.
+    Expected:
+        - Not when the member is created, but on first access, then it is reused.
+    """
+
+    enum_cls = ExtendedEnum('FragmentEnum', [('CONST1', EnumField('const1')), ('CONST2', EnumField(2))])
+    assert all('_json_fragment' not in vars(member) for member in enum_cls)
+    assert '_json_fragment_bytes' not in vars(enum_cls.CONST1)
+
+    assert enum_cls.CONST1.json_fragment_bytes is enum_cls.CONST1.json_fragment_bytes
+    assert enum_cls.CONST1.json_fragment is vars(enum_cls.CONST1)['_json_fragment']
+    assert '_json_fragment' not in vars(enum_cls.CONST2)
+
+
+@pytest.mark.parametrize(
+    'obj',
+    [
+        {member.name: member for member in MixedEnum},
+        [MixedEnum.CONST3, {'nested': [MixedEnum.CONST8, 1, None]}],
+    ]
+)
+def test_conversion_to_json_with_stdlib(obj: Any):
+    """
+    Check the conversion to JSON string with the standard `json` module.
+    Expected:
+        - The same result as `orjson`.
+    """
+
+    expected = orjson.loads(orjson.dumps(obj))
+    assert json.loads(json.dumps(obj, default=json_default)) == expected
+    assert json.loads(json.dumps(obj, cls=ExtendedEnumJSONEncoder)) == expected
+
+
+def test_json_default_error():
+    """
+    Check the conversion of an object that is not a member.
+    Expected:
+        - TypeError, as the `json` module expects.
+    """
+
+    with pytest.raises(TypeError, match='Object of type object is not JSON serializable'):
+        json.dumps(object(), default=json_default)
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+@pytest.mark.parametrize(
+    'enum_member,expected',
+    [
+        (MixedEnum.CONST3, MixedEnum.CONST3),
+        (MixedEnum.CONST8, MixedEnum.CONST8),
+        (DetailedEnum.DUPLICATE_CONST3, DetailedEnum.DUPLICATE_CONST3),
+        (DetailedEnum.DUPLICATE_CONST4, DetailedEnum.CONST1),
+    ]
+)
+def test_pickle(enum_member: ExtendedEnum, expected: ExtendedEnum, protocol: int):
+    """
+    Check pickling members.
+    Expected:
+        - The member is pickled by its name without the extended value and loaded as the same object.
+    """
+
+    data = pickle.dumps(enum_member, protocol=protocol)
+
+    assert pickle.loads(data) is expected
+    assert expected.name.encode() in data
+    assert b'description' not in data
+    assert copy.copy(enum_member) is expected
+    assert copy.deepcopy(enum_member) is expected
+
+
+class NormalizedEnum(ExtendedEnum):
+    """An enumeration without values that have the same normalized form."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(ValueWithDescription(value=2, description='some description 2'))
+    CONST3 = EnumField(UUID('e7b4b8ae-2224-47ec-afce-40aeb10b85e2'))
+
+
+@pytest.mark.parametrize(
+    'enum_cls,configuration,value,expected',
+    [
+        (MixedEnum, {}, 'const1', MixedEnum.CONST1),
+        (MixedEnum, {}, 1, MixedEnum.CONST2),
+        (MixedEnum, {}, UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'), MixedEnum.CONST3),
+        (MixedEnum, {}, '79ff3431-3e98-4bec-9a4c-63ede2580f83', MixedEnum.NOT_DUPLICATE_CONST3),
+        (MixedEnum, {}, MixedEnum.CONST8, MixedEnum.CONST8),
+        (MixedEnum, {}, 'e7b4b8ae-2224-47ec-afce-40aeb10b85e2', None),
+        (MixedEnum, {}, ValueWithDescription(value='const7'), None),
+        (MixedEnum, {}, 'CONST1', None),
+        (MixedEnum, {}, ['const1'], None),
+        (MixedEnum, {}, DetailedEnum.CONST1, None),
+        (MixedEnum, {'allow_extended': True}, ValueWithDescription(value='const7'), MixedEnum.CONST7),
+        (MixedEnum, {'allow_extended': True}, ValueWithDescription(value=3), MixedEnum.CONST8),
+        (MixedEnum, {'allow_extended': True}, BaseExtendedEnumValue(value='const7'), None),
+        (MixedEnum, {'coerce_str_uuid': True}, 'e7b4b8ae-2224-47ec-afce-40aeb10b85e2', MixedEnum.CONST6),
+        (
+            MixedEnum,
+            {'coerce_str_uuid': True},
+            '79ff3431-3e98-4bec-9a4c-63ede2580f83',
+            MixedEnum.NOT_DUPLICATE_CONST3,
+        ),
+        (MixedEnum, {'coerce_str_uuid': True}, 'E7B4B8AE-2224-47EC-AFCE-40AEB10B85E2', None),
+        (NormalizedEnum, {'strict': False}, 'CONST1', NormalizedEnum.CONST1),
+        (NormalizedEnum, {'strict': False}, 2, NormalizedEnum.CONST2),
+        (NormalizedEnum, {'strict': False}, 'E7B4B8AE222447ECAFCE40AEB10B85E2', NormalizedEnum.CONST3),
+        (NormalizedEnum, {'strict': False}, UUID('e7b4b8ae-2224-47ec-afce-40aeb10b85e2').bytes, NormalizedEnum.CONST3),
+        (NormalizedEnum, {'strict': False}, 'E7B4B8AE2224-47EC-AFCE-40AEB10B85E2', None),
+        (NormalizedEnum, {'strict': False}, ['const1'], None),
+    ]
+)
+def test_validator(enum_cls: Type[ExtendedEnum], configuration: dict, value: Any, expected: Any):
+    """
+    Check validating values with a validator of the configuration.
+    Expected:
+        - The member or ValueError with the original value.
+    """
+
+    validate = enum_cls.validator(**configuration)
+
+    if expected is None:
+        with pytest.raises(ValueError, match=f'is not a valid {enum_cls.__qualname__}'):
+            validate(value)
+    else:
+        assert validate(value) is expected
+
+
+def test_validator_cache():
+    """
+    Check the cache of validators.
+    Expected:
+        - The same function is returned for the same configuration.
+        - A validator that accepts normalized forms cannot be created if several members have the same form.
+    """
+
+    assert MixedEnum.validator() is MixedEnum.validator(strict=True, allow_extended=False, coerce_str_uuid=False)
+    assert MixedEnum.validator(allow_extended=True) is not MixedEnum.validator()
+    with pytest.raises(ValueError, match='duplicate normalized values found'):
+        MixedEnum.validator(strict=False)
@@ -0,0 +1,119 @@
+import pickle
+
+import pytest
+
+from extended_enum import ExtendedEnum, EnumField, ValueWithDescription
+from extended_enum.sets import ExtendedEnumSet
+
+
+class Permission(ExtendedEnum):
+    """An enumeration of permissions."""
+
+    READ = EnumField('read')
+    WRITE = EnumField(ValueWithDescription(value='write', description='Create and change'))
+    ALIAS_READ = EnumField('read')
+    DELETE = EnumField('delete')
+    ADMIN = EnumField(1)
+
+
+class OtherEnum(ExtendedEnum):
+    """An enumeration with the same values."""
+
+    READ = EnumField('read')
+
+
+def test_membership():
+    """
+    Check membership tests and iteration.
+    Expected:
+        - Only the members of the set are contained in it, members of other enumerations are not.
+        - Iteration follows the definition order.
+    """
+
+    members = ExtendedEnumSet(Permission, [Permission.DELETE, Permission.ALIAS_READ])
+    assert Permission.READ in members
+    assert Permission.DELETE in members
+    assert Permission.WRITE not in members
+    assert OtherEnum.READ not in members
+    assert 'read' not in members
+    assert list(members) == [Permission.READ, Permission.DELETE]
+    assert len(members) == 2
+    assert members
+    assert not ExtendedEnumSet(Permission)
+    assert repr(members) == 'ExtendedEnumSet(Permission, {Permission.READ, Permission.DELETE})'
+
+
+def test_set_algebra():
+    """
+    Check the set operations.
+    Expected:
+        - The same results as with frozenset.
+    """
+
+    first = ExtendedEnumSet(Permission, [Permission.READ, Permission.WRITE])
+    second = ExtendedEnumSet.from_values(Permission, ['write', 'delete'])
+    assert first | second == {Permission.READ, Permission.WRITE, Permission.DELETE}
+    assert first & second == {Permission.WRITE}
+    assert first - second == {Permission.READ}
+    assert first ^ second == {Permission.READ, Permission.DELETE}
+    assert first | {Permission.ADMIN} == {Permission.READ, Permission.WRITE, Permission.ADMIN}
+    assert {Permission.ADMIN} | first == {Permission.READ, Permission.WRITE, Permission.ADMIN}
+    assert {Permission.ADMIN, Permission.READ} - first == frozenset({Permission.ADMIN})
+    assert first.union([Permission.DELETE], second) == ExtendedEnumSet.all(Permission) - {Permission.ADMIN}
+    assert first.intersection([Permission.WRITE, OtherEnum.READ]) == {Permission.WRITE}
+    assert first.difference([Permission.WRITE, OtherEnum.READ]) == {Permission.READ}
+    assert ExtendedEnumSet(Permission, [Permission.READ]) <= first
+    assert ExtendedEnumSet(Permission, [Permission.READ]) < first
+    assert first >= {Permission.READ}
+    assert not first <= second
+    assert first != ExtendedEnumSet(OtherEnum, [OtherEnum.READ])
+
+    with pytest.raises(TypeError, match="'read' is not a member of Permission"):
+        ExtendedEnumSet(Permission, ['read'])
+    with pytest.raises(ValueError, match="'execute' is not a valid Permission"):
+        ExtendedEnumSet.from_values(Permission, ['read', 'execute'])
+
+
+def test_set_algebra_with_other_objects():
+    """
+    Check the set operations with sets that contain objects that are not members.
+    Expected:
+        - The union and the symmetric difference are frozensets in both orders of operands, as with frozenset.
+        - The intersection and the difference of the set and other objects are sets of members.
+    """
+
+    first = ExtendedEnumSet(Permission, [Permission.READ, Permission.WRITE])
+    others = {1, OtherEnum.READ, Permission.WRITE}
+    for union in (first | others, others | first):
+        assert type(union) is frozenset
+        assert union == {Permission.READ, Permission.WRITE, 1, OtherEnum.READ}
+    for symmetric_difference in (first ^ others, others ^ first):
+        assert type(symmetric_difference) is frozenset
+        assert symmetric_difference == {Permission.READ, 1, OtherEnum.READ}
+    assert first & others == others & first == ExtendedEnumSet(Permission, [Permission.WRITE])
+    assert first - others == ExtendedEnumSet(Permission, [Permission.READ])
+    assert others - first == {1, OtherEnum.READ}
+    assert type(first | {Permission.DELETE}) is ExtendedEnumSet
+    assert type(frozenset({Permission.DELETE}) ^ first) is ExtendedEnumSet
+
+
+def test_serialization():
+    """
+    Check the compact form of the set.
+    Expected:
+        - The set is restored from a single integer and from pickle.
+        - The set is hashed as a frozenset of the same members, to which it is equal.
+    """
+
+    members = ExtendedEnumSet(Permission, [Permission.WRITE, Permission.ADMIN])
+    assert int(members) == 0b1010
+    assert ExtendedEnumSet.from_int(Permission, int(members)) == members
+    assert pickle.loads(pickle.dumps(members)) == members
+    assert hash(ExtendedEnumSet.from_int(Permission, 0b1010)) == hash(members)
+    assert members == frozenset(members)
+    assert hash(members) == hash(frozenset(members))
+    assert len({members, frozenset(members)}) == 1
+    assert ExtendedEnumSet.all(Permission) == set(Permission)
+
+    with pytest.raises(ValueError, match='16 is not a valid bitmask of Permission'):
+        ExtendedEnumSet.from_int(Permission, 0b10000)
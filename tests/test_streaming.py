@@ -0,0 +1,191 @@
+import io
+from contextlib import AbstractContextManager
+from typing import Any, Callable, List
+from uuid import UUID
+
+import pytest
+
+from extended_enum import ExtendedEnum, ValueWithDescription, EnumField
+from extended_enum.streaming import decode_csv, decode_jsonl
+
+
+class EventType(ExtendedEnum):
+    """An enumeration of event types."""
+
+    CREATED = EnumField('created')
+    DELETED = EnumField(ValueWithDescription(value='deleted', description='The object was deleted'))
+    CODE = EnumField(1)
+    OBJECT = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+
+
+JSONL = (
+    '{"id": 1, "type": "created"}\n'
+    '{"id": 2, "type": "unknown"}\n'
+    '\n'
+    '{"id": 3, "type": 1}\n'
+    '{"id": 4}\n'
+    '{"id": 5, "type": "deleted"}\n'
+)
+
+CSV = (
+    'id,type\n'
+    '1,created\n'
+    '2,unknown\n'
+    '3,deleted\n'
+)
+
+
+@pytest.mark.parametrize(
+    'make_stream',
+    [lambda: io.StringIO(JSONL), lambda: io.BytesIO(JSONL.encode()), JSONL.splitlines],
+)
+@pytest.mark.parametrize('chunk_size', [1, 2, 100])
+def test_decode_jsonl(make_stream: Callable[[], Any], chunk_size: int):
+    """
+    Check decoding of JSON Lines with invalid values skipped.
+    Expected:
+        - Records with valid values in the order of the stream, regardless of the chunk size.
+    """
+
+    records = decode_jsonl(EventType, make_stream(), column='type', errors='skip', chunk_size=chunk_size)
+    assert list(records) == [
+        {'id': 1, 'type': EventType.CREATED},
+        {'id': 3, 'type': EventType.CODE},
+        {'id': 5, 'type': EventType.DELETED},
+    ]
+
+
+def test_decode_jsonl_default():
+    """
+    Check decoding of JSON Lines with invalid values replaced by the default value.
+    Expected:
+        - All records, invalid values are replaced.
+    """
+
+    records = decode_jsonl(EventType, io.StringIO(JSONL), column='type', errors='default', chunk_size=2)
+    assert [record['type'] for record in records] == [EventType.CREATED, None, EventType.CODE, None, EventType.DELETED]
+
+
+@pytest.mark.parametrize(
+    'errors,context',
+    [
+        {
+            'errors': 'raise',
+            'context': pytest.raises(ValueError, match=r"'unknown' is not a valid EventType \(record 1\)"),
+        }.values(),
+        {
+            'errors': 'ignore',
+            'context': pytest.raises(ValueError, match="'ignore' is not a valid error policy"),
+        }.values(),
+    ]
+)
+def test_decode_jsonl_errors(errors: str, context: AbstractContextManager):
+    """
+    Check decoding of JSON Lines with invalid values.
+    Expected:
+        - Exception raised.
+    """
+
+    with context:
+        list(decode_jsonl(EventType, io.StringIO(JSONL), column='type', errors=errors))
+
+
+def test_decode_csv():
+    """
+    Check decoding of CSV rows by the name and by the index of the column.
+    Expected:
+        - Rows with members instead of values.
+    """
+
+    rows = decode_csv(EventType, io.StringIO(CSV), column='type', errors='skip')
+    assert list(rows) == [{'id': '1', 'type': EventType.CREATED}, {'id': '3', 'type': EventType.DELETED}]
+
+    stream = io.BytesIO(CSV.encode())
+    rows = decode_csv(EventType, stream, column=1, errors='default', default=EventType.CREATED, chunk_size=1)
+    assert list(rows) == [
+        ['id', EventType.CREATED],
+        ['1', EventType.CREATED],
+        ['2', EventType.CREATED],
+        ['3', EventType.DELETED],
+    ]
+    assert not stream.closed
+
+
+@pytest.mark.parametrize(
+    'errors,expected',
+    [
+        {
+            'errors': 'skip',
+            'expected': [{'type': EventType.CREATED}],
+        }.values(),
+        {
+            'errors': 'default',
+            'expected': [{'type': EventType.CREATED}, 1, ['created'], {'id': 2, 'type': None}],
+        }.values(),
+    ]
+)
+def test_decode_jsonl_not_objects(errors: str, expected: List[Any]):
+    """
+    Check decoding of JSON Lines that are not objects.
+    Expected:
+        - Such lines are invalid records, they are returned unchanged with the default policy.
+        - With the raise policy ValueError is raised.
+    """
+
+    lines = ['{"type": "created"}', '1', '["created"]', '{"id": 2}']
+    assert list(decode_jsonl(EventType, lines, column='type', errors=errors)) == expected
+
+    with pytest.raises(ValueError, match=r"1 is not a record with the 'type' column \(record 1\)"):
+        list(decode_jsonl(EventType, lines, column='type'))
+
+
+@pytest.mark.parametrize(
+    'errors,expected',
+    [
+        {
+            'errors': 'skip',
+            'expected': [['1', EventType.CREATED]],
+        }.values(),
+        {
+            'errors': 'default',
+            'expected': [['1', EventType.CREATED], ['2', None], ['', None]],
+        }.values(),
+    ]
+)
+def test_decode_csv_short_rows(errors: str, expected: List[Any]):
+    """
+    Check decoding of CSV rows without the column.
+    Expected:
+        - The value of a short row is invalid, the row is padded with None by the default policy.
+        - Empty lines are skipped.
+        - With the raise policy ValueError is raised.
+    """
+
+    lines = ['1,created', '2', '', ',']
+    assert list(decode_csv(EventType, lines, column=1, errors=errors)) == expected
+
+    with pytest.raises(ValueError, match=r"None is not a valid EventType \(record 1\)"):
+        list(decode_csv(EventType, lines, column=1))
+
+
+def test_decode_csv_bytes_lines():
+    """
+    Check decoding of CSV given as an iterable of binary lines.
+    Expected:
+        - Lines are decoded as UTF-8.
+    """
+
+    rows = decode_csv(EventType, CSV.encode().splitlines(keepends=True), column='type', errors='skip')
+    assert list(rows) == [{'id': '1', 'type': EventType.CREATED}, {'id': '3', 'type': EventType.DELETED}]
+
+
+def test_decode_csv_converter():
+    """
+    Check decoding of CSV values that are converted before the lookup.
+    Expected:
+        - Values that cannot be converted are invalid.
+    """
+
+    lines = ['type', '79ff3431-3e98-4bec-9a4c-63ede2580f83', 'created', '79FF3431-3E98-4BEC-9A4C-63EDE2580F83']
+    rows = decode_csv(EventType, lines, column='type', errors='default', converter=UUID)
+    assert [row['type'] for row in rows] == [EventType.OBJECT, None, EventType.OBJECT]
@@ -0,0 +1,109 @@
+import random
+import sys
+import threading
+from typing import Any, Callable, Iterator, List
+
+import pytest
+
+from extended_enum import ExtendedEnum, ValueWithDescription, EnumField
+from extended_enum.lazy import lazy_enum
+
+THREADS = 8
+SIZE = 500
+
+
+@pytest.fixture(autouse=True)
+def frequent_switching() -> Iterator[None]:
+    """Switch threads as often as possible, so that races are likely to happen."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(target: Callable[[int], Any]) -> List[Any]:
+    """Run the target in several threads at the same time and get the results in the order of threads."""
+    barrier = threading.Barrier(THREADS)
+    results: List[Any] = [None] * THREADS
+
+    def run(thread_index: int) -> None:
+        barrier.wait()
+        results[thread_index] = target(thread_index)
+
+    threads = [threading.Thread(target=run, args=(thread_index,)) for thread_index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def make_lazy_enum() -> Any:
+    """Create a lazy enumeration of `SIZE` members."""
+    return lazy_enum(
+        'LazyEnum',
+        [(f'CONST{index}', f'const{index}', f'description {index}') for index in range(SIZE)],
+        value_cls=ValueWithDescription,
+    )
+
+
+def test_lazy_members_are_created_once():
+    """
+    Check creating the members of a lazy enumeration from several threads at the same time.
+    Expected:
+        - Each member is created once: all threads get the same objects.
+        - The tables are complete and in the definition order.
+    """
+
+    enum_cls = make_lazy_enum()
+
+    def lookup(thread_index: int) -> List[Any]:
+        values = [f'const{index}' for index in range(SIZE)]
+        random.Random(thread_index).shuffle(values)
+        members = {value: enum_cls(value) for value in values}
+        members.update({member.value: member for member in enum_cls})
+        return [members[f'const{index}'] for index in range(SIZE)]
+
+    results = run_threads(lookup)
+
+    for members in results:
+        assert all(member is expected for member, expected in zip(members, results[0]))
+    assert [member.ordinal for member in results[0]] == list(range(SIZE))
+    assert list(enum_cls) == results[0]
+    assert enum_cls.get_values() == tuple(f'const{index}' for index in range(SIZE))
+    assert list(enum_cls.get_simple_value_member().values()) == results[0]
+
+
+def test_lazy_lookups_during_creation():
+    """
+    Check looking up the members of a lazy enumeration while other threads create all members.
+    Expected:
+        - Lookups of valid values never fail.
+    """
+
+    enum_cls = make_lazy_enum()
+
+    def lookup(thread_index: int) -> int:
+        if thread_index % 2:
+            return len(list(enum_cls))
+        return sum(enum_cls.get(f'const{index}') is not None for index in range(SIZE))
+
+    assert run_threads(lookup) == [SIZE] * THREADS
+
+
+def test_caches_are_created_once():
+    """
+    Check computing the caches of an enumeration from several threads at the same time.
+    Expected:
+        - All threads get the same objects.
+    """
+
+    enum_cls = ExtendedEnum('ThreadsEnum', [(f'CONST{index}', EnumField(f'const{index}')) for index in range(SIZE)])
+
+    def get_caches(thread_index: int) -> List[Any]:
+        return [enum_cls.get_values(), enum_cls.get_extended_values(), enum_cls.to_categorical([])[0]]
+
+    results = run_threads(get_caches)
+
+    for caches in results:
+        assert all(cache is expected for cache, expected in zip(caches, results[0]))
@@ -0,0 +1,172 @@
+import copy
+import pickle
+import weakref
+from dataclasses import FrozenInstanceError, dataclass, field, replace
+from typing import Any, Optional
+
+import pytest
+
+from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, EnumField, with_slots
+
+
+@with_slots
+@dataclass(frozen=True)
+class SlottedValue(ValueWithDescription):
+    """A user value class with slots."""
+
+    display_name: Optional[str] = field(default=None, compare=False)
+
+
+@dataclass(frozen=True)
+class DictValue(ValueWithDescription):
+    """A user value class without slots."""
+
+    display_name: Optional[str] = field(default=None, compare=False)
+
+
+class ValuesEnum(ExtendedEnum):
+    """An enumeration with values of user classes."""
+
+    CONST1 = EnumField(SlottedValue(value='const1', description='description 1', display_name='Const 1'))
+    CONST2 = EnumField(DictValue(value='const2', description='description 2', display_name='Const 2'))
+
+
+@pytest.mark.parametrize(
+    'extended_value',
+    [
+        BaseExtendedEnumValue(value='const1'),
+        ValueWithDescription(value='const1', description='some description'),
+        SlottedValue(value='const1', display_name='Const 1'),
+    ]
+)
+def test_slotted_values(extended_value: BaseExtendedEnumValue):
+    """
+    Check the values of classes with slots.
+    Expected:
+        - Values do not have `__dict__` and stay frozen.
+    """
+
+    assert not hasattr(extended_value, '__dict__')
+    with pytest.raises((FrozenInstanceError, AttributeError)):
+        extended_value.value = 'other'  # type: ignore[misc]
+    with pytest.raises((FrozenInstanceError, AttributeError)):
+        extended_value.other = 'other'  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    'extended_value',
+    [
+        BaseExtendedEnumValue(value='const1'),
+        ValueWithDescription(value=1, description='some description'),
+        SlottedValue(value='const1', description='some description', display_name='Const 1'),
+        DictValue(value='const1', description='some description', display_name='Const 1'),
+    ]
+)
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_values(extended_value: BaseExtendedEnumValue, protocol: int):
+    """
+    Check pickling and copying of values.
+    Expected:
+        - Restored values are equal to the originals and keep the fields that are not compared.
+    """
+
+    for restored in (
+        pickle.loads(pickle.dumps(extended_value, protocol=protocol)),
+        copy.copy(extended_value),
+        copy.deepcopy(extended_value),
+    ):
+        assert type(restored) is type(extended_value)
+        assert restored == extended_value
+        assert repr(restored) == repr(extended_value)
+
+
+def test_compare_false_fields():
+    """
+    Check equality of values of classes with slots.
+    Expected:
+        - Fields with `compare=False` are not compared, `replace` works.
+    """
+
+    assert ValueWithDescription(value=1, description='a') == ValueWithDescription(value=1, description='b')
+    assert ValueWithDescription(value=1) != ValueWithDescription(value=2)
+    assert hash(SlottedValue(value='a', display_name='A')) == hash(SlottedValue(value='a'))
+    assert replace(SlottedValue(value='a'), display_name='A').display_name == 'A'
+    assert ValuesEnum('const1').extended_value.display_name == 'Const 1'
+    assert pickle.loads(pickle.dumps(ValuesEnum.CONST1)) is ValuesEnum.CONST1
+
+
+@with_slots
+@dataclass(frozen=True)
+class SuperCallValue(ValueWithDescription):
+    """A user value class with slots whose methods call `super()` without arguments."""
+
+    display_name: str = field(default='', compare=False)
+
+    def __str__(self) -> str:
+        """Get the text of the value."""
+        return f'{super().__str__()} ({self.display_name})'
+
+    @property
+    def label(self) -> str:
+        """Get the label of the value."""
+        return f'{self.display_name}: {super().__repr__()}'
+
+    @classmethod
+    def create(cls, value: str) -> 'SuperCallValue':
+        """Create a value with the default description."""
+        assert super().__new__ is object.__new__
+        return cls(value=value, description='created')
+
+
+@pytest.mark.parametrize(
+    'extended_value',
+    [
+        BaseExtendedEnumValue(value='const1'),
+        ValueWithDescription(value='const1'),
+        SlottedValue(value='const1'),
+        DictValue(value='const1'),
+    ]
+)
+def test_weak_references(extended_value: BaseExtendedEnumValue):
+    """
+    Check weak references to values of classes with slots.
+    Expected:
+        - Values can be weakly referenced, `__weakref__` is a slot of the root class only.
+    """
+
+    assert weakref.ref(extended_value)() is extended_value
+    assert '__weakref__' in BaseExtendedEnumValue.__slots__
+    assert '__weakref__' not in ValueWithDescription.__slots__
+    assert '__weakref__' not in SlottedValue.__slots__
+
+
+def test_with_slots_super():
+    """
+    Check methods of a class with slots that call `super()` without arguments.
+    Expected:
+        - Methods, properties and class methods refer to the class with slots.
+    """
+
+    extended_value = SuperCallValue(value='const1', display_name='Const 1')
+    assert str(extended_value) == f'{ValueWithDescription.__str__(extended_value)} (Const 1)'
+    assert extended_value.label == f'Const 1: {ValueWithDescription.__repr__(extended_value)}'
+    assert SuperCallValue.create('const2') == SuperCallValue(value='const2')
+    assert not hasattr(extended_value, '__dict__')
+
+
+@pytest.mark.parametrize(
+    'cls',
+    [
+        type('NotDataclass', (), {}),
+        with_slots(dataclass(frozen=True)(type('Slotted', (BaseExtendedEnumValue,), {}))),
+    ]
+)
+def test_with_slots_errors(cls: Any):
+    """
+    Check adding slots to an unsuitable class.
+    Expected:
+        - TypeError.
+    """
+
+    with pytest.raises(TypeError):
+        with_slots(cls)
@@ -1,10 +1,11 @@
+import io
 from typing import Type, Literal
 from uuid import UUID
 
 import pytest
 
 from extended_enum import ExtendedEnum, BaseExtendedEnumValue, ValueWithDescription, EnumField
-from extended_enum.tools import format_to_markdown
+from extended_enum.tools import format_to_markdown, write_markdown
 
 
 class MixedEnum(ExtendedEnum):
@@ -68,3 +69,36 @@ def test_formatting_to_markdown(enum_cls: Type[ExtendedEnum], params: dict, expe
     """Check the creation of a markdown string using various parameters."""
 
     assert format_to_markdown(enum_cls=enum_cls, **params) == expected
+
+
+@pytest.mark.parametrize(
+    'enum_cls,params',
+    [
+        {'enum_cls': MixedEnum, 'params': {}}.values(),
+        {'enum_cls': MixedEnum, 'params': {'delimiter': ';', 'prefix': '', 'value_wrap': ''}}.values(),
+        {'enum_cls': Literal[MixedEnum.CONST8, MixedEnum.CONST2], 'params': {'prefix': '-'}}.values(),
+    ]
+)
+def test_writing_markdown(enum_cls: Type[ExtendedEnum], params: dict):
+    """Check writing a markdown string to a file-like object using various parameters."""
+
+    output = io.StringIO()
+    write_markdown(enum_cls, output, **params)
+    assert output.getvalue() == format_to_markdown(enum_cls, **params)
+
+
+def test_formatting_to_markdown_cache():
+    """
+    Check the cache of markdown strings.
+    Expected:
+        - The same string object is returned for the same enumeration or members of a Literal and arguments.
+        - Literals with the same members in a different order are formatted in their order.
+    """
+
+    assert format_to_markdown(MixedEnum) is format_to_markdown(MixedEnum)
+    assert format_to_markdown(MixedEnum, delimiter=';') is format_to_markdown(MixedEnum, delimiter=';')
+    assert format_to_markdown(Literal[MixedEnum.CONST1, MixedEnum.CONST2]) is format_to_markdown(
+        Literal[MixedEnum.CONST1, MixedEnum.CONST2],
+    )
+    assert format_to_markdown(Literal[MixedEnum.CONST1, MixedEnum.CONST2]) == '* `const1`\n* `1`'
+    assert format_to_markdown(Literal[MixedEnum.CONST2, MixedEnum.CONST1]) == '* `1`\n* `const1`'
@@ -0,0 +1,122 @@
+import json
+import operator
+from copy import deepcopy
+from typing import Any, Dict, Literal
+from uuid import UUID
+
+import pytest
+
+from extended_enum import ExtendedEnum, ValueWithDescription, EnumField
+from extended_enum.tools import to_json_schema
+
+
+class MixedEnum(ExtendedEnum):
+    """A combined enumeration in which member values are of different types."""
+
+    CONST1 = EnumField('const1')
+    CONST2 = EnumField(ValueWithDescription(value=1, description='some const2 description'))
+    CONST3 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+    NOT_DUPLICATE_CONST3 = EnumField('79ff3431-3e98-4bec-9a4c-63ede2580f83')
+    ALIAS_CONST1 = EnumField('const1')
+
+
+class UUIDEnum(ExtendedEnum):
+    """An enumeration of UUID values."""
+
+    CONST1 = EnumField(UUID('79ff3431-3e98-4bec-9a4c-63ede2580f83'))
+    CONST2 = EnumField(ValueWithDescription(value=UUID('e7b4b8ae-2224-47ec-afce-40aeb10b85e2'), description=''))
+
+
+class EmptyEnum(ExtendedEnum):
+    """An enumeration without members."""
+
+
+@pytest.mark.parametrize(
+    'enum_cls,expected',
+    [
+        {
+            'enum_cls': MixedEnum,
+            'expected': {
+                'title': 'MixedEnum',
+                'type': ('string', 'integer'),
+                'enum': ('const1', 1, '79ff3431-3e98-4bec-9a4c-63ede2580f83'),
+                'anyOf': (
+                    {'const': 'const1', 'title': 'CONST1'},
+                    {'const': 1, 'title': 'CONST2', 'description': 'some const2 description'},
+                    {'const': '79ff3431-3e98-4bec-9a4c-63ede2580f83', 'title': 'CONST3'},
+                    {'const': '79ff3431-3e98-4bec-9a4c-63ede2580f83', 'title': 'NOT_DUPLICATE_CONST3'},
+                ),
+            },
+        }.values(),
+        {
+            'enum_cls': UUIDEnum,
+            'expected': {
+                'title': 'UUIDEnum',
+                'type': 'string',
+                'format': 'uuid',
+                'enum': ('79ff3431-3e98-4bec-9a4c-63ede2580f83', 'e7b4b8ae-2224-47ec-afce-40aeb10b85e2'),
+                'anyOf': (
+                    {'const': '79ff3431-3e98-4bec-9a4c-63ede2580f83', 'title': 'CONST1'},
+                    {'const': 'e7b4b8ae-2224-47ec-afce-40aeb10b85e2', 'title': 'CONST2', 'description': ''},
+                ),
+            },
+        }.values(),
+        {
+            'enum_cls': Literal[MixedEnum.CONST2, MixedEnum.CONST1],
+            'expected': {
+                'type': ('integer', 'string'),
+                'enum': (1, 'const1'),
+                'anyOf': (
+                    {'const': 1, 'title': 'CONST2', 'description': 'some const2 description'},
+                    {'const': 'const1', 'title': 'CONST1'},
+                ),
+            },
+        }.values(),
+        {
+            'enum_cls': EmptyEnum,
+            'expected': {'title': 'EmptyEnum', 'enum': (), 'anyOf': ()},
+        }.values(),
+    ]
+)
+def test_to_json_schema(enum_cls: Any, expected: Dict[str, Any]):
+    """Check the creation of JSON Schema of enumerations and Literals."""
+
+    assert to_json_schema(enum_cls) == expected
+
+
+def test_to_json_schema_cache():
+    """
+    Check the cache of JSON Schemas.
+    Expected:
+        - An equal schema is returned for the same enumeration or members of a Literal.
+        - Repeated calls share the arrays and the member subschemas instead of copying them.
+        - Modifying a returned top-level schema does not change the schemas returned later,
+          its shared parts cannot be modified.
+        - A deep copy of the schema can be modified and serialized.
+        - Literals with the same members in a different order have their own schemas.
+    """
+
+    schema = to_json_schema(MixedEnum)
+    expected = to_json_schema(MixedEnum)
+    assert schema == expected
+    assert schema is not expected
+    assert schema['enum'] is expected['enum']
+    assert schema['anyOf'] is expected['anyOf']
+    assert all(map(operator.is_, schema['anyOf'], expected['anyOf']))
+    schema['$id'] = 'https://example.com/mixed.json'
+    assert '$id' not in to_json_schema(MixedEnum)
+    with pytest.raises(TypeError, match='cannot be changed'):
+        schema['anyOf'][0]['title'] = 'changed'
+    with pytest.raises(TypeError, match='cannot be changed'):
+        schema['anyOf'][0].update(title='changed')
+    assert to_json_schema(MixedEnum) == expected
+
+    copied = deepcopy(schema)
+    copied['anyOf'][0]['title'] = 'changed'
+    assert type(copied['anyOf'][0]) is dict
+    assert json.loads(json.dumps(schema))['anyOf'][0] == {'const': 'const1', 'title': 'CONST1'}
+
+    assert to_json_schema(Literal[MixedEnum.CONST1, MixedEnum.CONST2]) == to_json_schema(
+        Literal[MixedEnum.CONST1, MixedEnum.CONST2],
+    )
+    assert to_json_schema(Literal[MixedEnum.CONST2, MixedEnum.CONST1])['enum'] == (1, 'const1')